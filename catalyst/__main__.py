@@ -824,10 +824,23 @@ def remote_status(ctx, algo_id, data_output, log_output):
     default=False,
     help='Report potential anomalies found in data bundles.'
 )
+@click.option(
+    '--download-workers',
+    type=click.IntRange(min=1),
+    default=1,
+    show_default=True,
+    help='The number of bundle chunks downloaded concurrently.'
+)
+@click.option(
+    '--source',
+    default=None,
+    help='A local folder or url containing the bundle chunks, used in '
+         'place of the catalyst data bucket.'
+)
 @click.pass_context
 def ingest_exchange(ctx, exchange_name, data_frequency, start, end,
                     include_symbols, exclude_symbols, csv, show_progress,
-                    verbose, validate):
+                    verbose, validate, download_workers, source):
     """
     Ingest data for the given exchange.
     """
@@ -842,6 +855,7 @@ def ingest_exchange(ctx, exchange_name, data_frequency, start, end,
                 EXCHANGE_NAMES))
 
     exchange_bundle = ExchangeBundle(exchange_name)
+    exchange_bundle.chunks_source = source
 
     click.echo('Trying to ingest exchange bundle {}...'.format(exchange_name),
                sys.stdout)
@@ -854,7 +868,8 @@ def ingest_exchange(ctx, exchange_name, data_frequency, start, end,
         show_progress=show_progress,
         show_breakdown=verbose,
         show_report=validate,
-        csv=csv
+        csv=csv,
+        download_workers=download_workers
     )
 
 
@@ -347,15 +347,17 @@ cdef class BarData:
                 # assume fields is iterable
                 # return a Series indexed by field
                 if not self._adjust_minutes:
-                    return pd.Series(data={
-                        field: self.data_portal.get_spot_value(
-                                    asset,
-                                    field,
-                                    self._get_current_minute(),
-                                    self.data_frequency
-                               )
-                        for field in fields
-                    }, index=fields, name=assets.symbol)
+                    # all the fields are requested at once
+                    fields = list(fields)
+                    values = self.data_portal.get_spot_values(
+                        [asset],
+                        fields,
+                        self._get_current_minute(),
+                        self.data_frequency
+                    )
+                    return pd.Series(
+                        data=list(values[0]), index=fields, name=assets.symbol
+                    )
                 else:
                     return pd.Series(data={
                         field: self.data_portal.get_adjusted_value(
@@ -374,15 +376,17 @@ cdef class BarData:
                 # assume assets is iterable
                 # return a Series indexed by asset
                 if not self._adjust_minutes:
-                    return pd.Series(data={
-                        asset: self.data_portal.get_spot_value(
-                                    asset,
-                                    field,
-                                    self._get_current_minute(),
-                                    self.data_frequency
-                               )
-                        for asset in assets
-                        }, index=assets, name=fields)
+                    # all the assets are requested at once
+                    assets = list(assets)
+                    values = self.data_portal.get_spot_values(
+                        assets,
+                        [field],
+                        self._get_current_minute(),
+                        self.data_frequency
+                    )
+                    return pd.Series(
+                        data=list(values[:, 0]), index=assets, name=fields
+                    )
                 else:
                     return pd.Series(data={
                         asset: self.data_portal.get_adjusted_value(
@@ -400,17 +404,21 @@ cdef class BarData:
                 data = {}
 
                 if not self._adjust_minutes:
-                    for field in fields:
-                        series = pd.Series(data={
-                            asset: self.data_portal.get_spot_value(
-                                        asset,
-                                        field,
-                                        self._get_current_minute(),
-                                        self.data_frequency
-                                   )
-                            for asset in assets
-                            }, index=assets, name=field)
-                        data[field] = series
+                    # all the assets and fields are requested at once
+                    assets = list(assets)
+                    fields = list(fields)
+                    values = self.data_portal.get_spot_values(
+                        assets,
+                        fields,
+                        self._get_current_minute(),
+                        self.data_frequency
+                    )
+                    for index, field in enumerate(fields):
+                        data[field] = pd.Series(
+                            data=list(values[:, index]),
+                            index=assets,
+                            name=field
+                        )
                 else:
                     for field in fields:
                         series = pd.Series(data={
@@ -658,19 +666,18 @@ cdef class BarData:
                 return df
         else:
             if isinstance(assets, PricingDataAssociable):
-                # one asset, multiple fields. for now, just make multiple
-                # history calls, one per field, then stitch together the
-                # results. this can definitely be optimized!
-
+                # one asset, multiple fields. the portal reads all the
+                # fields at once, then the results are stitched together.
+                frames = self.data_portal.get_history_windows(
+                    [assets],
+                    self._get_current_minute(),
+                    bar_count,
+                    frequency,
+                    fields,
+                    self.data_frequency,
+                )
                 df_dict = {
-                    field: self.data_portal.get_history_window(
-                        [assets],
-                        self._get_current_minute(),
-                        bar_count,
-                        frequency,
-                        field,
-                        self.data_frequency,
-                    )[assets] for field in fields
+                    field: frames[field][assets] for field in fields
                 }
 
                 if self._adjust_minutes:
@@ -691,16 +698,14 @@ cdef class BarData:
                 return pd.DataFrame(df_dict)
 
             else:
-                df_dict = {
-                    field: self.data_portal.get_history_window(
-                        assets,
-                        self._get_current_minute(),
-                        bar_count,
-                        frequency,
-                        field,
-                        self.data_frequency,
-                    ) for field in fields
-                }
+                df_dict = self.data_portal.get_history_windows(
+                    assets,
+                    self._get_current_minute(),
+                    bar_count,
+                    frequency,
+                    fields,
+                    self.data_frequency,
+                )
 
                 if self._adjust_minutes:
                     adjs = {
@@ -12,7 +12,7 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
-from collections import Iterable
+from collections import Iterable, defaultdict
 from copy import copy
 import operator as op
 import warnings
@@ -209,6 +209,10 @@ class TradingAlgorithm(object):
         in the simulation with ``get_environment``. This allows algorithms
         to conditionally execute code based on platform it is running on.
         default: 'catalyst'
+    streaming_risk : bool, optional
+        Whether the cumulative risk metrics are updated from running
+        aggregates instead of being recomputed over the whole history
+        on each update. default: False
     """
 
     def __init__(self, *args, **kwargs):
@@ -312,9 +316,11 @@ class TradingAlgorithm(object):
             self.sim_params.data_frequency,
         )
         self._pipelines = {}
-        # Create an always-expired cache so that we compute the first time data
-        # is requested.
-        self._pipeline_cache = CachedObject(None, pd.Timestamp(0, tz='UTC'))
+        # The results of each pipeline, by name. Pipelines are computed the
+        # first time their data is requested.
+        self._pipeline_cache = {}
+
+        self.streaming_risk = kwargs.pop('streaming_risk', False)
 
         self.blotter = kwargs.pop('blotter', None)
         self.cancel_policy = kwargs.pop('cancel_policy', NeverCancel())
@@ -585,6 +591,7 @@ class TradingAlgorithm(object):
                 sim_params=self.sim_params,
                 trading_calendar=self.trading_calendar,
                 env=self.trading_environment,
+                streaming_risk=self.streaming_risk,
             )
 
             # Set the dt initially to the period start by forcing it to change.
@@ -2385,9 +2392,14 @@ class TradingAlgorithm(object):
         See Also
         --------
         :func:`catalyst.api.pipeline_output`
+
+        Notes
+        -----
+        Several pipelines may be attached under different names. The
+        pipelines whose results expire on the same day and for the same
+        number of days are computed together, so the terms they share are
+        only computed once.
         """
-        if self._pipelines:
-            raise NotImplementedError("Multiple pipelines are not supported.")
         if chunks is None:
             # Make the first chunk smaller to get more immediate results:
             # (one week, then every half year)
@@ -2395,6 +2407,7 @@ class TradingAlgorithm(object):
         elif isinstance(chunks, int):
             chunks = repeat(chunks)
         self._pipelines[name] = pipeline, iter(chunks)
+        self._pipeline_cache.pop(name, None)
 
         # Return the pipeline to allow expressions like
         # p = attach_pipeline(Pipeline(), 'name')
@@ -2427,35 +2440,44 @@ class TradingAlgorithm(object):
         :func:`catalyst.api.attach_pipeline`
         :meth:`catalyst.pipeline.engine.PipelineEngine.run_pipeline`
         """
-        # NOTE: We don't currently support multiple pipelines, but we plan to
-        # in the future.
-        try:
-            p, chunks = self._pipelines[name]
-        except KeyError:
+        if name not in self._pipelines:
             raise NoSuchPipeline(
                 name=name,
                 valid=list(self._pipelines.keys()),
             )
-        return self._pipeline_output(p, chunks)
+        return self._pipeline_output(name)
 
-    def _pipeline_output(self, pipeline, chunks):
+    def _pipeline_output(self, name):
         """
         Internal implementation of `pipeline_output`.
         """
         today = normalize_date(self.get_datetime())
         data = NO_DATA = object()
         try:
-            data = self._pipeline_cache.unwrap(today)
-        except Expired:
+            data = self._pipeline_cache[name].unwrap(today)
+        except (KeyError, Expired):
             # We can't handle the exception in this block because in Python 3
             # sys.exc_info isn't cleared until we leave the block.  See note
             # below for why we need to clear exc_info.
             pass
 
         if data is NO_DATA:
-            # Try to deterministically garbage collect the previous result by
-            # removing any references to it. There are at least three sources
-            # of references:
+            # Every pipeline whose results expired is computed now, along
+            # with the requested one.
+            due = []
+            for due_name in self._pipelines:
+                cached = self._pipeline_cache.get(due_name)
+                try:
+                    if cached is not None:
+                        cached.unwrap(today)
+                        continue
+                except Expired:
+                    pass
+                due.append(due_name)
+
+            # Try to deterministically garbage collect the previous results by
+            # removing any references to them. There are at least three
+            # sources of references:
 
             # 1. self._pipeline_cache holds a reference.
             # 2. The dataframe itself holds a reference via cached .iloc/.loc
@@ -2468,19 +2490,23 @@ class TradingAlgorithm(object):
             # 3. Clear the traceback.  This is no-op in Python 3.
             exc_clear()
 
-            # 2. Clear the .loc/.iloc caches.
-            clear_dataframe_indexer_caches(
-                self._pipeline_cache._unsafe_get_value()
-            )
-
-            # 1. Clear the reference to self._pipeline_cache.
-            self._pipeline_cache = None
+            for due_name in due:
+                # 1. Clear the reference held by self._pipeline_cache.
+                cached = self._pipeline_cache.pop(due_name, None)
+                if cached is not None:
+                    # 2. Clear the .loc/.iloc caches.
+                    clear_dataframe_indexer_caches(
+                        cached._unsafe_get_value()
+                    )
+            cached = None
 
-            # Calculate the next block.
-            data, valid_until = self._run_pipeline(
-                pipeline, today, next(chunks),
-            )
-            self._pipeline_cache = CachedObject(data, valid_until)
+            # Calculate the next block of each pipeline.
+            for due_name, (data, valid_until) in iteritems(
+                    self._run_pipelines(due, today)):
+                self._pipeline_cache[due_name] = CachedObject(
+                    data, valid_until,
+                )
+            data = self._pipeline_cache[name]._unsafe_get_value()
 
         # Now that we have a cached result, try to return the data for today.
         try:
@@ -2490,23 +2516,53 @@ class TradingAlgorithm(object):
             # day.
             return pd.DataFrame(index=[], columns=data.columns)
 
-    def _run_pipeline(self, pipeline, start_session, chunksize):
+    def _run_pipelines(self, names, start_session):
         """
-        Compute `pipeline`, providing values for at least `start_date`.
-
-        Produces a DataFrame containing data for days between `start_date` and
-        `end_date`, where `end_date` is defined by:
+        Compute the next chunk of the pipelines attached as `names`,
+        providing values for at least `start_session`.
 
-            `end_date = min(start_date + chunksize trading days,
-                            simulation_end)`
+        The pipelines sharing the same end of chunk are computed in a single
+        engine pass.
 
         Returns
         -------
-        (data, valid_until) : tuple (pd.DataFrame, pd.Timestamp)
+        results : dict[str -> (pd.DataFrame, pd.Timestamp)]
+            The data of each pipeline along with the last session it is
+            valid for.
 
         See Also
         --------
-        PipelineEngine.run_pipeline
+        PipelineEngine.run_pipelines
+        """
+        by_end_session = defaultdict(dict)
+        for name in names:
+            pipeline, chunks = self._pipelines[name]
+            end_session = self._pipeline_end_session(
+                start_session, next(chunks),
+            )
+            by_end_session[end_session][name] = pipeline
+
+        results = {}
+        for end_session, pipelines in iteritems(by_end_session):
+            if len(pipelines) == 1:
+                (name, pipeline), = iteritems(pipelines)
+                data = {
+                    name: self.engine.run_pipeline(
+                        pipeline, start_session, end_session,
+                    ),
+                }
+            else:
+                data = self.engine.run_pipelines(
+                    pipelines, start_session, end_session,
+                )
+            for name in pipelines:
+                results[name] = data[name], end_session
+        return results
+
+    def _pipeline_end_session(self, start_session, chunksize):
+        """
+        The last session of a pipeline chunk of `chunksize` days starting on
+        `start_session`, bounded by the end of the simulation.
         """
         sessions = self.trading_calendar.all_sessions
 
@@ -2522,11 +2578,7 @@ class TradingAlgorithm(object):
             sessions.get_loc(sim_end_session)
         )
 
-        end_session = sessions[end_loc]
-
-        return \
-            self.engine.run_pipeline(pipeline, start_session, end_session), \
-            end_session
+        return sessions[end_loc]
 
     ##################
     # End Pipeline API
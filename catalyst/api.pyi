@@ -32,6 +32,13 @@ def attach_pipeline(pipeline, name, chunks=None):
     See Also
     --------
     :func:`catalyst.api.pipeline_output`
+
+    Notes
+    -----
+    Several pipelines may be attached under different names. The
+    pipelines whose results expire on the same day and for the same
+    number of days are computed together, so the terms they share are
+    only computed once.
     """
 
 
@@ -860,7 +867,7 @@ def symbols(*args):
     """
 
 
-def get_dataset(ds_name, start=None, end=None):
+def get_dataset(ds_name, start=None, end=None, columns=None):
     """
     Lookup a data source from the marketplace
 
@@ -869,6 +876,8 @@ def get_dataset(ds_name, start=None, end=None):
     ds_name: str
     start: pd.Timestamp
     end: pd.Timestamp
+    columns: list[str], optional
+        The columns to read, all by default.
 
     Returns
     -------
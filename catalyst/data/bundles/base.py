@@ -13,9 +13,10 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from collections import deque
 from itertools import count
+from multiprocessing.pool import ThreadPool
 import tarfile
-from time import sleep
 
 from abc import abstractmethod, abstractproperty
 import logbook
@@ -28,6 +29,7 @@ from catalyst.utils.cli import (
     maybe_show_progress
 )
 from catalyst.utils.memoize import lazyval
+from catalyst.utils.rate_limit import get_token_bucket
 
 from catalyst.constants import LOG_LEVEL
 
@@ -35,11 +37,24 @@ logbook.StderrHandler().push_application()
 log = logbook.Logger(__name__, level=LOG_LEVEL)
 
 DEFAULT_RETRIES = 5
+DEFAULT_FETCH_WORKERS = 4
+
+
+def _utc_index(index):
+    index = pd.DatetimeIndex(index)
+    if index.tz is None:
+        return index.tz_localize('UTC')
+
+    return index.tz_convert('UTC')
 
 
 class BaseBundle(object):
-    def __init__(self, asset_filter=[]):
+    def __init__(self, asset_filter=[], fetch_workers=DEFAULT_FETCH_WORKERS):
         self._asset_filter = asset_filter
+
+        # The number of symbols fetched concurrently, the requests share
+        # the rate limit of the data source.
+        self.fetch_workers = fetch_workers
         self._reset()
 
     def _reset(self):
@@ -90,6 +105,14 @@ class BaseBundle(object):
     def wait_time(self):
         raise NotImplementedError()
 
+    @lazyval
+    def token_bucket(self):
+        # One request per `wait_time` across all the fetching threads
+        return get_token_bucket(
+            'bundle.{}'.format(self.name),
+            rate=1.0 / self.wait_time.total_seconds(),
+        )
+
     @abstractproperty
     def splits(self):
         raise NotImplementedError()
@@ -354,19 +377,14 @@ class BaseBundle(object):
                            data_frequency,
                            retries):
 
-        for asset_id, symbol in symbol_map.iteritems():
-            # Record start time of iteration, compare at end of iteration to
-            # adhere to the datas source's rate limit policy.
-            start_time = pd.Timestamp.utcnow()
+        def fetch(item):
+            asset_id, symbol = item
 
             # Fetch new data if cached data is absent or stale, otherwise
-            # returns the cached data unaltered.  The `should_sleep` flag
-            # indicates that an API call was attempted, and that we should be
-            # ensure aren't exceeding our rate limit before proceeding to the
-            # next symbol. If the raw_data is updated, it is cached before
-            # being returned.
-            raw_data, should_sleep = self._maybe_update_symbol_frame(
-                start_time,
+            # returns the cached data unaltered. If the raw_data is updated,
+            # it is cached before being returned.
+            raw_data = self._maybe_update_symbol_frame(
+                pd.Timestamp.utcnow(),
                 api_key,
                 cache,
                 symbol,
@@ -379,17 +397,30 @@ class BaseBundle(object):
 
             # TODO(cfromknecht) further data validation?
 
-            # Pass asset_id and symbol data to writer.
-            yield asset_id, raw_data
+            return asset_id, raw_data
+
+        workers = max(self.fetch_workers, 1)
+        if workers == 1:
+            for item in symbol_map.iteritems():
+                yield fetch(item)
+            return
 
-            # If an API call was made during this iteration and the time to
-            # reach this point was less than the inter-request `wait_time`,
-            # sleep until after enough time has elapsed to prevent getting rate
-            # limited.
-            if should_sleep:
-                remaining = pd.Timestamp.utcnow() - start_time + self.wait_time
-                if remaining.value > 0:
-                    sleep(remaining.value / 10**9)
+        # The symbols are fetched concurrently, at most two per worker
+        # ahead of the writer, and passed to the writer in order. The
+        # requests are spaced by the shared token bucket.
+        pool = ThreadPool(workers)
+        try:
+            pending = deque()
+            for item in symbol_map.iteritems():
+                pending.append(pool.apply_async(fetch, (item,)))
+                if len(pending) >= 2 * workers:
+                    yield pending.popleft().get()
+
+            while pending:
+                yield pending.popleft().get()
+        finally:
+            pool.terminate()
+            pool.join()
 
     def _maybe_update_symbol_frame(self,
                                    start_time,
@@ -412,38 +443,47 @@ class BaseBundle(object):
         # Select the most recent date in cached dataset if it exists,
         # otherwise use the provided `start_session`.
         last = start_session
-        if raw_data is not None and len(raw_data) > 0:
-            last = raw_data.index[-1].tz_localize('UTC')
-
-        should_sleep = False
+        has_data = raw_data is not None and len(raw_data) > 0
+        if has_data:
+            raw_data.index = _utc_index(raw_data.index)
+            last = raw_data.index[-1]
 
         # Determine time at which cached data will be considered stale.
         cache_expiration = last + pd.Timedelta(days=2)
         if start_time <= cache_expiration and raw_data is not None:
-            # Data is fresh enough to reuse, no need to update. Iterator can
-            # proceed to next symbol directly since no API call was required.
-            return raw_data, should_sleep
+            # Data is fresh enough to reuse, no need to update.
+            return raw_data
 
-        # If we arrive here, we must have attempted an API call.
-        # Setting this flag tells the iterator to pause before starting
-        # the next asset, that we don't exceed the data source's rate
-        # limit.
-        should_sleep = True
+        # Only the bars from the last cached one on are fetched. The last
+        # bar is fetched again since it was probably incomplete. A cache
+        # starting after the requested sessions is fetched again in full.
+        fetch_start = start_session
+        if has_data and raw_data.index[0] <= start_session:
+            fetch_start = max(last, start_session)
 
-        raw_data = self._fetch_symbol_frame(
+        new_data = self._fetch_symbol_frame(
             api_key,
             symbol,
             calendar,
-            start_session,
+            fetch_start,
             end_session,
             data_frequency,
             retries=retries,
         )
 
+        if has_data:
+            new_data = pd.concat([
+                raw_data[raw_data.index >= start_session],
+                new_data,
+            ])
+            new_data = new_data[
+                ~new_data.index.duplicated(keep='last')
+            ].sort_index()
+
         # Cache latest symbol data.
-        cache[key] = raw_data
+        cache[key] = new_data
 
-        return raw_data, should_sleep
+        return new_data
 
     def _fetch_symbol_frame(self,
                             api_key,
@@ -458,6 +498,8 @@ class BaseBundle(object):
         # present in the cache.  Fetch raw data for a single symbol
         # with requested intervals and frequency. Retry as necessary.
         for _ in range(retries):
+            # Wait for our turn within the rate limit of the data source
+            self.token_bucket.acquire()
             try:
                 raw_data = self.fetch_raw_symbol_frame(
                     api_key,
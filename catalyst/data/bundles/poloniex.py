@@ -52,6 +52,10 @@ class PoloniexBundle(BaseCryptoPricingBundle):
     def wait_time(self):
         return pd.Timedelta(milliseconds=170)
 
+    @lazyval
+    def api_url(self):
+        return 'https://poloniex.com/public'
+
     def fetch_raw_metadata_frame(self, api_key, page_number):
         if page_number > 1:
             return pd.DataFrame([])
@@ -166,7 +170,8 @@ class PoloniexBundle(BaseCryptoPricingBundle):
 
     def _format_polo_query(self, query_params):
         # TODO: got against the exchange object
-        return 'https://poloniex.com/public?{query}'.format(
+        return '{url}?{query}'.format(
+            url=self.api_url,
             query=urlencode(query_params),
         )
 
@@ -536,6 +536,40 @@ class DataPortal(object):
         else:
             return list(map(get_single_asset_value, assets))
 
+    def get_spot_values(self, assets, fields, dt, data_frequency):
+        """
+        Public API method that returns the values of several fields of
+        several assets at the given dt.
+
+        Portals able to serve many assets and fields with a single
+        request of their data source override this method.
+
+        Parameters
+        ----------
+        assets : iterable of Asset
+            The assets whose data is desired.
+        fields : iterable of str
+            The desired fields, see ``get_spot_value``.
+        dt : pd.Timestamp
+            The timestamp for the desired values.
+        data_frequency : str
+            The frequency of the data to query; i.e. whether the data is
+            'daily' or 'minute' bars
+
+        Returns
+        -------
+        values : np.ndarray
+            The values with shape (len(assets), len(fields)).
+        """
+        assets = list(assets)
+        values = np.empty((len(assets), len(fields)), dtype=object)
+        for column, field in enumerate(fields):
+            values[:, column] = self.get_spot_value(
+                assets, field, dt, data_frequency
+            )
+
+        return values
+
     def get_adjustments(self, assets, field, dt, perspective_dt):
         """
         Returns a list of adjustments between the dt and perspective_dt for the
@@ -998,6 +1032,44 @@ class DataPortal(object):
                     df.loc[normed_index > asset.end_date, asset] = nan
         return df
 
+    def get_history_windows(self,
+                            assets,
+                            end_dt,
+                            bar_count,
+                            frequency,
+                            fields,
+                            data_frequency,
+                            ffill=True):
+        """
+        Public API method that returns the history windows of several
+        fields.
+
+        Portals able to read many fields with a single request of their
+        data source override this method.
+
+        Parameters
+        ----------
+        fields: iterable of str
+            The desired fields of the assets.
+
+        See ``get_history_window`` for the other parameters.
+
+        Returns
+        -------
+        A dict of the dataframe of each field.
+        """
+        return {
+            field: self.get_history_window(
+                assets,
+                end_dt,
+                bar_count,
+                frequency,
+                field,
+                data_frequency,
+                ffill,
+            ) for field in fields
+        }
+
     def _get_minute_window_data(self, assets, field, minutes_for_window):
         """
         Internal method that gets a window of adjusted minute data for an asset
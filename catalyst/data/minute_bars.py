@@ -664,7 +664,8 @@ class BcolzMinuteBarWriter(object):
         for k, v in kwargs.items():
             table.attrs[k] = v
 
-    def write(self, data, show_progress=False, invalid_data_behavior='warn'):
+    def write(self, data, show_progress=False, invalid_data_behavior='warn',
+              overwrite=False):
         """Write a stream of minute data.
 
         Parameters
@@ -680,9 +681,12 @@ class BcolzMinuteBarWriter(object):
                   volume : float64|int64
               index : DatetimeIndex of market minutes.
             A given sid may appear more than once in ``data``; however,
-            the dates must be strictly increasing.
+            the dates must be strictly increasing unless ``overwrite``.
         show_progress : bool, optional
             Whether or not to show a progress bar while writing.
+        overwrite : bool, optional
+            Whether the data overlapping minutes already written replaces
+            them in place, see `write_cols`.
         """
         ctx = maybe_show_progress(
             data,
@@ -693,9 +697,11 @@ class BcolzMinuteBarWriter(object):
         write_sid = self.write_sid
         with ctx as it:
             for e in it:
-                write_sid(*e, invalid_data_behavior=invalid_data_behavior)
+                write_sid(*e, invalid_data_behavior=invalid_data_behavior,
+                          overwrite=overwrite)
 
-    def write_sid(self, sid, df, invalid_data_behavior='warn'):
+    def write_sid(self, sid, df, invalid_data_behavior='warn',
+                  overwrite=False):
         """
         Write the OHLCV data for the given sid.
         If there is no bcolz ctable yet created for the sid, create it.
@@ -715,6 +721,9 @@ class BcolzMinuteBarWriter(object):
                 close : float64
                 volume : float64|int64
             index : DatetimeIndex of market minutes.
+        overwrite : bool, optional
+            Whether the data overlapping minutes already written replaces
+            them in place, see `write_cols`.
         """
         cols = {
             'open': df.open.values,
@@ -726,9 +735,10 @@ class BcolzMinuteBarWriter(object):
         dts = df.index.values
         # Call internal method, since DataFrame has already ensured matching
         # index and value lengths.
-        self._write_cols(sid, dts, cols, invalid_data_behavior)
+        self._write_cols(sid, dts, cols, invalid_data_behavior, overwrite)
 
-    def write_cols(self, sid, dts, cols, invalid_data_behavior='warn'):
+    def write_cols(self, sid, dts, cols, invalid_data_behavior='warn',
+                   overwrite=False):
         """
         Write the OHLCV data for the given sid.
         If there is no bcolz ctable yet created for the sid, create it.
@@ -749,6 +759,13 @@ class BcolzMinuteBarWriter(object):
             low  : float64
             close : float64
             volume : float64|int64
+        overwrite : bool, optional
+            If False, raise BcolzMinuteOverlappingData when the data does
+            not start after the last minute written for the sid.
+            If True, the minutes from the first to the last of dts are
+            rewritten in place, the ones missing from dts as minutes
+            without trades. Only the bcolz chunks holding these minutes
+            are rewritten, e.g. to backfill a gap or to correct a range.
         """
         if not all(len(dts) == len(cols[name]) for name in self.COL_NAMES):
             raise BcolzMinuteWriterColumnMismatch(
@@ -756,9 +773,10 @@ class BcolzMinuteBarWriter(object):
                     len(dts),
                     " ".join("{0}={1}".format(name, len(cols[name]))
                              for name in self.COL_NAMES)))
-        self._write_cols(sid, dts, cols, invalid_data_behavior)
+        self._write_cols(sid, dts, cols, invalid_data_behavior, overwrite)
 
-    def _write_cols(self, sid, dts, cols, invalid_data_behavior):
+    def _write_cols(self, sid, dts, cols, invalid_data_behavior,
+                    overwrite=False):
         """
         Internal method for `write_cols` and `write`.
 
@@ -776,6 +794,8 @@ class BcolzMinuteBarWriter(object):
             low  : float64
             close : float64
             volume : float64|int64
+        overwrite : bool
+            Whether the minutes already written can be rewritten.
         """
         table = self._ensure_ctable(sid)
 
@@ -801,6 +821,13 @@ class BcolzMinuteBarWriter(object):
         # ctable, guard against overwriting that data.
         if num_rec_mins > 0:
             last_recorded_minute = all_minutes[num_rec_mins - 1]
+            first_minute_to_write = pd.Timestamp(dts[0], tz='UTC')
+            if overwrite and first_minute_to_write <= last_recorded_minute:
+                self._overwrite_cols(
+                    table, sid, dts, cols, invalid_data_behavior
+                )
+                return
+
             if last_minute_to_write <= last_recorded_minute:
                 raise BcolzMinuteOverlappingData(dedent("""
                 Data with last_date={0} already includes input start={1} for
@@ -842,6 +869,54 @@ class BcolzMinuteBarWriter(object):
         ])
         table.flush()
 
+    def _overwrite_cols(self, table, sid, dts, cols, invalid_data_behavior):
+        """
+        Rewrite the minutes from the first to the last of dts in place.
+
+        The minutes up to the end of the ctable are assigned through their
+        slice, so that bcolz only decompresses and rewrites the chunks
+        holding them. The minutes past the end of the ctable are appended.
+
+        Parameters
+        ----------
+        table : bcolz.ctable
+            The ctable of the sid, opened for writing.
+        sid : int
+            The asset identifier for the data being written.
+        dts : datetime64 array
+            The dts corresponding to values in cols.
+        cols : dict of str -> np.array
+            dict of market data keyed by ('open', 'high', 'low', 'close',
+            'volume').
+        """
+        all_minutes = self._minute_index
+        start_ix = all_minutes.get_loc(pd.Timestamp(dts[0], tz='UTC'))
+        end_ix = all_minutes.get_loc(pd.Timestamp(dts[-1], tz='UTC')) + 1
+
+        minutes_in_window = all_minutes[start_ix:end_ix]
+        dt_ixs = np.searchsorted(minutes_in_window.values,
+                                 dts.astype('datetime64[ns]'))
+
+        ohlc_ratio = self.ohlc_ratio_for_sid(sid)
+        values = convert_cols(cols, ohlc_ratio, sid, invalid_data_behavior)
+
+        new_cols = []
+        for col_values in values:
+            col = np.zeros(len(minutes_in_window), dtype=np.uint64)
+            col[dt_ixs] = col_values
+            new_cols.append(col)
+
+        # The number of minutes which already exist in the ctable
+        num_existing = min(end_ix, table.size) - start_ix
+        for name, col in zip(self.COL_NAMES, new_cols):
+            table.cols[name][start_ix:start_ix + num_existing] = \
+                col[:num_existing]
+
+        if num_existing < len(minutes_in_window):
+            table.append([col[num_existing:] for col in new_cols])
+
+        table.flush()
+
     def data_len_for_day(self, day):
         """
         Return the number of data points up to and including the
@@ -1062,6 +1137,26 @@ class BcolzMinuteBarReader(MinuteBarReader):
 
         return carray
 
+    def invalidate_sids(self, sids):
+        """
+        Drop the cached state of the given sids, so that the data written
+        to them since it was cached is read.
+
+        Parameters
+        ----------
+        sids : iterable[int]
+            The asset identifiers whose data was written.
+        """
+        for sid in sids:
+            sid = int(sid)
+            for carrays in self._carrays.values():
+                if sid in carrays:
+                    del carrays[sid]
+
+            # A backfill may add trades before the minute known without
+            # any.
+            self._known_zero_volume_dict.pop(sid, None)
+
     def table_len(self, sid):
         """Returns the length of the underlying table for this sid."""
         return len(self._open_minute_file('close', sid))
@@ -3,8 +3,10 @@ import json
 import os
 import re
 from collections import defaultdict
+from multiprocessing.pool import ThreadPool
 
 import ccxt
+import numpy as np
 import pandas as pd
 import six
 from ccxt import InvalidOrder, NetworkError, \
@@ -30,6 +32,7 @@ from catalyst.exchange.utils.datetime_utils import from_ms_timestamp, \
     get_periods_range
 from catalyst.finance.order import Order, ORDER_STATUS
 from catalyst.finance.transaction import Transaction
+from catalyst.utils.rate_limit import get_token_bucket
 from redo import retry
 
 log = Logger('CCXT', level=LOG_LEVEL)
@@ -78,6 +81,15 @@ class CCXT(Exchange):
 
         self.name = exchange_name
 
+        # The number of assets whose candles are fetched concurrently,
+        # the requests share the rate limit of the exchange.
+        self.candles_workers = 4
+        self.token_bucket = get_token_bucket(
+            'ccxt.{}'.format(exchange_name),
+            rate=1000.0 / (self.api.rateLimit or 1000),
+            capacity=self.candles_workers,
+        )
+
         self.quote_currency = quote_currency
         self.transactions = defaultdict(list)
 
@@ -95,6 +107,8 @@ class CCXT(Exchange):
 
         self.bundle = ExchangeBundle(self.name)
         self.markets = None
+        self._markets_by_symbol = None
+        self._symbol_maps_lower = [None, None]
         self._is_init = False
 
     def init(self):
@@ -135,7 +149,9 @@ class CCXT(Exchange):
                 )
                 raise ExchangeRequestError(error=e)
 
+        self._markets_by_symbol = None
         self.load_assets()
+        self.index_assets()
         self._is_init = True
 
     @staticmethod
@@ -233,12 +249,12 @@ class CCXT(Exchange):
         dict[str, Object]
 
         """
-        s = self.get_symbol(symbol)
-        market = next(
-            (market for market in self.markets if market['symbol'] == s),
-            None,
-        )
-        return market
+        if self._markets_by_symbol is None:
+            self._markets_by_symbol = dict()
+            for market in self.markets:
+                self._markets_by_symbol.setdefault(market['symbol'], market)
+
+        return self._markets_by_symbol.get(self.get_symbol(symbol))
 
     def substitute_currency_code(self, currency, source='catalyst'):
         if source == 'catalyst':
@@ -420,10 +436,50 @@ class CCXT(Exchange):
             timeframe, source='ccxt', raise_error=raise_error
         )
 
-    def get_candles(self, freq, assets, bar_count=1, start_dt=None,
-                    end_dt=None):
-        is_single = (isinstance(assets, TradingPair))
-        if is_single:
+    def _fetch_ohlcv(self, asset, symbol, timeframe, since, bar_count):
+        self.token_bucket.acquire()
+        try:
+            ohlcvs = self.api.fetch_ohlcv(
+                symbol=symbol,
+                timeframe=timeframe,
+                since=since,
+                limit=bar_count,
+                params={}
+            )
+        except (ExchangeError, NetworkError) as e:
+            log.warn(
+                'unable to fetch {} ohlcv: {}'.format(
+                    asset, e
+                )
+            )
+            raise ExchangeRequestError(error=e)
+
+        values = np.array(ohlcvs, dtype=np.float64).reshape(-1, 6)
+        return values[np.argsort(values[:, 0], kind='mergesort')]
+
+    def get_candles_frames(self, freq, assets, bar_count=1, start_dt=None,
+                           end_dt=None):
+        """
+        Retrieve OHLCV candles for the given assets as DataFrames.
+
+        The candles of up to `candles_workers` assets are fetched
+        concurrently within the rate limit of the exchange.
+
+        Parameters
+        ----------
+        freq: str
+        assets: list[TradingPair]
+        bar_count: int
+        start_dt: datetime, optional
+        end_dt: datetime, optional
+
+        Returns
+        -------
+        dict[TradingPair, DataFrame]
+            The candles of each asset indexed by their last_traded date.
+
+        """
+        if isinstance(assets, TradingPair):
             assets = [assets]
 
         symbols = self.get_symbols(assets)
@@ -456,40 +512,61 @@ class CCXT(Exchange):
         delta = start_dt - get_epoch()
         since = int(delta.total_seconds()) * 1000
 
-        candles = dict()
-        for index, asset in enumerate(assets):
+        def fetch(index):
+            return self._fetch_ohlcv(
+                assets[index], symbols[index], timeframe, since, bar_count
+            )
+
+        workers = min(self.candles_workers, len(assets))
+        if workers > 1:
+            pool = ThreadPool(workers)
             try:
-                ohlcvs = self.api.fetch_ohlcv(
-                    symbol=symbols[index],
-                    timeframe=timeframe,
-                    since=since,
-                    limit=bar_count,
-                    params={}
-                )
-            except (ExchangeError, NetworkError) as e:
-                log.warn(
-                    'unable to fetch {} ohlcv: {}'.format(
-                        asset, e
-                    )
-                )
-                raise ExchangeRequestError(error=e)
+                arrays = pool.map(fetch, range(len(assets)))
+            finally:
+                pool.close()
+                pool.join()
+        else:
+            arrays = [fetch(index) for index in range(len(assets))]
 
-            candles[asset] = []
-            for ohlcv in ohlcvs:
-                candles[asset].append(dict(
-                    last_traded=pd.to_datetime(
-                        ohlcv[0], unit='ms', utc=True
-                    ),
-                    open=ohlcv[1],
-                    high=ohlcv[2],
-                    low=ohlcv[3],
-                    close=ohlcv[4],
-                    volume=ohlcv[5]
-                ))
-            candles[asset] = sorted(
-                candles[asset], key=lambda c: c['last_traded']
+        candles = dict()
+        for asset, values in zip(assets, arrays):
+            index = pd.to_datetime(
+                values[:, 0].astype(np.int64), unit='ms', utc=True
+            )
+            index.name = 'last_traded'
+            # Same column order as the DataFrame of candle dicts
+            candles[asset] = pd.DataFrame(
+                values[:, [4, 2, 3, 1, 5]],
+                index=index,
+                columns=['close', 'high', 'low', 'open', 'volume'],
             )
 
+        return candles
+
+    def get_candles(self, freq, assets, bar_count=1, start_dt=None,
+                    end_dt=None):
+        is_single = (isinstance(assets, TradingPair))
+        if is_single:
+            assets = [assets]
+
+        frames = self.get_candles_frames(
+            freq, assets, bar_count, start_dt, end_dt
+        )
+
+        candles = dict()
+        for asset in assets:
+            df = frames[asset]
+            candles[asset] = [
+                dict(
+                    last_traded=dt,
+                    open=values[3],
+                    high=values[1],
+                    low=values[2],
+                    close=values[0],
+                    volume=values[4],
+                ) for dt, values in zip(df.index, df.values.tolist())
+            ]
+
         if is_single:
             return six.next(six.itervalues(candles))
 
@@ -544,22 +621,16 @@ class CCXT(Exchange):
             The asset definition.
 
         """
-        exchange_symbol = market['id']
-
-        symbol_map = self._fetch_symbol_map(is_local)
-        if symbol_map is not None:
-            assets_lower = {k.lower(): v for k, v in symbol_map.items()}
-            key = exchange_symbol.lower()
+        index = 1 if is_local else 0
+        assets_lower = self._symbol_maps_lower[index]
+        if assets_lower is None:
+            symbol_map = self._fetch_symbol_map(is_local)
+            assets_lower = {
+                k.lower(): v for k, v in symbol_map.items()
+            } if symbol_map is not None else dict()
+            self._symbol_maps_lower[index] = assets_lower
 
-            asset = assets_lower[key] if key in assets_lower else None
-            if asset is not None:
-                return asset
-
-            else:
-                return None
-
-        else:
-            return None
+        return assets_lower.get(market['id'].lower())
 
     def create_trading_pair(self, market, asset_def=None, is_local=False):
         """
@@ -616,6 +687,7 @@ class CCXT(Exchange):
     def load_assets(self):
         log.debug('loading assets for {}'.format(self.name))
         self.assets = []
+        self._asset_index = None
 
         for market in self.markets:
             if 'id' not in market:
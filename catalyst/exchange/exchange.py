@@ -19,7 +19,7 @@ from catalyst.exchange.utils.datetime_utils import get_delta, \
     get_periods, get_start_dt, get_frequency, \
     get_candles_number_from_minutes
 from catalyst.exchange.utils.exchange_utils import get_exchange_symbols, \
-    resample_history_df, has_bundle, get_candles_df
+    resample_history_df, has_bundle, get_candles_df, transform_candles_to_df
 from logbook import Logger
 
 log = Logger('Exchange', level=LOG_LEVEL)
@@ -33,6 +33,7 @@ class Exchange:
     def __init__(self):
         self.name = None
         self.assets = []
+        self._asset_index = None
         self._symbol_maps = [None, None]
         self.minute_writer = None
         self.minute_reader = None
@@ -45,6 +46,10 @@ class Exchange:
 
         self.low_balance_threshold = None
 
+        # The MarketDataCache serving the spot values and history
+        # windows, the exchange is queried directly when None.
+        self.market_data = None
+
     @abstractproperty
     def account(self):
         pass
@@ -125,17 +130,11 @@ class Exchange:
         str
 
         """
-        symbol = None
-
-        for a in self.assets:
-            if not symbol and a.symbol == asset.symbol:
-                symbol = a.symbol
-
-        if not symbol:
+        if asset.symbol not in self.get_asset_index()['catalyst']:
             raise ValueError('Currency %s not supported by exchange %s' %
                              (asset['symbol'], self.name.title()))
 
-        return symbol
+        return asset.symbol
 
     def get_symbols(self, assets):
         """
@@ -156,6 +155,41 @@ class Exchange:
 
         return symbols
 
+    def index_assets(self):
+        """
+        Index the assets by Catalyst symbol, exchange symbol and symbol
+        in the convention of `get_symbol`. Each key maps to the list of
+        assets sharing it, e.g. the local and Catalyst definitions of a
+        market.
+
+        Returns
+        -------
+        dict[str, dict[str, list[TradingPair]]]
+
+        """
+        index = dict(catalyst=dict(), exchange=dict(), lookup=dict())
+        for asset in self.assets:
+            index['catalyst'].setdefault(asset.symbol, []).append(asset)
+
+        # get_symbol may use the Catalyst symbols of the index
+        self._asset_index = index
+
+        for asset in self.assets:
+            index['exchange'].setdefault(
+                asset.exchange_symbol.lower(), []
+            ).append(asset)
+            index['lookup'].setdefault(
+                self.get_symbol(asset).lower(), []
+            ).append(asset)
+
+        return index
+
+    def get_asset_index(self):
+        if self._asset_index is None:
+            return self.index_assets()
+
+        return self._asset_index
+
     def get_assets(self, symbols=None, data_frequency=None,
                    is_exchange_symbol=False,
                    is_local=None, quote_currency=None):
@@ -243,11 +277,13 @@ class Exchange:
                 self.name, symbol
             )
         )
-        # TODO: simplify and loose the loop
-        for a in self.assets:
-            if asset is not None:
-                break
+        # The symbol provided may use the Catalyst or the exchange
+        # convention
+        index = self.get_asset_index()
+        candidates = index['exchange' if is_exchange_symbol else 'lookup'] \
+            .get(symbol.lower(), [])
 
+        for a in candidates:
             if is_local is not None:
                 data_source = 'local' if is_local else 'catalyst'
                 applies = (a.data_source == data_source)
@@ -260,20 +296,18 @@ class Exchange:
             else:
                 applies = True
 
-            # The symbol provided may use the Catalyst or the exchange
-            # convention
-            key = a.exchange_symbol if \
-                is_exchange_symbol else self.get_symbol(a)
-            if not asset and key.lower() == symbol.lower():
-                if applies:
-                    asset = a
+            if applies:
+                asset = a
+                break
 
-                else:
-                    raise NoDataAvailableOnExchange(
-                        symbol=key,
-                        exchange=self.name,
-                        data_frequency=data_frequency,
-                    )
+        if asset is None and candidates:
+            a = candidates[0]
+            raise NoDataAvailableOnExchange(
+                symbol=a.exchange_symbol if
+                is_exchange_symbol else self.get_symbol(a),
+                exchange=self.name,
+                data_frequency=data_frequency,
+            )
 
         if asset is None:
             supported_symbols = sorted([a.symbol for a in self.assets])
@@ -362,7 +396,11 @@ class Exchange:
         if field not in BASE_FIELDS:
             raise KeyError('Invalid column: {}'.format(field))
 
-        tickers = self.tickers(assets)
+        if self.market_data is not None:
+            tickers = self.market_data.tickers(assets)
+        else:
+            tickers = self.tickers(assets)
+
         if field == 'close' or field == 'price':
             return [tickers[asset]['last'] for asset in tickers]
 
@@ -372,6 +410,49 @@ class Exchange:
         else:
             raise NoValueForField(field=field)
 
+    def get_spot_values(self, assets, fields, dt=None,
+                        data_frequency='minute'):
+        """
+        The spot values of several assets and fields from a single
+        request of tickers.
+
+        Parameters
+        ----------
+        assets: list[TradingPair]
+        fields: list[str]
+        dt: pd.Timestamp
+        data_frequency: str
+
+        Returns
+        -------
+        ndarray
+            The values with shape (len(assets), len(fields)), NaN for
+            the assets without ticker.
+
+        """
+        for field in fields:
+            if field not in BASE_FIELDS:
+                raise KeyError('Invalid column: {}'.format(field))
+
+            if field not in ('close', 'price', 'volume'):
+                raise NoValueForField(field=field)
+
+        if self.market_data is not None:
+            tickers = self.market_data.tickers(assets)
+        else:
+            tickers = self.tickers(assets)
+
+        values = np.full((len(assets), len(fields)), np.nan)
+        for row, asset in enumerate(assets):
+            if asset not in tickers:
+                continue
+
+            for column, field in enumerate(fields):
+                key = 'volume' if field == 'volume' else 'last'
+                values[row, column] = tickers[asset][key]
+
+        return values
+
     def get_single_spot_value(self, asset, field, data_frequency):
         """
         Similar to 'get_spot_value' but for a single asset
@@ -497,6 +578,35 @@ class Exchange:
         DataFrame
             A dataframe containing the requested data.
 
+        """
+        return self.get_history_windows(
+            assets,
+            end_dt,
+            bar_count,
+            frequency,
+            [field],
+            data_frequency,
+            is_current,
+        )[field]
+
+    def get_history_windows(self,
+                            assets,
+                            end_dt,
+                            bar_count,
+                            frequency,
+                            fields,
+                            data_frequency=None,
+                            is_current=False):
+        """
+        The history windows of several fields built from a single
+        request of candles.
+
+        See `get_history_window` for the parameters.
+
+        Returns
+        -------
+        dict[str, DataFrame]
+
         """
         freq, candle_size, unit, data_frequency = get_frequency(
             frequency, data_frequency, supported_freqs=['T', 'D', 'H']
@@ -517,7 +627,8 @@ class Exchange:
             requested_bar_count = min_candles_number
 
         # The get_history method supports multiple asset
-        candles = self.get_candles(
+        source = self.market_data if self.market_data is not None else self
+        candles = source.get_candles_frames(
             freq=freq,
             assets=assets,
             bar_count=requested_bar_count,
@@ -526,7 +637,7 @@ class Exchange:
 
         # candles sanity check - verify no empty candles were received:
         for asset in candles:
-            if not candles[asset]:
+            if len(candles[asset]) == 0:
                 raise NoCandlesReceivedFromExchange(
                     bar_count=requested_bar_count,
                     end_dt=end_dt,
@@ -536,29 +647,34 @@ class Exchange:
         # for avoiding unnecessary forward fill end_dt is taken back one second
         forward_fill_till_dt = end_dt - timedelta(seconds=1)
 
-        series = get_candles_df(candles=candles,
-                                field=field,
-                                freq=frequency,
-                                bar_count=requested_bar_count,
-                                end_dt=forward_fill_till_dt)
-
-        # TODO: consider how to approach this edge case
-        # delta_candle_size = candle_size * 60 if unit == 'H' else candle_size
-        # Checking to make sure that the dates match
-        # delta = get_delta(delta_candle_size, data_frequency)
-        # adj_end_dt = end_dt - delta
-        # last_traded = asset_series.index[-1]
-        # if last_traded < adj_end_dt:
-        #    raise LastCandleTooEarlyError(
-        #        last_traded=last_traded,
-        #        end_dt=adj_end_dt,
-        #        exchange=self.name,
-        #    )
-
-        df = pd.DataFrame(series)
-        df.dropna(inplace=True)
-
-        return df.tail(bar_count)
+        frames = dict()
+        for field in fields:
+            series = get_candles_df(candles=candles,
+                                    field=field,
+                                    freq=frequency,
+                                    bar_count=requested_bar_count,
+                                    end_dt=forward_fill_till_dt)
+
+            # TODO: consider how to approach this edge case
+            # delta_candle_size = candle_size * 60 if unit == 'H' \
+            #     else candle_size
+            # Checking to make sure that the dates match
+            # delta = get_delta(delta_candle_size, data_frequency)
+            # adj_end_dt = end_dt - delta
+            # last_traded = asset_series.index[-1]
+            # if last_traded < adj_end_dt:
+            #    raise LastCandleTooEarlyError(
+            #        last_traded=last_traded,
+            #        end_dt=adj_end_dt,
+            #        exchange=self.name,
+            #    )
+
+            df = pd.DataFrame(series)
+            df.dropna(inplace=True)
+
+            frames[field] = df.tail(bar_count)
+
+        return frames
 
     def get_history_window_with_bundle(self,
                                        assets,
@@ -1011,6 +1127,36 @@ class Exchange:
         """
         pass
 
+    def get_candles_frames(self, freq, assets, bar_count=1, start_dt=None,
+                           end_dt=None):
+        """
+        Retrieve OHLCV candles for the given assets as DataFrames.
+
+        Parameters
+        ----------
+        freq: str
+        assets: list[TradingPair]
+        bar_count: int
+        start_dt: datetime, optional
+        end_dt: datetime, optional
+
+        Returns
+        -------
+        dict[TradingPair, DataFrame]
+            The candles of each asset indexed by their last_traded date.
+
+        """
+        if not isinstance(assets, list):
+            assets = [assets]
+
+        candles = self.get_candles(
+            freq, assets, bar_count, start_dt=start_dt, end_dt=end_dt
+        )
+        return {
+            asset: transform_candles_to_df(candles[asset])
+            for asset in candles
+        }
+
     @abc.abstractmethod
     def tickers(self, assets, on_ticker_error='raise'):
         """
@@ -11,12 +11,10 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 import copy
-import pickle
 import signal
 import sys
 from datetime import timedelta
-from os import listdir
-from os.path import isfile, join, exists
+from os.path import join
 
 import catalyst.protocol as zp
 import logbook
@@ -30,15 +28,19 @@ from catalyst.exchange.exchange_errors import (
 from catalyst.exchange.exchange_execution import ExchangeLimitOrder
 from catalyst.exchange.live_graph_clock import LiveGraphClock
 from catalyst.exchange.simple_clock import SimpleClock
+from catalyst.exchange.utils.checkpoint import (
+    AlgoCheckpoint,
+    perf_period_entries,
+    position_tracker_entries,
+    restore_perf_period,
+    restore_position_tracker, )
 from catalyst.exchange.utils.exchange_utils import (
-    save_algo_object,
     get_algo_object,
     get_algo_folder,
-    get_algo_df,
-    save_algo_df,
+    get_algo_stats_store,
     clear_frame_stats_directory,
-    remove_old_files,
     group_assets_by_exchange, )
+from catalyst.exchange.utils.stats_recorder import FrameStatsRecorder
 from catalyst.exchange.utils.stats_utils import \
     get_pretty_stats, stats_to_s3, stats_to_algo_folder
 from catalyst.finance.execution import MarketOrder
@@ -211,12 +213,13 @@ class ExchangeTradingAlgorithmBase(TradingAlgorithm):
         return round_nearest(amount, asset.min_trade_size)
 
     @api_method
-    def get_dataset(self, data_source_name, start=None, end=None):
+    def get_dataset(self, data_source_name, start=None, end=None,
+                    columns=None):
         if self._marketplace is None:
             self._marketplace = Marketplace()
 
         return self._marketplace.get_dataset(
-            data_source_name, start, end,
+            data_source_name, start, end, columns,
         )
 
     @api_method
@@ -365,7 +368,15 @@ class ExchangeTradingAlgorithmBacktest(ExchangeTradingAlgorithmBase):
     def __init__(self, *args, **kwargs):
         super(ExchangeTradingAlgorithmBacktest, self).__init__(*args, **kwargs)
 
-        self.frame_stats = list()
+        # The stats of each minute, allocated for the whole simulation
+        capacity = 1
+        if self.data_frequency == 'minute':
+            capacity = self.trading_calendar.\
+                minutes_count_for_sessions_in_range(
+                    self.sim_params.start_session,
+                    self.sim_params.end_session,
+                )
+        self.frame_stats = FrameStatsRecorder(capacity)
         self.state = {}
         log.info('initialized trading algorithm in backtest mode')
 
@@ -384,12 +395,12 @@ class ExchangeTradingAlgorithmBacktest(ExchangeTradingAlgorithmBase):
             frame_stats = self.prepare_period_stats(
                 data.current_dt, data.current_dt + timedelta(minutes=1)
             )
-            self.frame_stats.append(frame_stats)
+            self.frame_stats.record(frame_stats)
 
         self.current_day = data.current_dt.floor('1D')
 
     def _create_stats_df(self):
-        stats = pd.DataFrame(self.frame_stats)
+        stats = self.frame_stats.to_frame()
         stats.set_index('period_close', inplace=True, drop=False)
         return stats
 
@@ -419,6 +430,9 @@ class ExchangeTradingAlgorithmLive(ExchangeTradingAlgorithmBase):
         self.is_start = kwargs.pop('is_start', True)
         self.end = kwargs.pop('end', None)
         self.is_end = kwargs.pop('is_end', True)
+        self.checkpoint_interval = kwargs.pop('checkpoint_interval', 1)
+        # The time between two bars of the live clock
+        self.bar_interval = pd.Timedelta(kwargs.pop('bar_interval', '1T'))
 
         self._clock = None
         self.frame_stats = list()
@@ -431,21 +445,41 @@ class ExchangeTradingAlgorithmLive(ExchangeTradingAlgorithmBase):
         # in order to save paper & live files separately
         self.mode_name = 'paper' if kwargs['simulate_orders'] else 'live'
 
-        self.pnl_stats = get_algo_df(
+        # The stats are appended to stores instead of rewriting
+        # the whole history every bar, use `read()` to load them.
+        self.pnl_stats = get_algo_stats_store(
             self.algo_namespace,
             'pnl_stats_{}'.format(self.mode_name),
         )
 
-        self.custom_signals_stats = get_algo_df(
+        self.custom_signals_stats = get_algo_stats_store(
             self.algo_namespace,
             'custom_signals_stats_{}'.format(self.mode_name)
         )
 
-        self.exposure_stats = get_algo_df(
+        self.exposure_stats = get_algo_stats_store(
             self.algo_namespace,
             'exposure_stats_{}'.format(self.mode_name)
         )
 
+        self.frame_stats_store = get_algo_stats_store(
+            self.algo_namespace,
+            self.mode_name,
+            rel_path='frame_stats',
+        )
+
+        # Only the state which changed since the previous checkpoint
+        # is written, every `checkpoint_interval` bars.
+        self.checkpoint = AlgoCheckpoint(
+            join(
+                get_algo_folder(self.algo_namespace),
+                'checkpoint_{}'.format(self.mode_name)
+            )
+        )
+        self._bars_since_checkpoint = 0
+        self._last_checkpoint_dt = None
+        self._closed_order_keys = set()
+
         self.is_running = True
 
         self.stats_minutes = 1
@@ -467,31 +501,12 @@ class ExchangeTradingAlgorithmLive(ExchangeTradingAlgorithmBase):
         preparing the stats before analyze
         :return: stats: pd.Dataframe
         """
-        # add the last day stats which is not saved in the directory
-        current_stats = pd.DataFrame(self.frame_stats)
-        current_stats.set_index('period_close', drop=False, inplace=True)
+        # the store is indexed by period_close and includes the
+        # stats of the current day
+        stats = self.frame_stats_store.read()
+        stats.index.name = 'period_close'
 
-        # get the location of the directory
-        algo_folder = get_algo_folder(self.algo_namespace)
-        folder = join(algo_folder, 'frame_stats')
-
-        if exists(folder):
-            files = [f for f in listdir(folder) if isfile(join(folder, f))]
-
-            period_stats_list = []
-            for item in files:
-                filename = join(folder, item)
-
-                with open(filename, 'rb') as handle:
-                    perf_period = pickle.load(handle)
-                    period_stats_list.extend(perf_period)
-
-            stats = pd.DataFrame(period_stats_list)
-            stats.set_index('period_close', drop=False, inplace=True)
-
-            return pd.concat([stats, current_stats])
-        else:
-            return current_stats
+        return stats
 
     def interrupt_algorithm(self):
         """
@@ -509,6 +524,9 @@ class ExchangeTradingAlgorithmLive(ExchangeTradingAlgorithmBase):
         """
         self.is_running = False
 
+        if self._bars_since_checkpoint > 0:
+            self._save_checkpoint(self.datetime)
+
         if self._analyze is None:
             log.info('Exiting the algorithm.')
 
@@ -569,13 +587,15 @@ class ExchangeTradingAlgorithmLive(ExchangeTradingAlgorithmBase):
                 context=self,
                 callback=self._analyze_live,
                 start=self.start if self.is_start else None,
-                end=self.end if self.is_end else None
+                end=self.end if self.is_end else None,
+                bar_interval=self.bar_interval,
             )
         else:
             self._clock = SimpleClock(
                 self.sim_params.sessions,
                 start=self.start if self.is_start else None,
-                end=self.end if self.is_end else None
+                end=self.end if self.is_end else None,
+                bar_interval=self.bar_interval,
             )
 
         return self._clock
@@ -587,10 +607,18 @@ class ExchangeTradingAlgorithmLive(ExchangeTradingAlgorithmBase):
         This allows us to stop/start algos without loosing their state.
 
         """
-        self.state = get_algo_object(
-            algo_name=self.algo_namespace,
-            key='context.state_{}'.format(self.mode_name),
-        )
+        checkpoint = self.checkpoint.load()
+        if checkpoint:
+            self.state = {
+                key[1]: value for key, value in checkpoint.items()
+                if key[0] == 'state'
+            }
+        else:
+            # Reading the state saved by previous versions
+            self.state = get_algo_object(
+                algo_name=self.algo_namespace,
+                key='context.state_{}'.format(self.mode_name),
+            )
         if self.state is None:
             self.state = {}
 
@@ -602,6 +630,7 @@ class ExchangeTradingAlgorithmLive(ExchangeTradingAlgorithmBase):
                 sim_params=self.sim_params,
                 trading_calendar=self.trading_calendar,
                 env=self.trading_environment,
+                streaming_risk=self.streaming_risk,
             )
             # Set the dt initially to the period start by forcing it to change.
             self.on_dt_changed(self.sim_params.start_session)
@@ -609,22 +638,39 @@ class ExchangeTradingAlgorithmLive(ExchangeTradingAlgorithmBase):
             new_position_tracker = tracker.position_tracker
             tracker.position_tracker = None
 
+            today = pd.Timestamp.utcnow().floor('1D')
+            if checkpoint:
+                cum_perf = restore_perf_period(
+                    'cumulative_performance', checkpoint
+                )
+                todays_perf = None
+                if checkpoint.get(('session',)) == today:
+                    todays_perf = restore_perf_period(
+                        'todays_performance', checkpoint
+                    )
+
+                position_tracker = restore_position_tracker(checkpoint)
+                if cum_perf is not None and position_tracker is not None:
+                    cum_perf.position_tracker = position_tracker
+
+            else:
+                # Unpacking the objects saved by previous versions
+                cum_perf = get_algo_object(
+                    algo_name=self.algo_namespace,
+                    key='cumulative_performance_{}'.format(self.mode_name),
+                )
+                todays_perf = get_algo_object(
+                    algo_name=self.algo_namespace,
+                    key=today.strftime('%Y-%m-%d'),
+                    rel_path='daily_performance_{}'.format(self.mode_name),
+                )
+
             # Unpacking the perf_tracker and positions if available
-            cum_perf = get_algo_object(
-                algo_name=self.algo_namespace,
-                key='cumulative_performance_{}'.format(self.mode_name),
-            )
             if cum_perf is not None:
                 tracker.cumulative_performance = cum_perf
                 # Ensure single common position tracker
                 tracker.position_tracker = cum_perf.position_tracker
 
-            today = pd.Timestamp.utcnow().floor('1D')
-            todays_perf = get_algo_object(
-                algo_name=self.algo_namespace,
-                key=today.strftime('%Y-%m-%d'),
-                rel_path='daily_performance_{}'.format(self.mode_name),
-            )
             if todays_perf is not None:
                 # Ensure single common position tracker
                 if tracker.position_tracker is not None:
@@ -754,16 +800,8 @@ class ExchangeTradingAlgorithmLive(ExchangeTradingAlgorithmBase):
 
         log.debug('adding pnl stats: {:6f}%'.format(perc))
 
-        df = pd.DataFrame(
-            data=[dict(performance=perc)],
-            index=[period_stats['period_close']]
-        )
-        self.pnl_stats = pd.concat([self.pnl_stats, df])
-
-        save_algo_df(
-            self.algo_namespace,
-            'pnl_stats_{}'.format(self.mode_name),
-            self.pnl_stats,
+        self.pnl_stats.append(
+            period_stats['period_close'], dict(performance=perc)
         )
 
     def add_custom_signals_stats(self, period_stats):
@@ -779,16 +817,8 @@ class ExchangeTradingAlgorithmLive(ExchangeTradingAlgorithmBase):
 
         """
         log.debug('adding custom signals stats: {}'.format(self.recorded_vars))
-        df = pd.DataFrame(
-            data=[self.recorded_vars],
-            index=[period_stats['period_close']],
-        )
-        self.custom_signals_stats = pd.concat([self.custom_signals_stats, df])
-
-        save_algo_df(
-            self.algo_namespace,
-            'custom_signals_stats_{}'.format(self.mode_name),
-            self.custom_signals_stats,
+        self.custom_signals_stats.append(
+            period_stats['period_close'], self.recorded_vars
         )
 
     def add_exposure_stats(self, period_stats):
@@ -809,24 +839,13 @@ class ExchangeTradingAlgorithmLive(ExchangeTradingAlgorithmBase):
         )
         log.debug('adding exposure stats: {}'.format(data))
 
-        df = pd.DataFrame(
-            data=[data],
-            index=[period_stats['period_close']],
-        )
-        self.exposure_stats = pd.concat([self.exposure_stats, df])
-
-        save_algo_df(
-            self.algo_namespace,
-            'exposure_stats_{}'.format(self.mode_name),
-            self.exposure_stats
-        )
+        self.exposure_stats.append(period_stats['period_close'], data)
 
     def nullify_frame_stats(self, now):
         """
 
-        Save all period_stats to local directory
-        erase old files from the folder and nullify
-        self.frame_stats
+        Compact the period_stats of the day in the frame stats store,
+        erase the stats older than 30 days and nullify self.frame_stats
 
         Parameters
         ----------
@@ -836,20 +855,8 @@ class ExchangeTradingAlgorithmLive(ExchangeTradingAlgorithmBase):
         -------
 
         """
-        save_algo_object(
-            algo_name=self.algo_namespace,
-            key=now.floor('1D').strftime('%Y-%m-%d'),
-            obj=self.frame_stats,
-            rel_path='frame_stats'
-        )
-
-        error = remove_old_files(
-            algo_name=self.algo_namespace,
-            today=now,
-            rel_path='frame_stats'
-        )
-        if error:
-            log.warning(error)
+        self.frame_stats_store.compact()
+        self.frame_stats_store.drop_before(now - pd.DateOffset(30))
 
         self.frame_stats = list()
 
@@ -914,30 +921,69 @@ class ExchangeTradingAlgorithmLive(ExchangeTradingAlgorithmBase):
         self.current_day = data.current_dt.floor('1D')
 
     def _save_algo_state(self, data):
-        today = data.current_dt.floor('1D')
         try:
             self._save_stats_csv(self._process_stats(data))
         except Exception as e:
             log.warn('unable to calculate performance: {}'.format(e))
 
-        log.debug('saving cumulative performance object')
-        save_algo_object(
-            algo_name=self.algo_namespace,
-            key='cumulative_performance_{}'.format(self.mode_name),
-            obj=self.perf_tracker.cumulative_performance,
+        self._bars_since_checkpoint += 1
+        if self._bars_since_checkpoint >= self.checkpoint_interval:
+            self._save_checkpoint(data.current_dt)
+
+    def _save_checkpoint(self, dt):
+        """
+        Save the changes of the performance objects, positions and
+        context.state since the previous checkpoint.
+
+        Parameters
+        ----------
+        dt: pd.Timestamp
+
+        """
+        log.debug('saving the algo state checkpoint')
+        tracker = self.perf_tracker
+
+        entries = perf_period_entries(
+            'cumulative_performance', tracker.cumulative_performance
         )
-        log.debug('saving todays performance object')
-        save_algo_object(
-            algo_name=self.algo_namespace,
-            key=today.strftime('%Y-%m-%d'),
-            obj=self.perf_tracker.todays_performance,
-            rel_path='daily_performance_{}'.format(self.mode_name)
+        entries.update(perf_period_entries(
+            'todays_performance', tracker.todays_performance
+        ))
+        entries.update(position_tracker_entries(tracker.position_tracker))
+        entries[('session',)] = dt.floor('1D')
+
+        for key, value in self.state.items():
+            entries[('state', key)] = value
+
+        # Only the entries which may have changed are serialized: the
+        # positions touched since the last checkpoint, the open orders and
+        # the transactions and order modifications of the latest bars.
+        touched = tracker.position_tracker.pop_touched_assets()
+        last_dt = self._last_checkpoint_dt
+        closed_orders = self._closed_order_keys
+
+        def frozen(key):
+            if key[0] == 'positions':
+                return key[1] not in touched
+
+            if len(key) != 3:
+                return False
+
+            if key[1] == 'orders':
+                return key in closed_orders
+
+            return key[1] in ('transactions', 'orders_by_modified') and \
+                last_dt is not None and key[2] < last_dt
+
+        self.checkpoint.save(entries, frozen=frozen)
+
+        # The closed orders are final once saved
+        self._closed_order_keys = set(
+            key for key, value in entries.items()
+            if len(key) == 3 and key[1] == 'orders' and not value.open
         )
-        log.debug('saving context.state object')
-        save_algo_object(
-            algo_name=self.algo_namespace,
-            key='context.state_{}'.format(self.mode_name),
-            obj=self.state)
+        self._last_checkpoint_dt = dt
+        self._bars_since_checkpoint = 0
 
     def _process_stats(self, data):
         today = data.current_dt.floor('1D')
@@ -947,11 +993,14 @@ class ExchangeTradingAlgorithmLive(ExchangeTradingAlgorithmBase):
         self.perf_tracker.update_performance()
 
         frame_stats = self.prepare_period_stats(
-            data.current_dt, data.current_dt + timedelta(minutes=1)
+            data.current_dt, data.current_dt + self.bar_interval
         )
 
         # Saving the last hour in memory
         self.frame_stats.append(frame_stats)
+        self.frame_stats_store.append(
+            frame_stats['period_close'], frame_stats
+        )
 
         # creating and saving the pnl_stats into the local
         # directory
@@ -1,3 +1,4 @@
+import numpy as np
 import pandas as pd
 from catalyst.constants import LOG_LEVEL
 from catalyst.exchange.utils.factory import find_exchanges
@@ -7,41 +8,102 @@ log = Logger('ExchangeAssetFinder', level=LOG_LEVEL)
 
 
 class ExchangeAssetFinder(object):
+    """
+    Asset finder of the exchanges of an algorithm.
+
+    The assets of all the exchanges are indexed by sid, the first
+    exchange listing a sid owns it. Their lifetimes are kept in
+    columnar arrays to compute the lifetimes matrix of the pipelines
+    without iterating over the assets.
+
+    Parameters
+    ----------
+    exchanges: dict[str, Exchange]
+
+    """
+
     def __init__(self, exchanges):
         self.exchanges = exchanges
 
-    @property
-    def sids(self):
+        self._index_key = None
+        self._assets = []
+        self._assets_by_sid = dict()
+        self._start_nanos = np.empty(0, dtype=np.int64)
+        self._end_nanos = np.empty(0, dtype=np.int64)
+
+    def _get_exchanges(self):
+        if self.exchanges:
+            return [
+                self.exchanges[name] for name in sorted(self.exchanges)
+            ]
+
+        # Using the exchanges with bundles when none are configured
+        exchanges = find_exchanges(features=['minuteBundle'])
+        if not exchanges:
+            raise ValueError('exchange with minute bundles not found')
+
+        return exchanges
+
+    def _update_index(self):
         """
-        This seems to be used to pre-fetch assets.
-        I don't think that we need this for live-trading.
-        Leaving the list empty.
+        Index the assets of the exchanges, the index is rebuilt only
+        when the assets of an exchange are reloaded.
+
         """
-        all_sids = []
-        for exchange_name in self.exchanges:
+        exchanges = self._get_exchanges()
+        for exchange in exchanges:
             # This is what initializes each exchanges at the beginning
             # of an algo
-            exchange = self.exchanges[exchange_name]
             exchange.init()
 
-            all_sids += [asset.sid for asset in exchange.assets]
+        key = tuple(
+            (exchange.name, id(exchange.assets), len(exchange.assets))
+            for exchange in exchanges
+        )
+        if key == self._index_key:
+            return
 
-        sids = list(set(all_sids))
-        return sids
+        assets = []
+        assets_by_sid = dict()
+        for exchange in exchanges:
+            for asset in exchange.assets:
+                if asset.sid not in assets_by_sid:
+                    assets_by_sid[asset.sid] = asset
+                    assets.append(asset)
+
+        def to_nanos(dt, default):
+            return default if dt is None or pd.isnull(dt) \
+                else pd.Timestamp(dt).value
+
+        max_nanos = np.iinfo(np.int64).max
+        self._start_nanos = np.array(
+            [to_nanos(asset.start_date, 0) for asset in assets],
+            dtype=np.int64,
+        )
+        self._end_nanos = np.array(
+            [to_nanos(asset.end_minute, max_nanos) for asset in assets],
+            dtype=np.int64,
+        )
+        self._assets = assets
+        self._assets_by_sid = assets_by_sid
+        self._index_key = key
+
+    @property
+    def sids(self):
+        """
+        The sids of the assets of all the exchanges.
+        """
+        self._update_index()
+        return list(self._assets_by_sid)
 
     def retrieve_asset(self, sid, default_none=False):
         """
         Retrieve the first Asset found for a given sid.
         """
-        asset = None
-        for exchange_name in self.exchanges:
-            if asset is not None:
-                break
-
-            exchange = self.exchanges[exchange_name]
-            assets = [a for a in exchange.assets if a.sid == sid]
-            if assets:
-                asset = assets[0]
+        asset = self._assets_by_sid.get(sid)
+        if asset is None:
+            self._update_index()
+            asset = self._assets_by_sid.get(sid)
 
         return asset
 
@@ -55,24 +117,23 @@ class ExchangeAssetFinder(object):
             Assets to retrieve.
         default_none : bool
             If True, return None for failed lookups.
-            If False, raise `SidsNotFound`.
+            If False, the failed lookups are skipped.
 
         Returns
         -------
         assets : list[Asset or None]
-            A list of the same length as `sids` containing Assets (or Nones)
-            corresponding to the requested sids.
-
-        Raises
-        ------
-        SidsNotFound
-            When a requested sid is not found and default_none=False.
+            The Assets (or Nones) corresponding to the requested sids,
+            in the same order.
         """
+        sids = list(sids)
+        if any(sid not in self._assets_by_sid for sid in sids):
+            self._update_index()
+
         assets = []
-        for exchange_name in self.exchanges:
-            exchange = self.exchanges[exchange_name]
-            xas = [asset for asset in exchange.assets if asset.sid in sids]
-            assets += xas
+        for sid in sids:
+            asset = self._assets_by_sid.get(sid)
+            if asset is not None or default_none:
+                assets.append(asset)
 
         return assets
 
@@ -147,33 +208,14 @@ class ExchangeAssetFinder(object):
         numpy.putmask
         catalyst.pipeline.engine.SimplePipelineEngine._compute_root_mask
         """
-        exchanges = find_exchanges(features=['minuteBundle'])
-        if not exchanges:
-            raise ValueError('exchange with minute bundles not found')
-
-        # TODO: find a way to support multiple exchanges
-        exchange = exchanges[0]
-        # Using a single exchange for now because are not unique for the
-        # same asset in different exchanges. I'd like to avoid binding
-        # pipeline to a single exchange.
-        exchange.init()
-
-        data = []
-        for dt in dates:
-            exists = []
-
-            for asset in exchange.assets:
-                if include_start_date:
-                    condition = (asset.start_date <= dt < asset.end_minute)
-
-                else:
-                    condition = (asset.start_date < dt < asset.end_minute)
-
-                exists.append(condition)
+        self._update_index()
 
-            data.append(exists)
+        dts = dates.asi8.reshape(-1, 1)
+        if include_start_date:
+            exists = self._start_nanos <= dts
+        else:
+            exists = self._start_nanos < dts
 
-        # sids = [asset.sid for asset in exchange.assets]
-        df = pd.DataFrame(data, index=dates, columns=exchange.assets)
+        exists &= dts < self._end_nanos
 
-        return df
+        return pd.DataFrame(exists, index=dates, columns=self._assets)
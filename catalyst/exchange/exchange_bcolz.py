@@ -1,3 +1,5 @@
+from multiprocessing.pool import ThreadPool
+
 import numpy as np
 
 from catalyst import get_calendar
@@ -31,6 +33,7 @@ class BcolzExchangeBarWriter(BcolzMinuteBarWriter):
 class BcolzExchangeBarReader(BcolzMinuteBarReader):
     def __init__(self, *args, **kwargs):
         self._data_frequency = kwargs.pop('data_frequency', None)
+        self.read_threads = kwargs.pop('read_threads', 1)
 
         super(BcolzExchangeBarReader, self).__init__(*args, **kwargs)
 
@@ -38,6 +41,35 @@ class BcolzExchangeBarReader(BcolzMinuteBarReader):
     def data_frequency(self):
         return self._data_frequency
 
+    def _ohlc_ratios_inverse_for_sids(self, sids):
+        return np.array(
+            [self._ohlc_ratio_inverse_for_sid(sid) for sid in sids],
+            dtype=np.float64
+        )
+
+    def _read_raw(self, field, sids, start_idx, end_idx, out):
+        """
+        Decompress the carrays of a field for each sid into the columns
+        of a preallocated buffer, the buffer rows after the end of a
+        carray are left untouched.
+
+        """
+        def read(column):
+            carray = self._open_minute_file(field, sids[column])
+            values = carray[start_idx:end_idx + 1]
+            out[:len(values), column] = values
+
+        if self.read_threads > 1 and len(sids) > 1:
+            pool = ThreadPool(min(self.read_threads, len(sids)))
+            try:
+                pool.map(read, range(len(sids)))
+            finally:
+                pool.close()
+                pool.join()
+        else:
+            for column in range(len(sids)):
+                read(column)
+
     def load_raw_arrays(self, fields, start_dt, end_dt, sids):
         """
         Parameters
@@ -57,6 +89,12 @@ class BcolzExchangeBarReader(BcolzMinuteBarReader):
             A list with an entry per field of ndarrays with shape
             (minutes in range, sids) with a dtype of float64, containing the
             values for the respective field over start and end dt range.
+
+        Notes
+        -----
+        The values of each field are read for all sids into a single
+        buffer, optionally using `read_threads` threads. The periods
+        without data are masked per sid based on the first field read.
         """
         start_idx = self._find_position_of_minute(start_dt)
         end_idx = self._find_position_of_minute(end_dt)
@@ -72,27 +110,30 @@ class BcolzExchangeBarReader(BcolzMinuteBarReader):
         if len(all_fields) == 1 and all_fields[0] == 'volume':
             all_fields.insert(0, 'close')
 
+        inverse_ratios = self._ohlc_ratios_inverse_for_sids(sids)
+
+        # Reused for every field, the values are only read through
+        # the mask.
+        raw = np.zeros(shape, dtype=np.uint32)
+
         mask = None
         data = []
         for field in all_fields:
+            raw.fill(0)
+            self._read_raw(field, sids, start_idx, end_idx, raw)
+
+            if mask is None:
+                mask = raw != 0
+
+            if field not in fields:
+                continue
+
             if field != 'volume':
                 out = np.full(shape, np.nan)
             else:
                 out = np.zeros(shape, dtype=np.float64)
 
-            for i, sid in enumerate(sids):
-                carray = self._open_minute_file(field, sid)
-                a = carray[start_idx:end_idx + 1]
-
-                if mask is None:
-                    mask = a != 0
-
-                inverse_ratio = self._ohlc_ratio_inverse_for_sid(sid)
-                out[:len(mask), i][mask] = (
-                    a[mask] * inverse_ratio
-                )
-
-            if field in fields:
-                data.append(out)
+            np.multiply(raw, inverse_ratios, out=out, where=mask)
+            data.append(out)
 
         return data
@@ -1,7 +1,10 @@
+from collections import OrderedDict
+
 import numpy as np
 import pandas as pd
 from logbook import Logger
 from redo import retry
+from six import iteritems
 
 from catalyst.assets._assets import TradingPair
 from catalyst.constants import LOG_LEVEL
@@ -95,30 +98,101 @@ class TradingPairFixedSlippage(SlippageModel):
         )
 
     def simulate(self, data, asset, orders_for_asset):
+        return self.simulate_orders(data, {asset: orders_for_asset})
+
+    def simulate_orders(self, data, orders_by_asset):
+        """
+        Simulate the fills of the open orders of several assets at once.
+
+        The close prices of all the assets are fetched with a single call,
+        the triggers and the slippage of the orders are evaluated over
+        arrays.
+
+        Parameters
+        ----------
+        data: BarData
+        orders_by_asset: dict[TradingPair, list[Order]]
+
+        Returns
+        -------
+        iterator[(Order, Transaction)]
+
+        """
         self._volume_for_bar = 0
-        price = data.current(asset, 'close')
+
+        assets = []
+        orders = []
+        counts = []
+        for asset, asset_orders in iteritems(orders_by_asset):
+            asset_orders = [o for o in asset_orders if o.open_amount != 0]
+            if asset_orders:
+                assets.append(asset)
+                orders.extend(asset_orders)
+                counts.append(len(asset_orders))
+
+        if not orders:
+            return
 
         dt = data.current_dt
-        for order in orders_for_asset:
-            if order.open_amount == 0:
-                continue
+        prices = np.repeat(
+            np.asarray(data.current(assets, 'close'), dtype='float64'),
+            counts,
+        )
 
-            order.check_triggers(price, dt)
-            if not order.triggered:
-                log.info(
-                    'order has not reached the trigger at current '
-                    'price {}'.format(price)
-                )
-                continue
+        amounts = np.array([o.amount for o in orders], dtype='float64')
+        stops = np.array(
+            [np.nan if o.stop is None else o.stop for o in orders],
+            dtype='float64',
+        )
+        limits = np.array(
+            [np.nan if o.limit is None else o.limit for o in orders],
+            dtype='float64',
+        )
+        stop_reached = np.array([o.stop_reached for o in orders], dtype=bool)
+        limit_reached = np.array(
+            [o.limit_reached for o in orders], dtype=bool
+        )
 
-            execution_price, execution_volume = self.process_order(data, order)
-            if execution_price is not None:
-                transaction = create_transaction(
-                    order, dt, execution_price, execution_volume
-                )
+        new_stop_reached, new_limit_reached, sl_stop_reached = \
+            check_order_triggers(
+                prices, amounts, stops, limits, stop_reached, limit_reached,
+            )
+
+        # Only the orders changing state are updated, as Order.check_triggers
+        changed = (new_stop_reached != stop_reached) | \
+            (new_limit_reached != limit_reached)
+        for i in np.flatnonzero(changed | sl_stop_reached):
+            order = orders[i]
+            if changed[i]:
+                order.dt = dt
+            order.stop_reached = bool(new_stop_reached[i])
+            order.limit_reached = bool(new_limit_reached[i])
+            if sl_stop_reached[i]:
+                # The STOP LIMIT order becomes a LIMIT order
+                order.stop = None
+
+        has_stop = ~np.isnan(stops) & ~sl_stop_reached
+        has_limit = ~np.isnan(limits)
+        triggered = (~has_stop | new_stop_reached) & \
+            (~has_limit | new_limit_reached)
+
+        filled = np.flatnonzero(triggered & ~np.isnan(prices))
+        execution_prices = prices * np.where(
+            amounts > 0, 1 + self.slippage, 1 - self.slippage
+        )
+        log.debug(
+            '{} of {} open orders filled at {}'.format(
+                len(filled), len(orders), dt,
+            )
+        )
 
-                self._volume_for_bar += abs(transaction.amount)
-                yield order, transaction
+        for i in filled:
+            transaction = create_transaction(
+                orders[i], dt, execution_prices[i], orders[i].amount
+            )
+
+            self._volume_for_bar += abs(transaction.amount)
+            yield orders[i], transaction
 
     def process_order(self, data, order):
         price = data.current(order.asset, 'close')
@@ -135,6 +209,56 @@ class TradingPairFixedSlippage(SlippageModel):
         return adj_price, order.amount
 
 
+def check_order_triggers(prices, amounts, stops, limits, stop_reached,
+                         limit_reached):
+    """
+    The triggers of orders given their current prices, as
+    Order.check_order_triggers over arrays.
+
+    Parameters
+    ----------
+    prices: ndarray[float]
+    amounts: ndarray[float]
+    stops: ndarray[float]
+        The stop prices, nan for the orders without stop.
+    limits: ndarray[float]
+        The limit prices, nan for the orders without limit.
+    stop_reached: ndarray[bool]
+    limit_reached: ndarray[bool]
+
+    Returns
+    -------
+    stop_reached: ndarray[bool]
+    limit_reached: ndarray[bool]
+    sl_stop_reached: ndarray[bool]
+        Whether the stop of a STOP LIMIT order has been reached.
+
+    """
+    has_stop = ~np.isnan(stops)
+    has_limit = ~np.isnan(limits)
+    is_buy = amounts > 0
+
+    # The orders already triggered keep their state
+    triggered = (~has_stop | stop_reached) & (~has_limit | limit_reached)
+
+    with np.errstate(invalid='ignore'):
+        stop_hit = np.where(is_buy, prices >= stops, prices <= stops)
+        limit_hit = np.where(is_buy, prices <= limits, prices >= limits)
+
+    stop_limit = has_stop & has_limit
+    sl_stop_reached = ~triggered & stop_limit & stop_hit
+
+    new_stop_reached = np.where(
+        triggered, stop_reached, has_stop & ~has_limit & stop_hit,
+    )
+    new_limit_reached = np.where(
+        triggered,
+        limit_reached,
+        np.where(stop_limit, stop_hit & limit_hit, has_limit & limit_hit),
+    )
+    return new_stop_reached, new_limit_reached, sl_stop_reached
+
+
 class ExchangeBlotter(Blotter):
     def __init__(self, *args, **kwargs):
         self.simulate_orders = kwargs.pop('simulate_orders', False)
@@ -158,6 +282,38 @@ class ExchangeBlotter(Blotter):
             TradingPair: TradingPairFeeSchedule()
         }
 
+    def simulate_fills(self, bar_data):
+        """
+        Simulates the fills of the current open orders, the slippage models
+        simulating the orders of several assets at once get all their
+        assets in a single call.
+
+        Parameters
+        ----------
+        bar_data: catalyst._protocol.BarData
+
+        Returns
+        -------
+        iterator[(Order, Transaction)]
+
+        """
+        batches = OrderedDict()
+        for asset, asset_orders in iteritems(self.open_orders):
+            slippage = self.slippage_models[type(asset)]
+
+            if hasattr(slippage, 'simulate_orders'):
+                batches.setdefault(slippage, {})[asset] = asset_orders
+                continue
+
+            for order, txn in \
+                    slippage.simulate(bar_data, asset, asset_orders):
+                yield order, txn
+
+        for slippage, orders_by_asset in iteritems(batches):
+            for order, txn in \
+                    slippage.simulate_orders(bar_data, orders_by_asset):
+                yield order, txn
+
     def exchange_order(self, asset, amount, style=None):
         exchange = self.exchanges[asset.exchange]
         return exchange.order(
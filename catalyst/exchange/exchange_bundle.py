@@ -1,8 +1,10 @@
 import os
 import shutil
+from collections import OrderedDict, deque
 from datetime import timedelta
 from functools import partial
 from itertools import chain
+from multiprocessing.pool import ThreadPool
 from operator import is_not
 
 import numpy as np
@@ -12,8 +14,7 @@ from catalyst import get_calendar
 from catalyst.assets._assets import TradingPair
 from catalyst.constants import DATE_TIME_FORMAT, AUTO_INGEST
 from catalyst.constants import LOG_LEVEL
-from catalyst.data.minute_bars import BcolzMinuteOverlappingData, \
-    BcolzMinuteBarMetadata
+from catalyst.data.minute_bars import BcolzMinuteBarMetadata
 from catalyst.exchange.exchange_bcolz import BcolzExchangeBarReader, \
     BcolzExchangeBarWriter
 from catalyst.exchange.exchange_errors import EmptyValuesInBundleError, \
@@ -21,13 +22,15 @@ from catalyst.exchange.exchange_errors import EmptyValuesInBundleError, \
     NoDataAvailableOnExchange, \
     PricingDataNotLoadedError, DataCorruptionError, PricingDataValueError
 from catalyst.exchange.utils.bundle_utils import range_in_bundle, \
-    get_bcolz_chunk, get_df_from_arrays, get_assets
+    get_bcolz_chunk, get_df_from_arrays, get_assets, ChunkManifest, \
+    CoverageIndex, ingested_range
 from catalyst.exchange.utils.datetime_utils import get_start_dt, \
     get_period_label, get_month_start_end, get_year_start_end
 from catalyst.exchange.utils.exchange_utils import get_exchange_folder, \
     save_exchange_symbols, mixin_market_params, get_catalyst_symbol
 from catalyst.utils.cli import maybe_show_progress
 from catalyst.utils.paths import ensure_directory
+from catalyst.utils.pool import SequentialPool
 from logbook import Logger
 from pytz import UTC
 from six import itervalues
@@ -35,6 +38,8 @@ from six import itervalues
 log = Logger('exchange_bundle', level=LOG_LEVEL)
 
 BUNDLE_NAME_TEMPLATE = os.path.join('{root}', '{frequency}_bundle')
+MANIFEST_NAME_TEMPLATE = os.path.join('{root}', '{frequency}_manifest.txt')
+COVERAGE_NAME_TEMPLATE = os.path.join('{root}', '{frequency}_coverage.txt')
 
 
 def _cachpath(symbol, type_):
@@ -48,9 +53,19 @@ class ExchangeBundle:
         self.default_ohlc_ratio = 1000000
         self._writers = dict()
         self._readers = dict()
+        self._manifests = dict()
+        self._coverages = dict()
         self.calendar = get_calendar('OPEN')
         self.exchange = None
 
+        # The number of threads used by the readers to decompress the
+        # carrays of multiple assets
+        self.read_threads = 1
+
+        # A local folder of chunk tarballs or an alternate url
+        # to use in place of the remote bucket
+        self.chunks_source = None
+
     def get_reader(self, data_frequency, path=None):
         """
         Get a data writer object, either a new object or from cache
@@ -73,13 +88,95 @@ class ExchangeBundle:
         try:
             self._readers[path] = BcolzExchangeBarReader(
                 rootdir=path,
-                data_frequency=data_frequency
+                data_frequency=data_frequency,
+                read_threads=self.read_threads
             )
         except IOError:
             self._readers[path] = None
 
         return self._readers[path]
 
+    def get_manifest(self, data_frequency):
+        """
+        Get the manifest of chunks already merged into the bundle.
+
+        Parameters
+        ----------
+        data_frequency: str
+
+        Returns
+        -------
+        ChunkManifest
+
+        """
+        if data_frequency not in self._manifests:
+            root = get_exchange_folder(self.exchange_name)
+            path = MANIFEST_NAME_TEMPLATE.format(
+                root=root,
+                frequency=data_frequency
+            )
+            self._manifests[data_frequency] = ChunkManifest(path)
+
+        return self._manifests[data_frequency]
+
+    def get_coverage(self, data_frequency):
+        """
+        Get the index of the date ranges ingested into the bundle.
+
+        Parameters
+        ----------
+        data_frequency: str
+
+        Returns
+        -------
+        CoverageIndex
+
+        """
+        if data_frequency not in self._coverages:
+            root = get_exchange_folder(self.exchange_name)
+            path = COVERAGE_NAME_TEMPLATE.format(
+                root=root,
+                frequency=data_frequency
+            )
+            self._coverages[data_frequency] = CoverageIndex(
+                path, data_frequency
+            )
+
+        return self._coverages[data_frequency]
+
+    def range_in_bundle(self, asset, start_dt, end_dt, data_frequency,
+                        reader=None):
+        """
+        Whether the price data of an asset was ingested for the
+        given date range.
+
+        The coverage index is authoritative for the assets it knows,
+        the bundle is probed for the assets ingested before the index
+        existed.
+
+        Parameters
+        ----------
+        asset: TradingPair
+        start_dt: pd.Timestamp
+        end_dt: pd.Timestamp
+        data_frequency: str
+        reader: BcolzExchangeBarReader
+
+        Returns
+        -------
+        bool
+
+        """
+        coverage = self.get_coverage(data_frequency)
+        if asset.sid in coverage:
+            return coverage.covers(asset.sid, start_dt, end_dt)
+
+        if reader is None:
+            reader = self.get_reader(data_frequency)
+
+        return reader is not None and \
+            range_in_bundle(asset, start_dt, end_dt, reader)
+
     def update_metadata(self, writer, start_dt, end_dt):
         pass
 
@@ -164,22 +261,60 @@ class ExchangeBundle:
         reader = self.get_reader(data_frequency)
         missing_assets = []
         for asset in assets:
-            has_data = range_in_bundle(asset, start_dt, end_dt, reader)
+            has_data = self.range_in_bundle(
+                asset, start_dt, end_dt, data_frequency, reader
+            )
 
             if not has_data:
                 missing_assets.append(asset)
 
         return missing_assets
 
+    def _uncovered_ranges(self, sids, data_frequency):
+        """
+        The date ranges of the sids missing from the coverage index
+        which were ingested before the index existed.
+
+        Parameters
+        ----------
+        sids: list[int]
+        data_frequency: str
+
+        Returns
+        -------
+        list[tuple[int, pd.Timestamp, pd.Timestamp]]
+
+        """
+        coverage = self.get_coverage(data_frequency)
+        sids = [sid for sid in sids if sid not in coverage]
+        reader = self.get_reader(data_frequency) if sids else None
+        if reader is None:
+            return []
+
+        ranges = []
+        for sid in sids:
+            dt_range = ingested_range(sid, reader)
+            if dt_range is not None:
+                ranges.append((sid,) + dt_range)
+
+        return ranges
+
     def _write(self, data, writer, data_frequency):
+        # The coverage index starts from the data already in the bundle,
+        # read before it is extended by this write.
+        seeds = self._uncovered_ranges(
+            [sid for sid, df in data if not df.empty], data_frequency
+        )
+
+        # The periods older than the data already written, e.g. chunks
+        # ingested out of order, are rewritten in place.
         try:
             writer.write(
                 data=data,
                 show_progress=False,
-                invalid_data_behavior='raise'
+                invalid_data_behavior='raise',
+                overwrite=True,
             )
-        except BcolzMinuteOverlappingData as e:
-            log.debug('chunk already exists: {}'.format(e))
         except Exception as e:
             log.warn('error when writing data: {}, trying again'.format(e))
 
@@ -192,9 +327,23 @@ class ExchangeBundle:
             writer.write(
                 data=data,
                 show_progress=False,
-                invalid_data_behavior='raise'
+                invalid_data_behavior='raise',
+                overwrite=True,
             )
 
+        reader = self._readers.get(writer._rootdir)
+        if reader is not None:
+            reader.invalidate_sids([sid for sid, _ in data])
+
+        # Only the data written successfully is recorded
+        ranges = seeds + [
+            (sid, df.index[0], df.index[-1]) for sid, df in data
+            if not df.empty
+        ]
+        coverage = self.get_coverage(data_frequency)
+        for sid, start_dt, end_dt in ranges:
+            coverage.add(sid, start_dt, end_dt)
+
     def get_calendar_periods_range(self, start_dt, end_dt, data_frequency):
         """
         Get a list of dates for the specified range.
@@ -331,9 +480,33 @@ class ExchangeBundle:
 
         return problems
 
+    def download_chunk(self, asset, data_frequency, period):
+        """
+        Download and extract a ctable bundle chunk.
+
+        Parameters
+        ----------
+        asset: TradingPair
+        data_frequency: str
+        period: str
+
+        Returns
+        -------
+        str
+            The path of the extracted chunk.
+
+        """
+        return get_bcolz_chunk(
+            exchange_name=self.exchange_name,
+            symbol=asset.symbol,
+            data_frequency=data_frequency,
+            period=period,
+            source=self.chunks_source
+        )
+
     def ingest_ctable(self, asset, data_frequency, period,
                       writer, empty_rows_behavior='strip',
-                      duplicates_threshold=100, cleanup=False):
+                      duplicates_threshold=100, cleanup=False, path=None):
         """
         Merge a ctable bundle chunk into the main bundle for the exchange.
 
@@ -349,6 +522,10 @@ class ExchangeBundle:
         cleanup: bool
             Remove the temp bundle directory after ingestion.
 
+        path: str
+            The folder of a chunk already extracted, the chunk
+            is downloaded when None.
+
         Returns
         -------
         list[str]
@@ -358,12 +535,8 @@ class ExchangeBundle:
         problems = []
 
         # Download and extract the bundle
-        path = get_bcolz_chunk(
-            exchange_name=self.exchange_name,
-            symbol=asset.symbol,
-            data_frequency=data_frequency,
-            period=period
-        )
+        if path is None:
+            path = self.download_chunk(asset, data_frequency, period)
 
         reader = self.get_reader(data_frequency, path=path)
         if reader is None:
@@ -411,6 +584,12 @@ class ExchangeBundle:
             empty_rows_behavior=empty_rows_behavior,
             duplicates_threshold=duplicates_threshold
         )
+        # The empty periods stripped from the chunk are covered as well
+        ranges = self._uncovered_ranges([asset.sid], data_frequency)
+        ranges.append((asset.sid, start_dt, end_dt))
+        coverage = self.get_coverage(data_frequency)
+        for sid, range_start, range_end in ranges:
+            coverage.add(sid, range_start, range_end)
 
         if cleanup:
             log.debug(
@@ -496,6 +675,8 @@ class ExchangeBundle:
 
         # Get a reader for the main bundle to verify if data exists
         reader = self.get_reader(data_frequency)
+        manifest = self.get_manifest(data_frequency)
+        today = pd.Timestamp.utcnow().floor('1D')
 
         chunks = dict()
         for asset in assets:
@@ -531,6 +712,10 @@ class ExchangeBundle:
                     last_day=dt if index == len(dates) - 1 else None
                 )
 
+                period = get_period_label(dt, data_frequency)
+                if (asset.symbol, period) in manifest:
+                    continue
+
                 # Currencies don't always start trading at midnight.
                 # Checking the last minute of the day instead.
                 range_start = period_start.replace(hour=23, minute=59) \
@@ -539,14 +724,17 @@ class ExchangeBundle:
                 # Checking if the data already exists in the bundle
                 # for the date range of the chunk. If not, we create
                 # a chunk for ingestion.
-                has_data = range_in_bundle(
-                    asset, range_start, period_end, reader
+                has_data = self.range_in_bundle(
+                    asset, range_start, period_end, data_frequency, reader
                 )
                 if not has_data:
-                    period = get_period_label(dt, data_frequency)
+                    # Only a chunk covering an elapsed period in full
+                    # is final, the others may get more data later.
+                    _, last_dt = get_start_end(dt=dt)
                     chunk = dict(
                         asset=asset,
                         period=period,
+                        final=period_end >= last_dt and last_dt < today,
                     )
                     chunks[asset].append(chunk)
 
@@ -557,9 +745,98 @@ class ExchangeBundle:
 
         return chunks
 
+    def _ingest_chunks(self, chunks, data_frequency, writer,
+                       show_progress, label, download_workers=1):
+        """
+        Download the chunks and merge them into the bundle.
+
+        The chunks are downloaded and extracted by a pool of
+        `download_workers` threads while this thread merges the extracted
+        chunks into the bundle in their order, a chunk downloaded ahead
+        of the previous ones waits for them. At most two chunks per worker
+        are downloaded ahead of the merge. The writer is never shared
+        between threads.
+
+        Parameters
+        ----------
+        chunks: list[dict[str, Object]]
+        data_frequency: str
+        writer: BcolzExchangeBarWriter
+        show_progress: bool
+        label: str
+        download_workers: int
+
+        Returns
+        -------
+        list[str]
+            A list of problems which occurred during ingestion.
+
+        """
+        manifest = self.get_manifest(data_frequency)
+
+        def download(chunk):
+            try:
+                path = self.download_chunk(
+                    chunk['asset'], data_frequency, chunk['period']
+                )
+                return chunk, path, None
+
+            except Exception as e:
+                return chunk, None, e
+
+        def downloads_in_order(pool):
+            # At most two chunks per worker are downloaded ahead of the
+            # writer, so that the extracted chunks do not pile up on disk.
+            pending = deque()
+            for chunk in chunks:
+                pending.append(pool.apply_async(download, (chunk,)))
+                if len(pending) >= 2 * download_workers:
+                    yield pending.popleft().get()
+
+            while pending:
+                yield pending.popleft().get()
+
+        if download_workers > 1:
+            pool = ThreadPool(download_workers)
+            downloads = downloads_in_order(pool)
+        else:
+            pool = None
+            downloads = SequentialPool.imap(download, chunks)
+
+        problems = []
+        try:
+            with maybe_show_progress(
+                    downloads,
+                    show_progress,
+                    length=len(chunks),
+                    label=label) as it:
+                for chunk, path, error in it:
+                    if error is not None:
+                        raise error
+
+                    problems += self.ingest_ctable(
+                        asset=chunk['asset'],
+                        data_frequency=data_frequency,
+                        period=chunk['period'],
+                        writer=writer,
+                        empty_rows_behavior='strip',
+                        cleanup=True,
+                        path=path
+                    )
+
+                    if chunk.get('final', False):
+                        manifest.add(chunk['asset'].symbol, chunk['period'])
+
+        finally:
+            if pool is not None:
+                pool.terminate()
+                pool.join()
+
+        return problems
+
     def ingest_assets(self, assets, data_frequency, start_dt=None, end_dt=None,
                       show_progress=False, show_breakdown=False,
-                      show_report=False):
+                      show_report=False, download_workers=1):
         """
         Determine if data is missing from the bundle and attempt to ingest it.
 
@@ -571,6 +848,9 @@ class ExchangeBundle:
         end_dt: pd.Timestamp
         show_progress: bool
         show_breakdown: bool
+        download_workers: int
+            The number of chunks downloaded concurrently, the chunks
+            are always merged into the bundle one at a time.
 
         """
         if start_dt is None:
@@ -600,24 +880,18 @@ class ExchangeBundle:
         if show_breakdown:
             if chunks:
                 for asset in chunks:
-                    with maybe_show_progress(
-                        chunks[asset],
-                        show_progress,
+                    problems += self._ingest_chunks(
+                        chunks=chunks[asset],
+                        data_frequency=data_frequency,
+                        writer=writer,
+                        show_progress=show_progress,
                         label='Ingesting {frequency} price data for '
                               '{symbol} on {exchange}'.format(
-                            exchange=self.exchange_name,
-                            frequency=data_frequency,
-                            symbol=asset.symbol
-                            )) as it:
-                        for chunk in it:
-                            problems += self.ingest_ctable(
-                                asset=chunk['asset'],
-                                data_frequency=data_frequency,
-                                period=chunk['period'],
-                                writer=writer,
-                                empty_rows_behavior='strip',
-                                cleanup=True
-                            )
+                                exchange=self.exchange_name,
+                                frequency=data_frequency,
+                                symbol=asset.symbol),
+                        download_workers=download_workers
+                    )
         else:
             all_chunks = list(chain.from_iterable(itervalues(chunks)))
             # We sort the chunks by end date to ingest most recent data first
@@ -625,23 +899,17 @@ class ExchangeBundle:
                 all_chunks.sort(
                     key=lambda chunk: pd.to_datetime(chunk['period'])
                 )
-                with maybe_show_progress(
-                    all_chunks,
-                    show_progress,
+                problems += self._ingest_chunks(
+                    chunks=all_chunks,
+                    data_frequency=data_frequency,
+                    writer=writer,
+                    show_progress=show_progress,
                     label='Ingesting {frequency} price data on '
                           '{exchange}'.format(
-                        exchange=self.exchange_name,
-                        frequency=data_frequency,
-                        )) as it:
-                    for chunk in it:
-                        problems += self.ingest_ctable(
-                            asset=chunk['asset'],
-                            data_frequency=data_frequency,
-                            period=chunk['period'],
-                            writer=writer,
-                            empty_rows_behavior='strip',
-                            cleanup=True
-                        )
+                            exchange=self.exchange_name,
+                            frequency=data_frequency),
+                    download_workers=download_workers
+                )
 
         if show_report and len(problems) > 0:
             log.info('problems during ingestion:{}\n'.format(
@@ -786,7 +1054,8 @@ class ExchangeBundle:
 
     def ingest(self, data_frequency, include_symbols=None,
                exclude_symbols=None, start=None, end=None, csv=None,
-               show_progress=True, show_breakdown=True, show_report=True):
+               show_progress=True, show_breakdown=True, show_report=True,
+               download_workers=1):
         """
         Inject data based on specified parameters.
 
@@ -798,6 +1067,7 @@ class ExchangeBundle:
         start: pd.Timestamp
         end: pd.Timestamp
         show_progress: bool
+        download_workers: int
         environ:
 
         """
@@ -821,7 +1091,8 @@ class ExchangeBundle:
                     end_dt=end,
                     show_progress=show_progress,
                     show_breakdown=show_breakdown,
-                    show_report=show_report
+                    show_report=show_report,
+                    download_workers=download_workers
                 )
 
     def get_history_window_series_and_load(self,
@@ -848,19 +1119,56 @@ class ExchangeBundle:
 
         Returns
         -------
-        Series
+        DataFrame
+
+        """
+        return self.get_history_window_frames_and_load(
+            assets=assets,
+            end_dt=end_dt,
+            bar_count=bar_count,
+            fields=[field],
+            data_frequency=data_frequency,
+            algo_end_dt=algo_end_dt,
+            force_auto_ingest=force_auto_ingest,
+        )[field]
+
+    def get_history_window_frames_and_load(self,
+                                           assets,
+                                           end_dt,
+                                           bar_count,
+                                           fields,
+                                           data_frequency,
+                                           algo_end_dt=None,
+                                           force_auto_ingest=False
+                                           ):
+        """
+        Retrieve the price data history of several fields with a single
+        read of the bundle, ingest missing data.
+
+        Parameters
+        ----------
+        assets: list[TradingPair]
+        end_dt: pd.Timestamp
+        bar_count: int
+        fields: list[str]
+        data_frequency: str
+        algo_end_dt: pd.Timestamp
+        force_auto_ingest:
+
+        Returns
+        -------
+        dict[str, DataFrame]
 
         """
         if AUTO_INGEST or force_auto_ingest:
             try:
-                series = self.get_history_window_series(
+                return self.get_history_window_frames(
                     assets=assets,
                     end_dt=end_dt,
                     bar_count=bar_count,
-                    field=field,
+                    fields=fields,
                     data_frequency=data_frequency,
                 )
-                return pd.DataFrame(series)
 
             except PricingDataNotLoadedError:
                 start_dt = get_start_dt(end_dt, bar_count, data_frequency)
@@ -880,25 +1188,23 @@ class ExchangeBundle:
                     show_progress=True,
                     show_breakdown=True
                 )
-                series = self.get_history_window_series(
+                return self.get_history_window_frames(
                     assets=assets,
                     end_dt=end_dt,
                     bar_count=bar_count,
-                    field=field,
+                    fields=fields,
                     data_frequency=data_frequency,
                     reset_reader=True,
                 )
-                return series
 
         else:
-            series = self.get_history_window_series(
+            return self.get_history_window_frames(
                 assets=assets,
                 end_dt=end_dt,
                 bar_count=bar_count,
-                field=field,
+                fields=fields,
                 data_frequency=data_frequency,
             )
-            return pd.DataFrame(series)
 
     def get_spot_values(self,
                         assets,
@@ -921,30 +1227,70 @@ class ExchangeBundle:
 
         Returns
         -------
-        float
+        list[float]
+
+        """
+        values = self.get_spot_values_array(
+            assets, [field], dt, data_frequency, reset_reader
+        )
+        return list(values[:, 0])
+
+    def get_spot_values_array(self,
+                              assets,
+                              fields,
+                              dt,
+                              data_frequency,
+                              reset_reader=False
+                              ):
+        """
+        The spot values of several assets and fields at the given date,
+        read from the exchange data bundle in a single request.
+
+        Parameters
+        ----------
+        assets: list[TradingPair]
+        fields: list[str]
+        dt: pd.Timestamp
+        data_frequency: str
+        reset_reader:
+
+        Returns
+        -------
+        ndarray
+            The values with shape (len(assets), len(fields)).
 
         """
-        values = []
         try:
             reader = self.get_reader(data_frequency)
             if reset_reader:
                 del self._readers[reader._rootdir]
                 reader = self.get_reader(data_frequency)
 
-            for asset in assets:
-                value = reader.get_value(
-                    sid=asset.sid,
-                    dt=dt,
-                    field=field
+            read_fields = list(OrderedDict.fromkeys(fields))
+            if dt < reader.first_trading_day:
+                # Requesting a period before the bundle start
+                arrays = [
+                    np.zeros((1, len(assets))) if field == 'volume'
+                    else np.full((1, len(assets)), np.nan)
+                    for field in read_fields
+                ]
+            else:
+                arrays = reader.load_raw_arrays(
+                    fields=read_fields,
+                    start_dt=dt,
+                    end_dt=dt,
+                    sids=[asset.sid for asset in assets]
                 )
-                values.append(value)
 
-            return values
+            columns = dict(zip(read_fields, arrays))
+            return np.column_stack(
+                [columns[field][0] for field in fields]
+            )
 
         except Exception:
             symbols = [asset.symbol for asset in assets]
             raise PricingDataNotLoadedError(
-                field=field,
+                field=','.join(fields),
                 first_trading_day=min([asset.start_date for asset in assets]),
                 exchange=self.exchange_name,
                 symbols=symbols,
@@ -961,6 +1307,44 @@ class ExchangeBundle:
                                   field,
                                   data_frequency,
                                   reset_reader=False):
+        df = self.get_history_window_frames(
+            assets=assets,
+            end_dt=end_dt,
+            bar_count=bar_count,
+            fields=[field],
+            data_frequency=data_frequency,
+            reset_reader=reset_reader,
+        )[field]
+        return {asset: df[asset] for asset in assets}
+
+    def get_history_window_frames(self,
+                                  assets,
+                                  end_dt,
+                                  bar_count,
+                                  fields,
+                                  data_frequency,
+                                  reset_reader=False):
+        """
+        The price history of the assets for several fields, read from
+        the bundle in a single request.
+
+        Parameters
+        ----------
+        assets: list[TradingPair]
+        end_dt: pd.Timestamp
+        bar_count: int
+        fields: list[str]
+        data_frequency: str
+        reset_reader: bool
+
+        Returns
+        -------
+        dict[str, DataFrame]
+            The values of each field indexed by date with a column
+            per asset.
+
+        """
+        field_label = ','.join(fields)
         start_dt = get_start_dt(end_dt, bar_count, data_frequency, False)
         start_dt, _ = self.get_adj_dates(
             start_dt, end_dt, assets, data_frequency
@@ -977,7 +1361,7 @@ class ExchangeBundle:
         if reader is None:
             symbols = [asset.symbol for asset in assets]
             raise PricingDataNotLoadedError(
-                field=field,
+                field=field_label,
                 first_trading_day=min([asset.start_date for asset in assets]),
                 exchange=self.exchange_name,
                 symbols=symbols,
@@ -987,17 +1371,16 @@ class ExchangeBundle:
                 end_dt=end_dt
             )
 
-        series = dict()
+        asset_start_dt, _ = self.get_adj_dates(
+            start_dt, end_dt, assets, data_frequency
+        )
         for asset in assets:
-            asset_start_dt, _ = self.get_adj_dates(
-                start_dt, end_dt, assets, data_frequency
-            )
-            in_bundle = range_in_bundle(
-                asset, asset_start_dt, end_dt, reader
+            in_bundle = self.range_in_bundle(
+                asset, asset_start_dt, end_dt, data_frequency, reader
             )
             if not in_bundle:
                 raise PricingDataNotLoadedError(
-                    field=field,
+                    field=field_label,
                     first_trading_day=asset.start_date,
                     exchange=self.exchange_name,
                     symbols=asset.symbol,
@@ -1007,43 +1390,43 @@ class ExchangeBundle:
                     end_dt=end_dt
                 )
 
-            periods = self.get_calendar_periods_range(
-                asset_start_dt, end_dt, data_frequency
-            )
-            # This does not behave well when requesting multiple assets
-            # when the start or end date of one asset is outside of the range
-            # looking at the logic in load_raw_arrays(), we are not achieving
-            # any performance gain by requesting multiple sids at once. It's
-            # looping through the sids and making separate requests anyway.
-            arrays = reader.load_raw_arrays(
-                sids=[asset.sid],
-                fields=[field],
-                start_dt=start_dt,
+        periods = self.get_calendar_periods_range(
+            asset_start_dt, end_dt, data_frequency
+        )
+        # The reader decompresses the values of all the sids into
+        # a single array, one request is enough for all assets.
+        read_fields = list(OrderedDict.fromkeys(fields))
+        arrays = reader.load_raw_arrays(
+            sids=[asset.sid for asset in assets],
+            fields=read_fields,
+            start_dt=start_dt,
+            end_dt=end_dt
+        )
+        if len(arrays) == 0:
+            symbols = [asset.symbol for asset in assets]
+            raise DataCorruptionError(
+                exchange=self.exchange_name,
+                symbols=','.join(symbols),
+                start_dt=asset_start_dt,
                 end_dt=end_dt
             )
-            if len(arrays) == 0:
-                raise DataCorruptionError(
-                    exchange=self.exchange_name,
-                    symbols=asset.symbol,
-                    start_dt=asset_start_dt,
-                    end_dt=end_dt
-                )
-
-            field_values = arrays[0][:, 0]
 
+        frames = dict()
+        for field, values in zip(read_fields, arrays):
             try:
-                value_series = pd.Series(field_values, index=periods)
-                series[asset] = value_series
+                frames[field] = pd.DataFrame(
+                    values, index=periods, columns=list(assets)
+                )
             except ValueError as e:
                 raise PricingDataValueError(
-                    exchange=asset.exchange,
-                    symbol=asset.symbol,
+                    exchange=assets[0].exchange,
+                    symbol=','.join(asset.symbol for asset in assets),
                     start_dt=asset_start_dt,
                     end_dt=end_dt,
                     error=e
                 )
 
-        return series
+        return frames
 
     def clean(self, data_frequency):
         """
@@ -1087,3 +1470,6 @@ class ExchangeBundle:
                 )
                 shutil.rmtree(frequency_bundle)
                 log.debug('{} removed'.format(frequency_bundle))
+
+            self.get_manifest(frequency).clear()
+            self.get_coverage(frequency).clear()
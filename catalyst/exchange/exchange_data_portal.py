@@ -1,5 +1,6 @@
 import abc
 import datetime
+from collections import OrderedDict
 
 import numpy as np
 import pandas as pd
@@ -10,9 +11,10 @@ from catalyst.exchange.exchange_bundle import ExchangeBundle
 from catalyst.exchange.exchange_errors import (
     ExchangeRequestError,
     PricingDataNotLoadedError)
-from catalyst.exchange.utils.exchange_utils import resample_history_df, \
-    group_assets_by_exchange
-from catalyst.exchange.utils.datetime_utils import get_frequency, get_start_dt
+from catalyst.exchange.exchange_history_loader import ExchangeHistoryLoader
+from catalyst.exchange.market_data_cache import MarketDataCache
+from catalyst.exchange.utils.exchange_utils import group_assets_by_exchange
+from catalyst.exchange.utils.datetime_utils import get_frequency, get_delta
 from logbook import Logger
 from redo import retry
 
@@ -96,6 +98,100 @@ class DataPortalExchangeBase(DataPortal):
                   data_frequency,
                   ffill))
 
+    def _get_history_windows(self,
+                             assets,
+                             end_dt,
+                             bar_count,
+                             frequency,
+                             fields,
+                             data_frequency,
+                             ffill=True):
+        exchange_assets = group_assets_by_exchange(assets)
+
+        exchange_frames = [
+            self.get_exchange_history_windows(
+                exchange_name,
+                exchange_assets[exchange_name],
+                end_dt,
+                bar_count,
+                frequency,
+                fields,
+                data_frequency,
+                ffill,
+            ) for exchange_name in exchange_assets
+        ]
+        if len(exchange_frames) == 1:
+            return exchange_frames[0]
+
+        # Merging the columns of each exchange
+        return {
+            field: pd.concat(
+                [frames[field] for frames in exchange_frames], axis=1
+            ) for field in fields
+        }
+
+    def get_history_windows(self,
+                            assets,
+                            end_dt,
+                            bar_count,
+                            frequency,
+                            fields,
+                            data_frequency=None,
+                            ffill=True):
+        """
+        The history windows of several fields, each exchange serves
+        all the fields of its assets with a single request.
+
+        Returns
+        -------
+        dict[str, DataFrame]
+
+        """
+        read_fields = [
+            'close' if field == 'price' else field for field in fields
+        ]
+
+        frames = retry(
+            action=self._get_history_windows,
+            attempts=self.attempts['get_history_window_attempts'],
+            sleeptime=self.attempts['retry_sleeptime'],
+            retry_exceptions=(ExchangeRequestError,),
+            cleanup=lambda: log.warn('fetching history again.'),
+            args=(assets,
+                  end_dt,
+                  bar_count,
+                  frequency,
+                  list(OrderedDict.fromkeys(read_fields)),
+                  data_frequency,
+                  ffill))
+
+        return {
+            field: frames[read_field]
+            for field, read_field in zip(fields, read_fields)
+        }
+
+    def get_exchange_history_windows(self,
+                                     exchange_name,
+                                     assets,
+                                     end_dt,
+                                     bar_count,
+                                     frequency,
+                                     fields,
+                                     data_frequency,
+                                     ffill=True):
+        return {
+            field: self.get_exchange_history_window(
+                exchange_name,
+                assets,
+                end_dt,
+                bar_count,
+                frequency,
+                field,
+                data_frequency,
+                ffill,
+            ) for field in fields
+        }
+
     @abc.abstractmethod
     def get_exchange_history_window(self,
                                     exchange_name,
@@ -166,6 +262,55 @@ class DataPortalExchangeBase(DataPortal):
                                 data_frequency):
         return
 
+    def _get_spot_values(self, assets, fields, dt, data_frequency):
+        assets = list(assets)
+
+        rows = dict()
+        for row, asset in enumerate(assets):
+            rows.setdefault(asset.exchange, []).append(row)
+
+        values = np.full((len(assets), len(fields)), np.nan)
+        for exchange_name in rows:
+            exchange_rows = rows[exchange_name]
+            values[exchange_rows] = self.get_exchange_spot_values(
+                exchange_name,
+                [assets[row] for row in exchange_rows],
+                fields,
+                dt,
+                data_frequency
+            )
+
+        return values
+
+    def get_spot_values(self, assets, fields, dt, data_frequency):
+        """
+        The spot values of several assets and fields, each exchange
+        serves all the values of its assets with a single request.
+
+        Returns
+        -------
+        ndarray
+            The values with shape (len(assets), len(fields)).
+
+        """
+        fields = ['close' if field == 'price' else field for field in fields]
+
+        return retry(
+            action=self._get_spot_values,
+            attempts=self.attempts['get_spot_value_attempts'],
+            sleeptime=self.attempts['retry_sleeptime'],
+            retry_exceptions=(ExchangeRequestError,),
+            cleanup=lambda: log.warn('fetching spot values again.'),
+            args=(assets, fields, dt, data_frequency))
+
+    def get_exchange_spot_values(self, exchange_name, assets, fields, dt,
+                                 data_frequency):
+        return np.column_stack([
+            self.get_exchange_spot_value(
+                exchange_name, assets, field, dt, data_frequency
+            ) for field in fields
+        ])
+
     def get_adjusted_value(self, asset, field, dt,
                            perspective_dt,
                            data_frequency,
@@ -178,8 +323,22 @@ class DataPortalExchangeBase(DataPortal):
 class DataPortalExchangeLive(DataPortalExchangeBase):
     def __init__(self, *args, **kwargs):
         self.exchanges = kwargs.pop('exchanges', None)
+
+        # The tickers and candles are cached between the requests
+        # of a bar, a shared folder lets several algos use them.
+        ticker_ttl = kwargs.pop('ticker_ttl', 5)
+        market_data_folder = kwargs.pop('market_data_folder', None)
+
         super(DataPortalExchangeLive, self).__init__(*args, **kwargs)
 
+        for exchange in self.exchanges.values():
+            if exchange.market_data is None:
+                exchange.market_data = MarketDataCache(
+                    exchange,
+                    ticker_ttl=ticker_ttl,
+                    folder=market_data_folder,
+                )
+
     def get_exchange_history_window(self,
                                     exchange_name,
                                     assets,
@@ -220,6 +379,34 @@ class DataPortalExchangeLive(DataPortalExchangeBase):
             False)
         return df
 
+    def get_exchange_history_windows(self,
+                                     exchange_name,
+                                     assets,
+                                     end_dt,
+                                     bar_count,
+                                     frequency,
+                                     fields,
+                                     data_frequency,
+                                     ffill=True):
+        """
+        The history windows of several fields built from a single
+        request of candles.
+
+        Returns
+        -------
+        dict[str, DataFrame]
+
+        """
+        exchange = self.exchanges[exchange_name]
+        return exchange.get_history_windows(
+            assets,
+            end_dt,
+            bar_count,
+            frequency,
+            fields,
+            data_frequency,
+            False)
+
     def get_exchange_spot_value(self, exchange_name, assets, field, dt,
                                 data_frequency):
         """
@@ -244,10 +431,32 @@ class DataPortalExchangeLive(DataPortalExchangeBase):
 
         return exchange_spot_values
 
+    def get_exchange_spot_values(self, exchange_name, assets, fields, dt,
+                                 data_frequency):
+        """
+        The spot values of the assets from a single request of tickers.
+
+        Parameters
+        ----------
+        exchange_name: str
+        assets: list[TradingPair]
+        fields: list[str]
+        dt: datetime
+        data_frequency: str
+
+        Returns
+        -------
+        ndarray
+
+        """
+        exchange = self.exchanges[exchange_name]
+        return exchange.get_spot_values(assets, fields, dt, data_frequency)
+
 
 class DataPortalExchangeBacktest(DataPortalExchangeBase):
     def __init__(self, *args, **kwargs):
         self.exchange_names = kwargs.pop('exchange_names', None)
+        history_prefetch_length = kwargs.pop('history_prefetch_length', None)
 
         super(DataPortalExchangeBacktest, self).__init__(*args, **kwargs)
 
@@ -256,7 +465,19 @@ class DataPortalExchangeBacktest(DataPortalExchangeBase):
         self.minute_history_loaders = dict()
 
         for name in self.exchange_names:
-            self.exchange_bundles[name] = ExchangeBundle(name)
+            bundle = ExchangeBundle(name)
+            self.exchange_bundles[name] = bundle
+
+            # Prefetching one day of minutes or one month of days
+            # past each history window by default
+            self.minute_history_loaders[name] = ExchangeHistoryLoader(
+                bundle,
+                prefetch_length=history_prefetch_length or 1440
+            )
+            self.history_loaders[name] = ExchangeHistoryLoader(
+                bundle,
+                prefetch_length=history_prefetch_length or 30
+            )
 
     def _get_first_trading_day(self, assets):
         first_date = None
@@ -293,13 +514,41 @@ class DataPortalExchangeBacktest(DataPortalExchangeBase):
         DataFrame
 
         """
-        # TODO: verify that the exchange supports the timeframe
-        bundle = self.exchange_bundles[exchange_name]  # type: ExchangeBundle
+        return self.get_exchange_history_windows(
+            exchange_name,
+            assets,
+            end_dt,
+            bar_count,
+            frequency,
+            [field],
+            data_frequency,
+            ffill,
+        )[field]
+
+    def get_exchange_history_windows(self,
+                                     exchange_name,
+                                     assets,
+                                     end_dt,
+                                     bar_count,
+                                     frequency,
+                                     fields,
+                                     data_frequency,
+                                     ffill=True):
+        """
+        The history windows of several fields, the fields missing from
+        the prefetched blocks are read from the bundle at once.
 
+        Returns
+        -------
+        dict[str, DataFrame]
+
+        """
+        # TODO: verify that the exchange supports the timeframe
         freq, candle_size, unit, adj_data_frequency = get_frequency(
             frequency, data_frequency, supported_freqs=['T', 'D']
         )
         adj_bar_count = candle_size * bar_count
+        candle_data_frequency = adj_data_frequency
 
         if data_frequency == "minute":
             # for minute frequency always request data until the
@@ -316,21 +565,24 @@ class DataPortalExchangeBacktest(DataPortalExchangeBase):
         else:  # data_frequency == "daily":
             last_dt_for_series = end_dt
 
-        series = bundle.get_history_window_series_and_load(
+        if candle_size == 1 and candle_data_frequency == adj_data_frequency:
+            candle_delta = None
+        else:
+            candle_delta = get_delta(candle_size, candle_data_frequency)
+
+        loaders = self.minute_history_loaders \
+            if adj_data_frequency == 'minute' else self.history_loaders
+
+        return loaders[exchange_name].histories(
             assets=assets,
             end_dt=last_dt_for_series,
             bar_count=adj_bar_count,
-            field=field,
+            fields=fields,
             data_frequency=adj_data_frequency,
+            candle_delta=candle_delta,
             algo_end_dt=self._last_available_session,
         )
 
-        start_dt = get_start_dt(last_dt_for_series, adj_bar_count,
-                                adj_data_frequency, False)
-        df = resample_history_df(pd.DataFrame(series), freq, field, start_dt)
-
-        return df
-
     def get_exchange_spot_value(self,
                                 exchange_name,
                                 assets,
@@ -390,3 +642,63 @@ class DataPortalExchangeBacktest(DataPortalExchangeBase):
                 )
         else:
             return bundle.get_spot_values(assets, field, dt, data_frequency)
+
+    def get_exchange_spot_values(self,
+                                 exchange_name,
+                                 assets,
+                                 fields,
+                                 dt,
+                                 data_frequency
+                                 ):
+        """
+        The spot values of several assets and fields read from the
+        exchange bundle at once. Try to ingest data if not in the bundle.
+
+        Parameters
+        ----------
+        exchange_name: str
+        assets: list[TradingPair]
+        fields: list[str]
+        dt: datetime
+        data_frequency: str
+
+        Returns
+        -------
+        ndarray
+
+        """
+        bundle = self.exchange_bundles[exchange_name]
+        if data_frequency == 'daily':
+            dt = dt.floor('1D')
+        else:
+            # Aligning with the left bounded candles like
+            # `get_exchange_spot_value`
+            dt = dt.floor('1 min') - datetime.timedelta(minutes=1)
+
+        if AUTO_INGEST:
+            try:
+                return bundle.get_spot_values_array(
+                    assets, fields, dt, data_frequency
+                )
+            except PricingDataNotLoadedError:
+                log.info(
+                    'pricing data for {symbol} not found on {dt}'
+                    ', updating the bundles.'.format(
+                        symbol=[asset.symbol for asset in assets],
+                        dt=dt
+                    )
+                )
+                bundle.ingest_assets(
+                    assets=assets,
+                    start_dt=self._first_trading_day,
+                    end_dt=self._last_available_session,
+                    data_frequency=data_frequency,
+                    show_progress=True
+                )
+                return bundle.get_spot_values_array(
+                    assets, fields, dt, data_frequency, True
+                )
+        else:
+            return bundle.get_spot_values_array(
+                assets, fields, dt, data_frequency
+            )
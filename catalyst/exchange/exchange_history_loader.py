@@ -0,0 +1,335 @@
+import numpy as np
+import pandas as pd
+from catalyst.constants import LOG_LEVEL
+from catalyst.exchange.exchange_errors import PricingDataNotLoadedError
+from catalyst.exchange.utils.datetime_utils import get_delta, get_start_dt
+from logbook import Logger
+
+log = Logger('ExchangeHistoryLoader', level=LOG_LEVEL)
+
+
+def resample_history_array(values, dts, candle_delta, field):
+    """
+    Resample an array of OHLCV bars into left closed and left labeled
+    candles.
+
+    The candles are anchored at midnight of the first bar like the
+    pandas resampler so the result matches `resample_history_df`.
+
+    Parameters
+    ----------
+    values: ndarray
+        The bars with shape (len(dts), assets).
+    dts: DatetimeIndex
+        The bar dates, sorted.
+    candle_delta: timedelta
+        The candle size.
+    field: str
+
+    Returns
+    -------
+    ndarray, DatetimeIndex
+        The candles and their labels.
+
+    """
+    if len(dts) == 0:
+        return values, dts
+
+    size = pd.Timedelta(candle_delta).value
+    origin = dts[0].floor('1D').value
+
+    bins = (dts.asi8 - origin) // size
+    starts = np.flatnonzero(np.r_[True, bins[1:] != bins[:-1]])
+    ends = np.r_[starts[1:], len(bins)]
+    labels = pd.DatetimeIndex(
+        origin + bins[starts] * size, tz=dts.tz
+    )
+
+    valid = ~np.isnan(values)
+    rows = np.arange(len(dts)).reshape(-1, 1)
+
+    if field == 'open' or field == 'close':
+        if field == 'open':
+            positions = np.where(valid, rows, len(dts))
+            found = np.minimum.reduceat(positions, starts, axis=0)
+            has_value = found < ends.reshape(-1, 1)
+        else:
+            positions = np.where(valid, rows, -1)
+            found = np.maximum.reduceat(positions, starts, axis=0)
+            has_value = found >= starts.reshape(-1, 1)
+
+        columns = np.arange(values.shape[1])
+        out = values[np.clip(found, 0, len(dts) - 1), columns]
+        out[~has_value] = np.nan
+
+    elif field == 'high':
+        out = np.fmax.reduceat(values, starts, axis=0)
+
+    elif field == 'low':
+        out = np.fmin.reduceat(values, starts, axis=0)
+
+    elif field == 'volume':
+        out = np.add.reduceat(np.where(valid, values, 0), starts, axis=0)
+        counts = np.add.reduceat(valid.astype(np.int64), starts, axis=0)
+        out[counts == 0] = np.nan
+
+    else:
+        raise ValueError('Invalid field.')
+
+    return out, labels
+
+
+class HistoryBlock(object):
+    """
+    A prefetched block of bars for a single field.
+
+    Parameters
+    ----------
+    values: ndarray
+        The bars with shape (len(dts), len(assets)).
+    dts: DatetimeIndex
+    assets: list[TradingPair]
+    start_dt: pd.Timestamp
+        The requested start of the block.
+    end_dt: pd.Timestamp
+        The last bar of the block.
+    """
+
+    def __init__(self, values, dts, assets, start_dt, end_dt):
+        self.values = values
+        self.dts = dts
+        self.assets = assets
+        self.start_dt = start_dt
+        self.end_dt = end_dt
+        self.columns = {
+            asset.sid: index for index, asset in enumerate(assets)
+        }
+
+    def covers(self, assets, start_dt, end_dt):
+        if start_dt < self.start_dt or end_dt > self.end_dt:
+            return False
+
+        return all(asset.sid in self.columns for asset in assets)
+
+    def get(self, assets, start_dt, end_dt):
+        """
+        The bars of the assets between the two dates, inclusive.
+
+        Returns
+        -------
+        ndarray, DatetimeIndex
+
+        """
+        start = self.dts.searchsorted(start_dt)
+        end = self.dts.searchsorted(end_dt, side='right')
+
+        columns = [self.columns[asset.sid] for asset in assets]
+        return self.values[start:end, columns], self.dts[start:end]
+
+
+class ExchangeHistoryLoader(object):
+    """
+    Sliding window loader of price history for an exchange bundle.
+
+    Each history request loads a block of bars reaching
+    `prefetch_length` bars beyond the requested window. Later windows
+    covered by the block are served as slices of the array without
+    touching the bundle. Resampled candles, including the partial last
+    daily candle built from minute bars, are computed over the slice.
+
+    Parameters
+    ----------
+    bundle: ExchangeBundle
+    prefetch_length: int
+        The number of bars to load past the end of a window.
+    """
+
+    def __init__(self, bundle, prefetch_length=1440):
+        self.bundle = bundle
+        self.prefetch_length = prefetch_length
+        self._blocks = dict()
+
+    def _get_block_end(self, assets, end_dt, data_frequency, algo_end_dt):
+        block_end = end_dt + get_delta(self.prefetch_length, data_frequency)
+
+        if algo_end_dt is not None:
+            last_dt = algo_end_dt.floor('1D')
+            if data_frequency == 'minute':
+                last_dt += pd.Timedelta(hours=23, minutes=59)
+
+            block_end = min(block_end, last_dt)
+
+        block_end = min(
+            block_end,
+            pd.Timestamp.utcnow().floor(
+                '1 min' if data_frequency == 'minute' else '1D'
+            )
+        )
+
+        for asset in assets:
+            asset_end = asset.end_minute if data_frequency == 'minute' \
+                else asset.end_daily
+            if isinstance(asset_end, pd.Timestamp):
+                block_end = min(block_end, asset_end)
+
+        return max(block_end, end_dt)
+
+    def _load(self, assets, end_dt, bar_count, fields, data_frequency,
+              algo_end_dt):
+        frames = self.bundle.get_history_window_frames_and_load(
+            assets=assets,
+            end_dt=end_dt,
+            bar_count=bar_count,
+            fields=fields,
+            data_frequency=data_frequency,
+            algo_end_dt=algo_end_dt,
+        )
+
+        values = dict()
+        dts = None
+        for field in fields:
+            df = frames[field]
+            columns = {asset.sid: asset for asset in df.columns}
+            values[field] = np.column_stack(
+                [df[columns[asset.sid]].values for asset in assets]
+            )
+            dts = df.index
+
+        return values, dts
+
+    def _get_blocks(self, assets, start_dt, end_dt, fields, data_frequency,
+                    algo_end_dt):
+        blocks = dict()
+        missing = []
+        for field in fields:
+            block = self._blocks.get((field, data_frequency))
+            if block is not None and block.covers(assets, start_dt, end_dt):
+                blocks[field] = block
+            else:
+                missing.append(field)
+
+        if not missing:
+            return blocks
+
+        # Keeping the assets of the previous blocks to avoid
+        # reloading when alternating between asset lists.
+        block_assets = list(assets)
+        sids = set(asset.sid for asset in assets)
+        for field in missing:
+            block = self._blocks.get((field, data_frequency))
+            if block is None or block.start_dt > start_dt:
+                continue
+
+            for asset in block.assets:
+                if asset.sid not in sids:
+                    sids.add(asset.sid)
+                    block_assets.append(asset)
+
+        block_end = self._get_block_end(
+            block_assets, end_dt, data_frequency, algo_end_dt
+        )
+        bar_count = int(
+            (block_end - start_dt) // get_delta(1, data_frequency)
+        ) + 1
+
+        # The missing fields are read from the bundle together
+        try:
+            values, dts = self._load(
+                block_assets, block_end, bar_count, missing, data_frequency,
+                algo_end_dt
+            )
+
+        except PricingDataNotLoadedError as e:
+            if block_end == end_dt and len(block_assets) == len(assets):
+                raise
+
+            log.debug('unable to prefetch history: {}'.format(e))
+            block_assets = list(assets)
+            block_end = end_dt
+            bar_count = int(
+                (block_end - start_dt) // get_delta(1, data_frequency)
+            ) + 1
+            values, dts = self._load(
+                block_assets, block_end, bar_count, missing, data_frequency,
+                algo_end_dt
+            )
+
+        for field in missing:
+            block = HistoryBlock(
+                values[field], dts, block_assets, start_dt, block_end
+            )
+            self._blocks[(field, data_frequency)] = block
+            blocks[field] = block
+
+        return blocks
+
+    def history(self, assets, end_dt, bar_count, field, data_frequency,
+                candle_delta=None, algo_end_dt=None):
+        """
+        A window of bars ending at the specified date, optionally
+        resampled into larger candles.
+
+        Parameters
+        ----------
+        assets: list[TradingPair]
+        end_dt: pd.Timestamp
+            The last bar of the window.
+        bar_count: int
+            The number of bars in the bundle frequency.
+        field: str
+        data_frequency: str
+            The frequency of the bundle to read.
+        candle_delta: timedelta
+            The candle size, no resampling is done when None.
+        algo_end_dt: pd.Timestamp
+            The last session of the algorithm, no bars are loaded past it.
+
+        Returns
+        -------
+        DataFrame
+
+        """
+        return self.histories(
+            assets, end_dt, bar_count, [field], data_frequency,
+            candle_delta, algo_end_dt
+        )[field]
+
+    def histories(self, assets, end_dt, bar_count, fields, data_frequency,
+                  candle_delta=None, algo_end_dt=None):
+        """
+        The windows of several fields, the fields missing from the
+        prefetched blocks are loaded with a single read of the bundle.
+
+        See `history` for the parameters.
+
+        Returns
+        -------
+        dict[str, DataFrame]
+
+        """
+        start_dt = get_start_dt(end_dt, bar_count, data_frequency, False)
+
+        blocks = self._get_blocks(
+            assets, start_dt, end_dt, fields, data_frequency, algo_end_dt
+        )
+
+        frames = dict()
+        for field in fields:
+            values, dts = blocks[field].get(assets, start_dt, end_dt)
+
+            if candle_delta is not None:
+                values, dts = resample_history_array(
+                    values, dts, candle_delta, field
+                )
+                if len(dts) > 0:
+                    keep = dts >= start_dt
+                    values, dts = values[keep], dts[keep]
+
+            frames[field] = pd.DataFrame(
+                values, index=dts, columns=list(assets)
+            )
+
+        return frames
+
+    def clear(self):
+        self._blocks = dict()
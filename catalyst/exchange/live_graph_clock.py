@@ -1,19 +1,14 @@
-from time import sleep
-
 import pandas as pd
 from catalyst.constants import LOG_LEVEL
+from catalyst.exchange.simple_clock import MonotonicTimeSource, SimpleClock
 from catalyst.exchange.utils.stats_utils import prepare_stats
-from catalyst.gens.sim_engine import (
-    BAR,
-    SESSION_START,
-    SESSION_END,
-)
+from catalyst.gens.sim_engine import BAR
 from logbook import Logger
 
 log = Logger('LiveGraphClock', level=LOG_LEVEL)
 
 
-class LiveGraphClock(object):
+class LiveGraphClock(SimpleClock):
     """Realtime clock for live trading.
 
     This class is a drop-in replacement for
@@ -40,57 +35,36 @@ class LiveGraphClock(object):
     """
 
     def __init__(self, sessions, context, callback=None,
-                 time_skew=pd.Timedelta('0s'), start=None, end=None):
-
-        self.sessions = sessions
-        self.time_skew = time_skew
-        self._last_emit = None
-        self._before_trading_start_bar_yielded = True
+                 time_skew=pd.Timedelta('0s'), start=None, end=None,
+                 bar_interval=pd.Timedelta('1T'), time_source=None):
+
+        super(LiveGraphClock, self).__init__(
+            sessions,
+            time_skew=time_skew,
+            start=start,
+            end=end,
+            bar_interval=bar_interval,
+            time_source=time_source,
+        )
         self.context = context
         self.callback = callback
-        self.start = start
-        self.end = end
 
-    def __iter__(self):
+    def _default_time_source(self):
         from matplotlib import pyplot as plt
 
-        self.handle_late_start()
-        yield pd.Timestamp.utcnow(), SESSION_START
+        # I can't use the "animate" reactive approach here because
+        # I need to yield from the main loop.
 
-        while True:
-            current_time = pd.Timestamp.utcnow()
-            current_minute = current_time.floor('1T')
+        # Workaround: https://stackoverflow.com/a/33050617/814633
+        return MonotonicTimeSource(sleep=plt.pause)
 
-            if self.end is not None and current_minute >= self.end:
-                break
-            if self._last_emit is None or current_minute > self._last_emit:
-                log.debug('emitting minutely bar: {}'.format(current_minute))
-
-                self._last_emit = current_minute
-                yield current_minute, BAR
+    def __iter__(self):
+        for dt, action in super(LiveGraphClock, self).__iter__():
+            yield dt, action
 
+            if action == BAR and self.callback is not None:
                 recorded_cols = list(self.context.recorded_vars.keys())
                 df, _ = prepare_stats(
                     self.context.frame_stats, recorded_cols=recorded_cols
                 )
                 self.callback(self.context, df)
-
-            else:
-                # I can't use the "animate" reactive approach here because
-                # I need to yield from the main loop.
-
-                # Workaround: https://stackoverflow.com/a/33050617/814633
-                plt.pause(1)
-
-        yield current_minute, SESSION_END
-
-    def handle_late_start(self):
-        if self.start:
-            time_diff = (self.start - pd.Timestamp.utcnow())
-            log.info(
-                'The algorithm is waiting for the specified '
-                'start date: {}'.format(self.start))
-            sleep(time_diff.seconds)
-
-            while pd.Timestamp.utcnow() < self.start:
-                pass
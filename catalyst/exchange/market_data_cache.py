@@ -0,0 +1,282 @@
+import os
+import pickle
+from collections import OrderedDict
+
+import pandas as pd
+from catalyst.constants import LOG_LEVEL
+from catalyst.exchange.utils.datetime_utils import get_periods_range
+from catalyst.utils.paths import ensure_directory
+from logbook import Logger
+
+log = Logger('MarketDataCache', level=LOG_LEVEL)
+
+
+class MarketDataCache(object):
+    """
+    Cache of the live market data of an exchange.
+
+    Tickers are served for `ticker_ttl` seconds. The candles of each
+    (symbol, frequency) are kept in a rolling buffer which is topped up
+    with the candles newer than its last one. The in-progress candle is
+    refreshed at most every `candles_ttl` seconds within a bar.
+
+    When a folder is specified, the entries are also saved to files so
+    the algorithms running on the same machine share them.
+
+    Parameters
+    ----------
+    exchange: Exchange
+    ticker_ttl: float
+        The number of seconds a ticker is valid.
+    candles_ttl: float
+        The number of seconds the candles are valid within a bar.
+    max_candles: int
+        The minimum number of candles kept in each buffer.
+    folder: str, optional
+        The folder of the entries shared between processes.
+    """
+
+    def __init__(self, exchange, ticker_ttl=5, candles_ttl=30,
+                 max_candles=1440, folder=None):
+        self.exchange = exchange
+        self.ticker_ttl = pd.Timedelta(seconds=ticker_ttl)
+        self.candles_ttl = pd.Timedelta(seconds=candles_ttl)
+        self.max_candles = max_candles
+
+        self.folder = folder
+        if folder is not None:
+            self.folder = os.path.join(folder, exchange.name)
+            ensure_directory(self.folder)
+
+        self._tickers = dict()
+        self._candles = dict()
+
+    def _get_filename(self, key):
+        return os.path.join(
+            self.folder, '{}.p'.format('_'.join(str(k) for k in key))
+        )
+
+    def _read_entry(self, cache, key):
+        entry = cache.get(key)
+        if self.folder is None:
+            return entry
+
+        filename = self._get_filename(key)
+        try:
+            with open(filename, 'rb') as handle:
+                shared = pickle.load(handle)
+
+        except (IOError, OSError, EOFError, pickle.UnpicklingError):
+            return entry
+
+        if entry is None or shared['fetched'] > entry['fetched']:
+            cache[key] = entry = shared
+
+        return entry
+
+    def _write_entry(self, cache, key, entry):
+        cache[key] = entry
+        if self.folder is None:
+            return
+
+        filename = self._get_filename(key)
+        tmp_filename = '{}.{}'.format(filename, os.getpid())
+        try:
+            with open(tmp_filename, 'wb') as handle:
+                pickle.dump(
+                    entry, handle, protocol=pickle.HIGHEST_PROTOCOL
+                )
+            os.rename(tmp_filename, filename)
+
+        except (IOError, OSError) as e:
+            log.warn('unable to share market data {}: {}'.format(key, e))
+
+    def tickers(self, assets):
+        """
+        The tickers of the assets, only the expired ones are fetched.
+
+        Parameters
+        ----------
+        assets: list[TradingPair]
+
+        Returns
+        -------
+        dict[TradingPair, dict[str, Object]]
+
+        """
+        now = pd.Timestamp.utcnow()
+
+        tickers = dict()
+        missing = []
+        for asset in assets:
+            key = ('ticker', asset.symbol)
+            entry = self._read_entry(self._tickers, key)
+            if entry is not None and now - entry['fetched'] < self.ticker_ttl:
+                tickers[asset] = entry['ticker']
+            else:
+                missing.append(asset)
+
+        if missing:
+            fetched = self.exchange.tickers(missing)
+            for asset in fetched:
+                tickers[asset] = fetched[asset]
+                self._write_entry(
+                    self._tickers,
+                    ('ticker', asset.symbol),
+                    dict(fetched=now, ticker=fetched[asset]),
+                )
+
+        return OrderedDict(
+            (asset, tickers[asset]) for asset in assets if asset in tickers
+        )
+
+    def _is_fresh(self, entry, freq, now, end_dt):
+        if end_dt is not None and end_dt <= entry['end_dt'].floor(freq):
+            # All the candles up to end_dt were complete
+            return True
+
+        return entry['end_dt'] == entry['fetched'] and \
+            now - entry['fetched'] < self.candles_ttl and \
+            now.floor(freq) == entry['fetched'].floor(freq)
+
+    def get_candles_frames(self, freq, assets, bar_count=1, start_dt=None,
+                           end_dt=None):
+        """
+        The candles of the assets served from the buffers. Only the
+        candles missing from the buffers are fetched.
+
+        See `Exchange.get_candles_frames` for the parameters.
+
+        Returns
+        -------
+        dict[TradingPair, DataFrame]
+
+        """
+        if not isinstance(assets, list):
+            assets = [assets]
+
+        if start_dt is not None:
+            return self.exchange.get_candles_frames(
+                freq, assets, bar_count, start_dt=start_dt
+            )
+
+        now = pd.Timestamp.utcnow()
+        window_start = get_periods_range(
+            end_dt=end_dt if end_dt is not None else now,
+            periods=bar_count,
+            freq=freq,
+        )[0]
+
+        frames = dict()
+        entries = dict()
+        to_load = []
+        to_update = dict()
+        for asset in assets:
+            key = ('candles', asset.symbol, freq)
+            entry = self._read_entry(self._candles, key)
+
+            if entry is None or entry['start_dt'] > window_start:
+                to_load.append(asset)
+
+            elif self._is_fresh(entry, freq, now, end_dt):
+                frames[asset] = entry['frame']
+
+            else:
+                # The last candle is fetched again since it was
+                # in-progress the last time.
+                frame = entry['frame']
+                since = frame.index[-1] if len(frame) > 0 \
+                    else entry['start_dt']
+                to_update.setdefault(since, []).append(asset)
+                entries[asset] = entry
+
+        if to_load:
+            fetched = self.exchange.get_candles_frames(
+                freq, to_load, bar_count, end_dt=end_dt
+            )
+            for asset in to_load:
+                frames[asset] = self._save_candles(
+                    asset, freq, window_start, fetched[asset], now,
+                    end_dt if end_dt is not None else now, bar_count,
+                )
+
+        for since, group in to_update.items():
+            fetched = self._fetch_candles_since(freq, group, since, now)
+            for asset in group:
+                frame = entries[asset]['frame']
+                new_frame = fetched[asset]
+                if len(new_frame) > 0:
+                    frame = pd.concat([
+                        frame[frame.index < new_frame.index[0]], new_frame
+                    ])
+
+                frames[asset] = self._save_candles(
+                    asset, freq, entries[asset]['start_dt'], frame, now,
+                    now, bar_count,
+                )
+
+        return frames
+
+    def _fetch_candles_since(self, freq, assets, since, now):
+        """
+        The candles of the assets from `since` up to `now`. The exchange
+        may return fewer candles than requested, the following ones are
+        then fetched from the last candle returned.
+
+        Returns
+        -------
+        dict[TradingPair, DataFrame]
+
+        """
+        frames = dict()
+        pending = {since: assets}
+        while pending:
+            since, group = pending.popitem()
+            periods = max(len(get_periods_range(
+                start_dt=since, end_dt=now, freq=freq
+            )), 1)
+            fetched = self.exchange.get_candles_frames(
+                freq, group, periods, start_dt=since
+            )
+            for asset in group:
+                new_frame = fetched[asset]
+                if asset not in frames:
+                    frames[asset] = new_frame
+
+                if len(new_frame) == 0:
+                    continue
+
+                frame = frames[asset]
+                frames[asset] = pd.concat([
+                    frame[frame.index < new_frame.index[0]], new_frame
+                ])
+
+                last_dt = new_frame.index[-1]
+                if len(new_frame) < periods and since < last_dt and \
+                        last_dt < now.floor(freq):
+                    pending.setdefault(last_dt, []).append(asset)
+
+        return frames
+
+    def _save_candles(self, asset, freq, start_dt, frame, fetched, end_dt,
+                      bar_count=0):
+        size = max(self.max_candles, bar_count)
+        if len(frame) > size:
+            frame = frame.iloc[-size:]
+            start_dt = frame.index[0]
+
+        self._write_entry(
+            self._candles,
+            ('candles', asset.symbol, freq),
+            dict(
+                start_dt=start_dt,
+                end_dt=end_dt,
+                frame=frame,
+                fetched=fetched,
+            ),
+        )
+        return frame
+
+    def clear(self):
+        self._tickers = dict()
+        self._candles = dict()
@@ -22,9 +22,38 @@ from catalyst.gens.sim_engine import (
 )
 from logbook import Logger
 
+try:
+    from time import monotonic
+except ImportError:
+    # python 2
+    from time import time as monotonic
+
 log = Logger('ExchangeClock', level=LOG_LEVEL)
 
 
+class MonotonicTimeSource(object):
+    """The current UTC time, measured with a monotonic timer.
+
+    The time is the wall clock time at creation plus the monotonic time
+    elapsed since then, so it never jumps when the system clock is set.
+
+    Parameters
+    ----------
+    sleep : callable, optional
+        The function called to wait for a number of seconds.
+    """
+
+    def __init__(self, sleep=sleep):
+        self.sleep = sleep
+        self._origin = monotonic()
+        self._origin_dt = pd.Timestamp.utcnow()
+
+    def now(self):
+        return self._origin_dt + pd.Timedelta(
+            seconds=monotonic() - self._origin
+        )
+
+
 class SimpleClock(object):
     """Realtime clock for live trading.
 
@@ -32,14 +61,26 @@ class SimpleClock(object):
     :class:`zipline.gens.sim_engine.MinuteSimulationClock`.
 
     This is a stripped down version because crypto exchanges run
-    around the clock.
+    around the clock. A BAR is emitted at each multiple of `bar_interval`,
+    the clock sleeps until the next one in between. The sessions are the
+    UTC days, a SESSION_END and a SESSION_START are emitted between the
+    bars of two sessions.
+
+    When a bar is handled in more than `bar_interval`, the bars elapsed in
+    the meantime are skipped: only the latest one is emitted and the
+    skipped ones are logged and counted in `skipped_bars`.
 
     The :param:`time_skew` parameter represents the time difference between
     the Broker and the live trading machine's clock.
+
+    The :param:`time_source` parameter provides the current time through
+    `now()` and the waits through `sleep(seconds)`, a MonotonicTimeSource
+    by default.
     """
 
     def __init__(self, sessions, time_skew=pd.Timedelta("0s"), start=None,
-                 end=None):
+                 end=None, bar_interval=pd.Timedelta('1T'),
+                 time_source=None):
 
         self.sessions = sessions
         self.time_skew = time_skew
@@ -48,33 +89,83 @@ class SimpleClock(object):
         self.start = start
         self.end = end
 
+        self.bar_interval = pd.Timedelta(bar_interval)
+        if self.bar_interval <= pd.Timedelta(0):
+            raise ValueError(
+                'bar_interval must be positive, got {}'.format(bar_interval)
+            )
+
+        self.time_source = time_source
+        self.skipped_bars = 0
+
+    def _default_time_source(self):
+        return MonotonicTimeSource()
+
+    def _floor(self, dt):
+        """The start of the bar interval of the given time."""
+        step = self.bar_interval.value
+        return pd.Timestamp(dt.value - dt.value % step, tz='UTC')
+
+    def _sleep_until(self, dt):
+        while True:
+            remaining = (dt - self.time_source.now()).total_seconds()
+            if remaining <= 0:
+                return
+
+            self.time_source.sleep(remaining)
+
     def __iter__(self):
+        if self.time_source is None:
+            self.time_source = self._default_time_source()
+
         self.handle_late_start()
-        yield pd.Timestamp.utcnow(), SESSION_START
+
+        now = self.time_source.now()
+        session = now.floor('1D')
+        yield now, SESSION_START
 
         while True:
-            current_time = pd.Timestamp.utcnow()
-            current_minute = current_time.floor('1 min')
+            if self._last_emit is not None:
+                self._sleep_until(self._last_emit + self.bar_interval)
 
-            if self.end is not None and current_minute >= self.end:
+            current_bar = self._floor(self.time_source.now())
+            if self.end is not None and current_bar >= self.end:
                 break
-            if self._last_emit is None or current_minute > self._last_emit:
-                log.debug('emitting minutely bar: {}'.format(current_minute))
 
-                self._last_emit = current_minute
-                yield current_minute, BAR
-            else:
-                sleep(1)
-
-        yield current_minute, SESSION_END
+            if self._last_emit is not None:
+                skipped = \
+                    (current_bar - self._last_emit) // self.bar_interval - 1
+                if skipped > 0:
+                    self.skipped_bars += skipped
+                    log.warn(
+                        'skipped {} bars before {}, the previous bar took '
+                        'longer than {} to handle'.format(
+                            skipped, current_bar, self.bar_interval
+                        )
+                    )
+
+            current_session = current_bar.floor('1D')
+            if current_session > session:
+                # The session ends on its last emitted bar, so the events
+                # stay in order whatever the bar interval
+                if self._last_emit is not None:
+                    session_end = self._last_emit
+                else:
+                    session_end = current_session - self.bar_interval
+                yield session_end, SESSION_END
+                yield current_session, SESSION_START
+                session = current_session
+
+            log.debug('emitting bar: {}'.format(current_bar))
+
+            self._last_emit = current_bar
+            yield current_bar, BAR
+
+        yield current_bar, SESSION_END
 
     def handle_late_start(self):
         if self.start:
-            time_diff = (self.start - pd.Timestamp.utcnow())
             log.info(
                 'The algorithm is waiting for the specified '
                 'start date: {}'.format(self.start))
-            sleep(time_diff.seconds)
-
-            while pd.Timestamp.utcnow() < self.start:
-                pass
+            self._sleep_until(self.start)
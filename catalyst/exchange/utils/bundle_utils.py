@@ -1,5 +1,9 @@
 import os
+import shutil
 import tarfile
+from bisect import bisect_right
+from io import BytesIO
+from threading import Lock
 
 import numpy as np
 import pandas as pd
@@ -10,9 +14,12 @@ from catalyst.exchange.utils.exchange_utils import get_exchange_bundles_folder
 
 EXCHANGE_NAMES = ['bitfinex', 'bittrex', 'poloniex', 'binance']
 API_URL = 'http://data.enigma.co/api/v1'
+BUNDLES_URL = 'https://s3.amazonaws.com/enigmaco/catalyst-bundles/' \
+              'exchange-{exchange}'
 
 
-def get_bcolz_chunk(exchange_name, symbol, data_frequency, period):
+def get_bcolz_chunk(exchange_name, symbol, data_frequency, period,
+                    source=None):
     """
     Download and extract a bcolz bundle.
 
@@ -22,6 +29,9 @@ def get_bcolz_chunk(exchange_name, symbol, data_frequency, period):
     symbol: str
     data_frequency: str
     period: str
+    source: str, optional
+        A local directory containing the chunk tarballs, used in place
+        of the remote bucket.
 
     Returns
     -------
@@ -39,18 +49,272 @@ def get_bcolz_chunk(exchange_name, symbol, data_frequency, period):
     path = os.path.join(root, name)
 
     if not os.path.isdir(path):
-        url = 'https://s3.amazonaws.com/enigmaco/catalyst-bundles/' \
-              'exchange-{exchange}/{name}.tar.gz'.format(
-                exchange=exchange_name,
-                name=name)
+        if source is not None and os.path.isdir(source):
+            filename = os.path.join(source, '{}.tar.gz'.format(name))
+            with open(filename, 'rb') as f:
+                bytes = BytesIO(f.read())
+
+        else:
+            url = '{root}/{name}.tar.gz'.format(
+                root=(source or BUNDLES_URL).format(exchange=exchange_name),
+                name=name
+            )
+            bytes = download_without_progress(url)
+
+        # Extracting in a temp folder first, an interrupted extraction
+        # must not leave a partial chunk that would be picked up later.
+        temp_path = '{}.part'.format(path)
+        if os.path.isdir(temp_path):
+            shutil.rmtree(temp_path)
 
-        bytes = download_without_progress(url)
         with tarfile.open('r', fileobj=bytes) as tar:
-            tar.extractall(path)
+            tar.extractall(temp_path)
+
+        os.rename(temp_path, path)
 
     return path
 
 
+class ChunkManifest(object):
+    """
+    An append-only record of the (symbol, period) chunks fully merged
+    into an exchange bundle.
+
+    Each completed chunk is written as one line and flushed right away
+    so an interrupted ingestion can resume without downloading the
+    chunks which were already merged. A partially written last line
+    is ignored when reading.
+
+    Parameters
+    ----------
+    path: str
+        The manifest file.
+
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._chunks = set()
+        self._lock = Lock()
+
+        if os.path.isfile(path):
+            with open(path, 'r') as f:
+                for line in f:
+                    if not line.endswith('\n'):
+                        continue
+
+                    parts = line.split()
+                    if len(parts) == 2:
+                        self._chunks.add(tuple(parts))
+
+    def __contains__(self, chunk):
+        return tuple(chunk) in self._chunks
+
+    def __len__(self):
+        return len(self._chunks)
+
+    def add(self, symbol, period):
+        """
+        Record a completed chunk.
+
+        Parameters
+        ----------
+        symbol: str
+        period: str
+
+        """
+        with self._lock:
+            if (symbol, period) in self._chunks:
+                return
+
+            with open(self.path, 'a') as f:
+                f.write('{} {}\n'.format(symbol, period))
+                f.flush()
+                os.fsync(f.fileno())
+
+            self._chunks.add((symbol, period))
+
+    def clear(self):
+        with self._lock:
+            if os.path.isfile(self.path):
+                os.remove(self.path)
+
+            self._chunks = set()
+
+
+class CoverageIndex(object):
+    """
+    A persistent record of the date ranges of each sid ingested into
+    an exchange bundle.
+
+    The ranges of each sid are kept sorted and merged so checking the
+    coverage of a date range is a binary search. Each added range is
+    written as one line and flushed right away, a partially written
+    last line is ignored when reading.
+
+    Parameters
+    ----------
+    path: str
+        The index file.
+    data_frequency: str
+        The frequency of the bars, two ranges one bar apart are merged.
+
+    """
+
+    def __init__(self, path, data_frequency):
+        self.path = path
+        self.step = pd.Timedelta(
+            minutes=1 if data_frequency == 'minute' else 60 * 24
+        ).value
+        self._ranges = dict()
+        self._lock = Lock()
+
+        if os.path.isfile(path):
+            with open(path, 'r') as f:
+                for line in f:
+                    if not line.endswith('\n'):
+                        continue
+
+                    parts = line.split()
+                    if len(parts) == 3:
+                        sid, start, end = [int(part) for part in parts]
+                        self._insert(sid, start, end)
+
+    def __contains__(self, sid):
+        return sid in self._ranges
+
+    def __len__(self):
+        return len(self._ranges)
+
+    def _insert(self, sid, start, end):
+        ranges = self._ranges.setdefault(sid, [])
+
+        # The ranges overlapping or adjacent to the new one are merged
+        index = bisect_right(ranges, [start, end])
+        if index > 0 and ranges[index - 1][1] + self.step >= start:
+            index -= 1
+
+        last = index
+        while last < len(ranges) and ranges[last][0] <= end + self.step:
+            start = min(start, ranges[last][0])
+            end = max(end, ranges[last][1])
+            last += 1
+
+        ranges[index:last] = [[start, end]]
+
+    def add(self, sid, start_dt, end_dt):
+        """
+        Record an ingested date range.
+
+        Parameters
+        ----------
+        sid: int
+        start_dt: pd.Timestamp
+        end_dt: pd.Timestamp
+
+        """
+        start = pd.Timestamp(start_dt).value
+        end = pd.Timestamp(end_dt).value
+        if start > end:
+            return
+
+        with self._lock:
+            with open(self.path, 'a') as f:
+                f.write('{} {} {}\n'.format(sid, start, end))
+                f.flush()
+                os.fsync(f.fileno())
+
+            self._insert(sid, start, end)
+
+    def ranges(self, sid):
+        """
+        The ingested date ranges of a sid.
+
+        Parameters
+        ----------
+        sid: int
+
+        Returns
+        -------
+        list[tuple[pd.Timestamp, pd.Timestamp]]
+
+        """
+        return [
+            (pd.Timestamp(start, tz='UTC'), pd.Timestamp(end, tz='UTC'))
+            for start, end in self._ranges.get(sid, [])
+        ]
+
+    def gaps(self, sid, start_dt, end_dt):
+        """
+        The parts of a date range which were not ingested.
+
+        Parameters
+        ----------
+        sid: int
+        start_dt: pd.Timestamp
+        end_dt: pd.Timestamp
+
+        Returns
+        -------
+        list[tuple[pd.Timestamp, pd.Timestamp]]
+
+        """
+        start = pd.Timestamp(start_dt).value
+        end = pd.Timestamp(end_dt).value
+
+        gaps = []
+        ranges = self._ranges.get(sid, [])
+        index = max(bisect_right(ranges, [start, start]) - 1, 0)
+        while start <= end and index < len(ranges):
+            range_start, range_end = ranges[index]
+            if range_start > end:
+                break
+
+            if range_start > start:
+                gaps.append((start, range_start - self.step))
+
+            start = max(start, range_end + self.step)
+            index += 1
+
+        if start <= end:
+            gaps.append((start, end))
+
+        return [
+            (pd.Timestamp(start, tz='UTC'), pd.Timestamp(end, tz='UTC'))
+            for start, end in gaps
+        ]
+
+    def covers(self, sid, start_dt, end_dt):
+        """
+        Whether a date range was fully ingested.
+
+        Parameters
+        ----------
+        sid: int
+        start_dt: pd.Timestamp
+        end_dt: pd.Timestamp
+
+        Returns
+        -------
+        bool
+
+        """
+        start = pd.Timestamp(start_dt).value
+        end = pd.Timestamp(end_dt).value
+
+        ranges = self._ranges.get(sid, [])
+        index = bisect_right(ranges, [start, float('inf')]) - 1
+        return index >= 0 and ranges[index][0] <= start \
+            and ranges[index][1] >= end
+
+    def clear(self):
+        with self._lock:
+            if os.path.isfile(self.path):
+                os.remove(self.path)
+
+            self._ranges = dict()
+
+
 def get_df_from_arrays(arrays, periods):
     """
     A DataFrame from the specified OHCLV arrays.
@@ -111,6 +375,36 @@ def range_in_bundle(asset, start_dt, end_dt, reader):
     return has_data
 
 
+def ingested_range(sid, reader):
+    """
+    The date range between the first and last bars of a sid in a bundle.
+
+    Parameters
+    ----------
+    sid: int
+    reader: BcolzMinuteBarReader
+
+    Returns
+    -------
+    tuple[pd.Timestamp, pd.Timestamp]
+        None if the bundle has no data for the sid.
+
+    """
+    try:
+        closes = reader._open_minute_file('close', sid)[:]
+    except Exception:
+        return None
+
+    positions = np.flatnonzero(closes)
+    if len(positions) == 0:
+        return None
+
+    return (
+        reader._pos_to_minute(positions[0]),
+        reader._pos_to_minute(positions[-1]),
+    )
+
+
 def get_assets(exchange, include_symbols, exclude_symbols):
     """
     Get assets from an exchange, including or excluding the specified
@@ -0,0 +1,276 @@
+import copy
+import os
+import pickle
+from collections import OrderedDict
+
+import catalyst.protocol as zp
+from catalyst.constants import LOG_LEVEL
+from catalyst.exchange.utils.stats_store import read_journal
+from catalyst.finance.performance.position import positiondict
+from catalyst.utils.paths import ensure_directory
+from logbook import Logger
+
+log = Logger('AlgoCheckpoint', level=LOG_LEVEL)
+
+SNAPSHOT_NAME = 'snapshot.p'
+JOURNAL_NAME = 'journal.p'
+
+
+class AlgoCheckpoint(object):
+    """
+    Crash-safe key-value checkpoint of the state of an algorithm.
+
+    Each save appends the entries which changed since the previous save
+    to a journal in a single record, a record truncated by a crash is
+    ignored on load. The journal is periodically compacted into a
+    snapshot written to a temporary file and atomically renamed.
+
+    Parameters
+    ----------
+    folder: str
+        The checkpoint root folder.
+    compact_every: int
+        The number of saves between compactions.
+    """
+
+    def __init__(self, folder, compact_every=1440):
+        self.folder = folder
+        self.compact_every = compact_every
+
+        self.snapshot_filename = os.path.join(folder, SNAPSHOT_NAME)
+        self.journal_filename = os.path.join(folder, JOURNAL_NAME)
+        ensure_directory(folder)
+
+        # The serialized value of each entry
+        self._records = self._load_records()
+        self._saves = 0
+
+    def _load_records(self):
+        records = dict()
+        if os.path.isfile(self.snapshot_filename):
+            with open(self.snapshot_filename, 'rb') as handle:
+                records = pickle.load(handle)
+
+        for changes in read_journal(self.journal_filename):
+            for key, data in changes:
+                if data is None:
+                    records.pop(key, None)
+                else:
+                    records[key] = data
+
+        return records
+
+    def __len__(self):
+        return len(self._records)
+
+    def load(self):
+        """
+        The de-serialized entries of the checkpoint.
+
+        Returns
+        -------
+        dict[tuple, Object]
+
+        """
+        return {
+            key: pickle.loads(data) for key, data in self._records.items()
+        }
+
+    def save(self, entries, frozen=None):
+        """
+        Save the entries which changed since the last save.
+
+        Parameters
+        ----------
+        entries: dict[tuple, Object]
+            All the entries of the state, missing keys are removed.
+        frozen: callable[tuple -> bool]
+            The saved entries for which this is True are assumed
+            unchanged and not serialized again.
+
+        """
+        changes = []
+        for key, obj in entries.items():
+            if frozen is not None and key in self._records and frozen(key):
+                continue
+
+            data = pickle.dumps(obj, protocol=pickle.HIGHEST_PROTOCOL)
+            if self._records.get(key) != data:
+                changes.append((key, data))
+
+        changes.extend(
+            (key, None) for key in self._records if key not in entries
+        )
+
+        if changes:
+            with open(self.journal_filename, 'ab') as handle:
+                pickle.dump(
+                    changes, handle, protocol=pickle.HIGHEST_PROTOCOL
+                )
+                handle.flush()
+                os.fsync(handle.fileno())
+
+            for key, data in changes:
+                if data is None:
+                    del self._records[key]
+                else:
+                    self._records[key] = data
+
+        self._saves += 1
+        if self._saves >= self.compact_every:
+            self.compact()
+
+    def compact(self):
+        """
+        Replace the snapshot and journal by a new snapshot.
+
+        """
+        tmp_filename = self.snapshot_filename + '.part'
+        with open(tmp_filename, 'wb') as handle:
+            pickle.dump(
+                self._records, handle, protocol=pickle.HIGHEST_PROTOCOL
+            )
+            handle.flush()
+            os.fsync(handle.fileno())
+
+        # The journal is replayed over the new snapshot if a crash
+        # happens before its removal, which has no effect.
+        os.rename(tmp_filename, self.snapshot_filename)
+        if os.path.isfile(self.journal_filename):
+            os.remove(self.journal_filename)
+
+        self._saves = 0
+
+
+def perf_period_entries(name, period):
+    """
+    Split a performance period into checkpoint entries so its
+    transactions and orders are saved separately. The position
+    tracker is left out.
+
+    Parameters
+    ----------
+    name: str
+    period: PerformancePeriod
+
+    Returns
+    -------
+    dict[tuple, Object]
+
+    """
+    stripped = copy.copy(period)
+    stripped.processed_transactions = dict()
+    stripped.orders_by_modified = dict()
+    stripped.orders_by_id = OrderedDict()
+    stripped._position_tracker = None
+    # Caches filled each time the portfolio is requested
+    stripped._portfolio_store = zp.Portfolio()
+    stripped._account_store = zp.Account()
+
+    entries = {(name,): stripped}
+    for dt, transactions in period.processed_transactions.items():
+        entries[(name, 'transactions', dt)] = transactions
+
+    for order_id, order in period.orders_by_id.items():
+        entries[(name, 'orders', order_id)] = order
+
+    entries[(name, 'order_ids')] = list(period.orders_by_id.keys())
+
+    for dt, orders in period.orders_by_modified.items():
+        entries[(name, 'orders_by_modified', dt)] = list(orders.keys())
+
+    return entries
+
+
+def restore_perf_period(name, entries):
+    """
+    The performance period saved with `perf_period_entries`.
+
+    Parameters
+    ----------
+    name: str
+    entries: dict[tuple, Object]
+
+    Returns
+    -------
+    PerformancePeriod
+
+    """
+    period = entries.get((name,))
+    if period is None:
+        return None
+
+    orders = dict()
+    modified = dict()
+    for key, value in entries.items():
+        if len(key) != 3 or key[0] != name:
+            continue
+
+        if key[1] == 'transactions':
+            period.processed_transactions[key[2]] = value
+        elif key[1] == 'orders':
+            orders[key[2]] = value
+        elif key[1] == 'orders_by_modified':
+            modified[key[2]] = value
+
+    for order_id in entries.get((name, 'order_ids'), []):
+        period.orders_by_id[order_id] = orders[order_id]
+
+    for dt in sorted(modified):
+        period.orders_by_modified[dt] = OrderedDict(
+            (order_id, orders[order_id]) for order_id in modified[dt]
+        )
+
+    return period
+
+
+def position_tracker_entries(tracker):
+    """
+    Split a position tracker into checkpoint entries so each position
+    is saved separately.
+
+    Parameters
+    ----------
+    tracker: PositionTracker
+
+    Returns
+    -------
+    dict[tuple, Object]
+
+    """
+    stripped = copy.copy(tracker)
+    stripped.positions = positiondict()
+    stripped._positions_store = zp.Positions()
+    stripped.touched_assets = set()
+
+    entries = {
+        ('position_tracker',): stripped,
+        ('position_assets',): list(tracker.positions.keys()),
+    }
+    for asset, position in tracker.positions.items():
+        entries[('positions', asset)] = position
+
+    return entries
+
+
+def restore_position_tracker(entries):
+    """
+    The position tracker saved with `position_tracker_entries`.
+
+    Parameters
+    ----------
+    entries: dict[tuple, Object]
+
+    Returns
+    -------
+    PositionTracker
+
+    """
+    tracker = entries.get(('position_tracker',))
+    if tracker is None:
+        return None
+
+    for asset in entries.get(('position_assets',), []):
+        tracker.positions[asset] = entries[('positions', asset)]
+
+    return tracker
@@ -12,6 +12,7 @@ from six.moves.urllib import request
 
 from catalyst.constants import DATE_FORMAT, SYMBOLS_URL
 from catalyst.exchange.exchange_errors import ExchangeSymbolsNotFound
+from catalyst.exchange.utils.stats_store import AlgoStatsStore
 from catalyst.exchange.utils.serialization_utils import ExchangeJSONEncoder, \
     ExchangeJSONDecoder
 from catalyst.utils.memoize import weak_lru_cache
@@ -408,6 +409,9 @@ def get_algo_df(algo_name, key, environ=None, rel_path=None):
     if rel_path is not None:
         folder = os.path.join(folder, rel_path)
 
+    if os.path.isdir(os.path.join(folder, key)):
+        return AlgoStatsStore(os.path.join(folder, key)).read()
+
     filename = os.path.join(folder, key + '.csv')
 
     if os.path.isfile(filename):
@@ -444,6 +448,52 @@ def save_algo_df(algo_name, key, df, environ=None, rel_path=None):
         df.to_csv(handle, encoding='UTF_8')
 
 
+def get_algo_stats_store(algo_name, key, environ=None, rel_path=None,
+                         compact_every=1440):
+    """
+    The append-only statistics store of an algo name and key.
+
+    The rows of a csv file previously saved with `save_algo_df` under
+    the same key are moved into the store.
+
+    Parameters
+    ----------
+    algo_name: str
+    key: str
+    environ:
+    rel_path: str
+    compact_every: int
+
+    Returns
+    -------
+    AlgoStatsStore
+
+    """
+    folder = get_algo_folder(algo_name, environ)
+    if rel_path is not None:
+        folder = os.path.join(folder, rel_path)
+        ensure_directory(folder)
+
+    filename = os.path.join(folder, key + '.csv')
+    legacy_df = None
+    if os.path.isfile(filename) and \
+            not os.path.isdir(os.path.join(folder, key)):
+        legacy_df = get_algo_df(algo_name, key, environ, rel_path)
+
+    store = AlgoStatsStore(
+        os.path.join(folder, key), compact_every=compact_every
+    )
+
+    if legacy_df is not None:
+        for dt, row in legacy_df.iterrows():
+            store.append(dt, row.dropna().to_dict())
+
+        store.compact()
+        os.remove(filename)
+
+    return store
+
+
 def clear_frame_stats_directory(algo_name):
     """
     remove the outdated directory
@@ -782,6 +832,9 @@ def forward_fill_df_if_needed(df, periods):
 
 
 def transform_candles_to_df(candles):
+    if isinstance(candles, pd.DataFrame):
+        return candles
+
     return pd.DataFrame(candles).set_index('last_traded')
 
 
@@ -0,0 +1,219 @@
+import numbers
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+from six import iteritems
+
+# The stats holding a list of items for each bar
+RAGGED_STATS = ('positions', 'transactions', 'orders')
+
+# The kinds of columns
+FLOAT = 'float'
+DATETIME = 'datetime'
+OBJECT = 'object'
+
+NAT = np.iinfo(np.int64).min
+
+MISSING = {
+    FLOAT: np.nan,
+    DATETIME: NAT,
+    OBJECT: None,
+}
+
+DTYPES = {
+    FLOAT: np.float64,
+    DATETIME: np.int64,
+    OBJECT: object,
+}
+
+
+def _column_kind(value):
+    if isinstance(value, (bool, np.bool_)):
+        return OBJECT
+
+    if isinstance(value, numbers.Real):
+        return FLOAT
+
+    if isinstance(value, datetime):
+        return DATETIME
+
+    return OBJECT
+
+
+class FrameStatsRecorder(object):
+    """
+    The stats of each bar recorded in preallocated columns.
+
+    The numbers are kept in float arrays and the dates in int64 arrays of
+    nanoseconds, the other values in object arrays. The positions, orders
+    and transactions of all the bars are kept in flat lists with the
+    offsets of each bar, so recording a bar only writes a row.
+
+    Parameters
+    ----------
+    capacity: int
+        The number of bars for which the columns are allocated, they grow
+        as needed.
+
+    """
+
+    def __init__(self, capacity=1024):
+        self._capacity = max(int(capacity), 1)
+        self._size = 0
+
+        self._columns = dict()
+        self._kinds = dict()
+        self._timezones = dict()
+        # Whether all the values of a float column are integers
+        self._integral = dict()
+        # The stats recorded without any value yet
+        self._empty = set()
+
+        self._items = {name: [] for name in RAGGED_STATS}
+        self._offsets = {
+            name: np.zeros(self._capacity + 1, dtype=np.int64)
+            for name in RAGGED_STATS
+        }
+
+    def __len__(self):
+        return self._size
+
+    def _grow(self):
+        capacity = 2 * self._capacity
+        for name, column in iteritems(self._columns):
+            grown = np.full(
+                capacity, MISSING[self._kinds[name]], dtype=column.dtype
+            )
+            grown[:self._capacity] = column
+            self._columns[name] = grown
+
+        for name, offsets in iteritems(self._offsets):
+            grown = np.zeros(capacity + 1, dtype=np.int64)
+            grown[:self._capacity + 1] = offsets
+            self._offsets[name] = grown
+
+        self._capacity = capacity
+
+    def _add_column(self, name, kind):
+        self._columns[name] = np.full(
+            self._capacity, MISSING[kind], dtype=DTYPES[kind]
+        )
+        self._kinds[name] = kind
+        # The rows recorded before the column have no value
+        self._integral[name] = self._size == 0
+
+    def _to_object(self, name):
+        column = self._columns[name]
+        if self._kinds[name] == DATETIME:
+            values = column.astype(object)
+            for row in np.flatnonzero(column != NAT):
+                values[row] = pd.Timestamp(
+                    column[row], tz=self._timezones.get(name)
+                )
+            values[column == NAT] = None
+        else:
+            values = column.astype(object)
+            values[np.isnan(column)] = None
+
+        self._columns[name] = values
+        self._kinds[name] = OBJECT
+
+    def _set(self, name, row, value):
+        kind = self._kinds[name]
+
+        if value is None:
+            self._integral[name] = False
+            return
+
+        if kind != OBJECT and _column_kind(value) != kind:
+            # A stat which changes type is kept as is
+            self._to_object(name)
+            kind = OBJECT
+
+        if kind == FLOAT:
+            self._integral[name] &= isinstance(value, numbers.Integral)
+            self._columns[name][row] = value
+
+        elif kind == DATETIME:
+            value = pd.Timestamp(value)
+            self._timezones.setdefault(name, value.tz)
+            self._columns[name][row] = value.value
+
+        else:
+            self._columns[name][row] = value
+
+    def record(self, stats):
+        """
+        Record the stats of a bar.
+
+        Parameters
+        ----------
+        stats: dict[str, Object]
+            The stats by name, the positions, transactions and orders are
+            lists.
+
+        """
+        if self._size == self._capacity:
+            self._grow()
+
+        row = self._size
+        for name, value in iteritems(stats):
+            if name in self._items:
+                self._items[name].extend(value)
+                continue
+
+            if name not in self._columns:
+                if value is None:
+                    # The kind of the column is known at its first value
+                    self._empty.add(name)
+                    continue
+
+                self._add_column(name, _column_kind(value))
+
+            self._set(name, row, value)
+
+        for name, offsets in iteritems(self._offsets):
+            offsets[row + 1] = len(self._items[name])
+
+        for name in self._integral:
+            if name not in stats:
+                self._integral[name] = False
+
+        self._size += 1
+
+    def to_frame(self):
+        """
+        The recorded stats, one row per bar.
+
+        Returns
+        -------
+        pd.DataFrame
+
+        """
+        size = self._size
+
+        data = dict()
+        for name, column in iteritems(self._columns):
+            values = column[:size]
+            kind = self._kinds[name]
+            if kind == DATETIME:
+                values = pd.DatetimeIndex(values.view('M8[ns]'))
+                tz = self._timezones.get(name)
+                if tz is not None:
+                    values = values.tz_localize('UTC').tz_convert(tz)
+            elif kind == FLOAT and self._integral[name]:
+                values = values.astype(np.int64)
+
+            data[name] = values
+
+        for name in self._empty.difference(self._columns):
+            data[name] = np.full(size, None, dtype=object)
+
+        for name, items in iteritems(self._items):
+            offsets = self._offsets[name]
+            data[name] = [
+                items[offsets[row]:offsets[row + 1]] for row in range(size)
+            ]
+
+        return pd.DataFrame(data, columns=sorted(data), copy=False)
@@ -0,0 +1,282 @@
+import json
+import os
+import pickle
+import shutil
+
+import pandas as pd
+from catalyst.constants import LOG_LEVEL
+from catalyst.utils.paths import ensure_directory
+from logbook import Logger
+
+log = Logger('StatsStore', level=LOG_LEVEL)
+
+JOURNAL_NAME = 'journal.p'
+SEGMENTS_FOLDER = 'segments'
+META_NAME = 'meta.json'
+INDEX_NAME = 'index.p'
+
+
+def read_journal(filename):
+    """
+    The records of an append-only journal. A truncated last record
+    left by a crash is removed so new records can be appended.
+
+    Parameters
+    ----------
+    filename: str
+
+    Returns
+    -------
+    list[tuple[pd.Timestamp, dict]]
+
+    """
+    records = []
+    if not os.path.isfile(filename):
+        return records
+
+    truncate_at = None
+    with open(filename, 'rb') as handle:
+        while True:
+            position = handle.tell()
+            try:
+                records.append(pickle.load(handle))
+            except EOFError:
+                if handle.tell() > position:
+                    truncate_at = position
+                break
+            except Exception as e:
+                log.warn(
+                    'removing the truncated end of {}: {}'.format(filename, e)
+                )
+                truncate_at = position
+                break
+
+    if truncate_at is not None:
+        with open(filename, 'r+b') as handle:
+            handle.truncate(truncate_at)
+
+    return records
+
+
+class AlgoStatsStore(object):
+    """
+    Append-only store of per-bar statistics.
+
+    Each appended row is written to a journal so the cost of a bar does
+    not depend on the size of the history. The journal is periodically
+    compacted into an immutable segment holding one file per column so
+    readers can load the columns they need only.
+
+    Parameters
+    ----------
+    folder: str
+        The store root folder.
+    compact_every: int
+        The number of journal rows which triggers a compaction.
+    """
+
+    def __init__(self, folder, compact_every=1440):
+        self.folder = folder
+        self.compact_every = compact_every
+
+        self.journal_filename = os.path.join(folder, JOURNAL_NAME)
+        self.segments_folder = os.path.join(folder, SEGMENTS_FOLDER)
+        ensure_directory(self.segments_folder)
+
+        self._segments = self._load_segments()
+
+        # Rows of the journal already compacted before a crash
+        # are skipped.
+        last_dt = self._segments[-1]['end'] if self._segments else None
+        self._journal = [
+            record for record in read_journal(self.journal_filename)
+            if last_dt is None or record[0] > last_dt
+        ]
+
+    def _load_segments(self):
+        segments = []
+        for name in sorted(os.listdir(self.segments_folder)):
+            path = os.path.join(self.segments_folder, name)
+            meta_filename = os.path.join(path, META_NAME)
+            if not os.path.isfile(meta_filename):
+                # Leftover of an interrupted compaction
+                shutil.rmtree(path, ignore_errors=True)
+                continue
+
+            with open(meta_filename) as handle:
+                meta = json.load(handle)
+
+            segments.append(dict(
+                path=path,
+                columns=meta['columns'],
+                count=meta['count'],
+                start=pd.Timestamp(meta['start']),
+                end=pd.Timestamp(meta['end']),
+            ))
+
+        return segments
+
+    def __len__(self):
+        return sum(s['count'] for s in self._segments) + len(self._journal)
+
+    @property
+    def columns(self):
+        columns = []
+        for segment in self._segments:
+            columns.extend(
+                c for c in segment['columns'] if c not in columns
+            )
+        for _, row in self._journal:
+            columns.extend(c for c in row if c not in columns)
+
+        return columns
+
+    def append(self, dt, row):
+        """
+        Append the statistics of a bar.
+
+        Parameters
+        ----------
+        dt: pd.Timestamp
+        row: dict[str, Object]
+
+        """
+        record = (pd.Timestamp(dt), dict(row))
+        with open(self.journal_filename, 'ab') as handle:
+            pickle.dump(record, handle, protocol=pickle.HIGHEST_PROTOCOL)
+
+        self._journal.append(record)
+
+        if len(self._journal) >= self.compact_every:
+            self.compact()
+
+    def compact(self):
+        """
+        Move the journal rows into a new columnar segment.
+
+        """
+        if not self._journal:
+            return
+
+        dts = [record[0] for record in self._journal]
+        df = pd.DataFrame(
+            [record[1] for record in self._journal], index=dts
+        )
+
+        last = self._segments[-1]['path'] if self._segments else None
+        seq = int(os.path.basename(last)) + 1 if last is not None else 0
+        path = os.path.join(self.segments_folder, '{:08d}'.format(seq))
+        tmp_path = path + '.part'
+        if os.path.exists(tmp_path):
+            shutil.rmtree(tmp_path)
+        ensure_directory(tmp_path)
+
+        pd.to_pickle(df.index, os.path.join(tmp_path, INDEX_NAME))
+
+        columns = list(df.columns)
+        for position, column in enumerate(columns):
+            pd.to_pickle(
+                df[column],
+                os.path.join(tmp_path, '{}.p'.format(position))
+            )
+
+        segment = dict(
+            path=path,
+            columns=columns,
+            count=len(df),
+            start=min(dts),
+            end=max(dts),
+        )
+        with open(os.path.join(tmp_path, META_NAME), 'w') as handle:
+            json.dump(dict(
+                columns=columns,
+                count=segment['count'],
+                start=segment['start'].isoformat(),
+                end=segment['end'].isoformat(),
+            ), handle)
+
+        os.rename(tmp_path, path)
+        self._segments.append(segment)
+
+        os.remove(self.journal_filename)
+        self._journal = []
+
+    def _read_segment(self, segment, columns):
+        index = pd.read_pickle(os.path.join(segment['path'], INDEX_NAME))
+
+        data = dict()
+        for position, column in enumerate(segment['columns']):
+            if columns is None or column in columns:
+                data[column] = pd.read_pickle(
+                    os.path.join(segment['path'], '{}.p'.format(position))
+                )
+
+        return pd.DataFrame(data, index=index)
+
+    def read(self, columns=None, start_dt=None):
+        """
+        The stored statistics.
+
+        Parameters
+        ----------
+        columns: list[str]
+            The columns to load, all columns when None.
+        start_dt: pd.Timestamp
+            The segments ending before this date are not loaded.
+
+        Returns
+        -------
+        DataFrame
+
+        """
+        frames = [
+            self._read_segment(segment, columns)
+            for segment in self._segments
+            if start_dt is None or segment['end'] >= start_dt
+        ]
+
+        if self._journal:
+            df = pd.DataFrame(
+                [record[1] for record in self._journal],
+                index=[record[0] for record in self._journal],
+            )
+            if columns is not None:
+                df = df[[c for c in df.columns if c in columns]]
+
+            frames.append(df)
+
+        if not frames:
+            return pd.DataFrame()
+
+        df = pd.concat(frames) if len(frames) > 1 else frames[0]
+        if columns is not None:
+            df = df[[c for c in columns if c in df.columns]]
+
+        if start_dt is not None:
+            df = df[df.index >= start_dt]
+
+        return df
+
+    def drop_before(self, dt):
+        """
+        Remove the segments ending before the specified date.
+
+        Parameters
+        ----------
+        dt: pd.Timestamp
+
+        """
+        segments = []
+        for segment in self._segments:
+            if segment['end'] < dt:
+                shutil.rmtree(segment['path'], ignore_errors=True)
+            else:
+                segments.append(segment)
+
+        self._segments = segments
+
+    def clear(self):
+        shutil.rmtree(self.folder, ignore_errors=True)
+        ensure_directory(self.segments_folder)
+        self._segments = []
+        self._journal = []
@@ -362,36 +362,52 @@ class Blotter(object):
         commissions = []
 
         if self.open_orders:
-            for asset, asset_orders in iteritems(self.open_orders):
-                slippage = self.slippage_models[type(asset)]
+            for order, txn in self.simulate_fills(bar_data):
+                commission = self.commission_models[type(order.asset)]
+                additional_commission = commission.calculate(order, txn)
 
-                for order, txn in \
-                        slippage.simulate(bar_data, asset, asset_orders):
-                    commission = self.commission_models[type(asset)]
-                    additional_commission = commission.calculate(order, txn)
+                if additional_commission > 0:
+                    commissions.append({
+                        "asset": order.asset,
+                        "order": order,
+                        "cost": additional_commission
+                    })
 
-                    if additional_commission > 0:
-                        commissions.append({
-                            "asset": order.asset,
-                            "order": order,
-                            "cost": additional_commission
-                        })
+                order.filled += txn.amount
+                order.commission += additional_commission
 
-                    order.filled += txn.amount
-                    order.commission += additional_commission
+                order.dt = txn.dt
 
-                    order.dt = txn.dt
+                # added for stats
+                txn.commission = additional_commission
 
-                    # added for stats
-                    txn.commission = additional_commission
+                transactions.append(txn)
 
-                    transactions.append(txn)
-
-                    if not order.open:
-                        closed_orders.append(order)
+                if not order.open:
+                    closed_orders.append(order)
 
         return transactions, commissions, closed_orders
 
+    def simulate_fills(self, bar_data):
+        """
+        Simulates the fills of the current open orders with the slippage
+        model of each asset type.
+
+        Parameters
+        ----------
+        bar_data: catalyst._protocol.BarData
+
+        Returns
+        -------
+        iterator[(Order, Transaction)]
+        """
+        for asset, asset_orders in iteritems(self.open_orders):
+            slippage = self.slippage_models[type(asset)]
+
+            for order, txn in \
+                    slippage.simulate(bar_data, asset, asset_orders):
+                yield order, txn
+
     def prune_orders(self, closed_orders):
         """
         Removes all given orders from the blotter's open_orders list.
@@ -32,10 +32,12 @@ Position Tracking
 """
 
 from __future__ import division
+from copy import copy
 from math import copysign
 from collections import OrderedDict
 import numpy as np
 import logbook
+from six import iteritems, itervalues
 
 from catalyst.assets import Future, Asset
 from catalyst.utils.input_validation import expect_types
@@ -45,18 +47,70 @@ from catalyst.constants import LOG_LEVEL
 log = logbook.Logger('Performance', level=LOG_LEVEL)
 
 
+def _to_python(value):
+    return value.item() if isinstance(value, np.generic) else value
+
+
+def _stored(name):
+    """
+    An attribute of a position kept in the arrays of its positiondict
+    while the position is held in one.
+    """
+    local = '_' + name
+
+    def fget(self):
+        if self._store is None:
+            return getattr(self, local)
+        return self._store.arrays[name][self._row]
+
+    def fset(self, value):
+        if self._store is None:
+            setattr(self, local, value)
+        else:
+            self._store.arrays[name][self._row] = value
+
+    return property(fget, fset)
+
+
 class Position(object):
 
     @expect_types(asset=Asset)
     def __init__(self, asset, amount=0, cost_basis=0.0,
                  last_sale_price=0.0, last_sale_date=None):
 
+        self._store = None
+        self._row = None
+
         self.asset = asset
         self.amount = amount
         self.cost_basis = cost_basis  # per share
         self.last_sale_price = last_sale_price
         self.last_sale_date = last_sale_date
 
+    amount = _stored('amount')
+    cost_basis = _stored('cost_basis')
+    last_sale_price = _stored('last_sale_price')
+
+    def __getstate__(self):
+        # A copy of a position is never bound to the arrays of the original
+        return {
+            'asset': self.asset,
+            'amount': _to_python(self.amount),
+            'cost_basis': _to_python(self.cost_basis),
+            'last_sale_price': _to_python(self.last_sale_price),
+            'last_sale_date': self.last_sale_date,
+        }
+
+    def __setstate__(self, state):
+        self._store = None
+        self._row = None
+
+        self.asset = state['asset']
+        self.amount = state['amount']
+        self.cost_basis = state['cost_basis']
+        self.last_sale_price = state['last_sale_price']
+        self.last_sale_date = state['last_sale_date']
+
     def earn_dividend(self, dividend):
         """
         Register the number of shares we held at this dividend's ex date so
@@ -215,5 +269,147 @@ last_sale_price: {last_sale_price}"
 
 
 class positiondict(OrderedDict):
+    """
+    The positions by asset.
+
+    The sid, amount, cost basis, last sale price and multiplier of the
+    positions are kept in parallel arrays, one row per position, so that
+    the positions can be priced and summed without walking them. The
+    positions held read and write their row.
+    """
+    FIELDS = (
+        ('sid', np.int64),
+        ('amount', np.float64),
+        ('cost_basis', np.float64),
+        ('last_sale_price', np.float64),
+        ('multiplier', np.float64),
+        ('is_future', np.bool_),
+    )
+
+    def __init__(self, *args, **kwargs):
+        self.arrays = {
+            name: np.empty(0, dtype=dtype) for name, dtype in self.FIELDS
+        }
+        self._rows = []
+        super(positiondict, self).__init__(*args, **kwargs)
+
     def __missing__(self, key):
         return None
+
+    def column(self, name):
+        """
+        The values of a field for all the positions, in the order of their
+        rows.
+
+        Parameters
+        ----------
+        name: str
+
+        Returns
+        -------
+        ndarray
+
+        """
+        return self.arrays[name][:len(self._rows)]
+
+    @property
+    def row_positions(self):
+        """
+        The positions in the order of their rows.
+        """
+        return self._rows
+
+    def _grow(self):
+        capacity = max(2 * len(self._rows), 8)
+        for name, array in iteritems(self.arrays):
+            grown = np.zeros(capacity, dtype=array.dtype)
+            grown[:len(array)] = array
+            self.arrays[name] = grown
+
+    def _bind(self, position):
+        if position._store is not None:
+            raise ValueError(
+                'position of {} is already held'.format(position.asset)
+            )
+
+        if len(self._rows) == len(self.arrays['sid']):
+            self._grow()
+
+        row = len(self._rows)
+        asset = position.asset
+        is_future = isinstance(asset, Future)
+
+        arrays = self.arrays
+        arrays['sid'][row] = asset.sid
+        arrays['amount'][row] = position.amount
+        arrays['cost_basis'][row] = position.cost_basis
+        arrays['last_sale_price'][row] = position.last_sale_price
+        arrays['multiplier'][row] = asset.multiplier if is_future else 1.0
+        arrays['is_future'][row] = is_future
+
+        position._store = self
+        position._row = row
+        self._rows.append(position)
+
+    def _release(self, position):
+        row = position._row
+        state = position.__getstate__()
+        position.__setstate__(state)
+
+        # The last row fills the hole
+        last = len(self._rows) - 1
+        if row != last:
+            for array in itervalues(self.arrays):
+                array[row] = array[last]
+
+            moved = self._rows[last]
+            moved._row = row
+            self._rows[row] = moved
+
+        self._rows.pop()
+
+    def __setitem__(self, key, position):
+        previous = OrderedDict.get(self, key)
+        if previous is position:
+            return
+
+        if previous is not None:
+            self._release(previous)
+
+        self._bind(position)
+        super(positiondict, self).__setitem__(key, position)
+
+    def __delitem__(self, key):
+        position = OrderedDict.__getitem__(self, key)
+        super(positiondict, self).__delitem__(key)
+        self._release(position)
+
+    def pop(self, key, *default):
+        if key not in self:
+            if default:
+                return default[0]
+            raise KeyError(key)
+
+        position = OrderedDict.__getitem__(self, key)
+        del self[key]
+        return position
+
+    def popitem(self, last=True):
+        if not self:
+            raise KeyError('dictionary is empty')
+
+        key = next(reversed(self)) if last else next(iter(self))
+        return key, self.pop(key)
+
+    def clear(self):
+        for position in self._rows:
+            position.__setstate__(position.__getstate__())
+
+        self._rows = []
+        super(positiondict, self).clear()
+
+    def __reduce__(self):
+        # The copies of the positions are bound to the new arrays
+        return self.__class__, (
+            [(key, copy(position)) for key, position in self.items()],
+        )
@@ -20,7 +20,7 @@ import numpy as np
 from collections import namedtuple
 from math import isnan
 
-from six import iteritems, itervalues
+from six import iteritems
 
 from catalyst.finance.performance.position import Position
 from catalyst.finance.transaction import Transaction
@@ -122,9 +122,29 @@ class PositionTracker(object):
         self._unpaid_dividends = {}
         self._unpaid_stock_dividends = {}
         self._positions_store = zp.Positions()
+        # The assets whose position changed since the last
+        # `pop_touched_assets`
+        self.touched_assets = set()
 
         self.data_frequency = data_frequency
 
+    def __setstate__(self, state):
+        # Trackers pickled by previous versions do not track the changes
+        state.setdefault('touched_assets', set())
+        self.__dict__.update(state)
+
+    def pop_touched_assets(self):
+        """
+        The assets whose position was modified since the previous call.
+
+        Returns
+        -------
+        set[Asset]
+
+        """
+        touched, self.touched_assets = self.touched_assets, set()
+        return touched
+
     @expect_types(asset=Asset)
     def update_position(self, asset, amount=None, last_sale_price=None,
                         last_sale_date=None, cost_basis=None):
@@ -143,6 +163,8 @@ class PositionTracker(object):
         if cost_basis is not None:
             position.cost_basis = cost_basis
 
+        self.touched_assets.add(asset)
+
     def execute_transaction(self, txn):
         # Update Position
         # ----------------
@@ -155,6 +177,7 @@ class PositionTracker(object):
             position = self.positions[asset]
 
         position.update(txn)
+        self.touched_assets.add(asset)
 
         if position.amount == 0:
             del self.positions[asset]
@@ -171,6 +194,7 @@ class PositionTracker(object):
         # Adjust the cost basis of the stock if we own it
         if asset in self.positions:
             self.positions[asset].adjust_commission_cost_basis(asset, cost)
+            self.touched_assets.add(asset)
 
     def handle_splits(self, splits):
         """
@@ -195,6 +219,7 @@ class PositionTracker(object):
                 position = self.positions[asset]
                 leftover_cash = position.handle_split(asset, ratio)
                 total_leftover_cash += leftover_cash
+                self.touched_assets.add(asset)
 
         return total_leftover_cash
 
@@ -270,6 +295,7 @@ class PositionTracker(object):
                     Position(payment_asset)
 
             position.amount += share_count
+            self.touched_assets.add(payment_asset)
 
         return net_cash_payment
 
@@ -299,29 +325,30 @@ class PositionTracker(object):
 
         positions = self._positions_store
 
-        for asset, pos in iteritems(self.positions):
+        # Clear out the positions which have become empty or have been
+        # closed since the last time get_positions was called.
+        for asset in [asset for asset in positions
+                      if not self.positions.get(asset)]:
+            del positions[asset]
 
+        for asset, pos in iteritems(self.positions):
             if pos.amount == 0:
-                # Clear out the position if it has become empty since the last
-                # time get_positions was called.  Catching the KeyError is
-                # faster than checking `if asset in positions`, and this can be
-                # potentially called in a tight inner loop.
                 try:
                     del positions[asset]
                 except KeyError:
                     pass
                 continue
 
-            position = zp.Position(asset)
+            # The position objects are refreshed in place
+            position = positions.get(asset)
+            if position is None:
+                position = positions[asset] = zp.Position(asset)
+
             position.amount = pos.amount
             position.cost_basis = pos.cost_basis
             position.last_sale_price = pos.last_sale_price
             position.last_sale_date = pos.last_sale_date
 
-            # Adds the new position if we didn't have one before, or overwrite
-            # one we have currently
-            positions[asset] = position
-
         return positions
 
     def get_positions_list(self):
@@ -333,49 +360,64 @@ class PositionTracker(object):
 
     def sync_last_sale_prices(self, dt, handle_non_market_minutes,
                               data_portal):
-        if not handle_non_market_minutes:
-            for asset, position in iteritems(self.positions):
-                last_sale_price = data_portal.get_spot_value(
-                    asset, 'price', dt, self.data_frequency
-                )
+        positions = self.positions
+        if not positions:
+            return
 
-                if not np.isnan(last_sale_price):
-                    position.last_sale_price = last_sale_price
+        assets = [position.asset for position in positions.row_positions]
+        if not handle_non_market_minutes:
+            # A single request for the prices of all the positions
+            last_sale_prices = np.asarray(
+                data_portal.get_spot_values(
+                    assets, ['price'], dt, self.data_frequency
+                )[:, 0],
+                dtype='float64',
+            )
         else:
-            for asset, position in iteritems(self.positions):
-                last_sale_price = data_portal.get_adjusted_value(
+            previous_minute = data_portal.trading_calendar.previous_minute(dt)
+            last_sale_prices = np.array([
+                data_portal.get_adjusted_value(
                     asset,
                     'price',
-                    data_portal.trading_calendar.previous_minute(dt),
+                    previous_minute,
                     dt,
                     self.data_frequency
-                )
-
-                if not np.isnan(last_sale_price):
-                    position.last_sale_price = last_sale_price
+                ) for asset in assets
+            ], dtype='float64')
+
+        current_prices = positions.column('last_sale_price')
+        changed = ~np.isnan(last_sale_prices) & \
+            (last_sale_prices != current_prices)
+        current_prices[changed] = last_sale_prices[changed]
+        self.touched_assets.update(
+            assets[row] for row in np.flatnonzero(changed)
+        )
 
     def stats(self):
-        amounts = []
-        last_sale_prices = []
-        for pos in itervalues(self.positions):
-            amounts.append(pos.amount)
-            last_sale_prices.append(pos.last_sale_price)
-
-        position_values = calc_position_values(itervalues(self.positions))
-        position_exposures = calc_position_exposures(
-            itervalues(self.positions)
+        positions = self.positions
+        amounts = positions.column('amount')
+        last_sale_prices = positions.column('last_sale_price')
+
+        position_exposures = \
+            amounts * last_sale_prices * positions.column('multiplier')
+        # Futures don't have an inherent position value.
+        position_values = np.where(
+            positions.column('is_future'), 0.0, amounts * last_sale_prices,
         )
 
-        long_value = calc_long_value(position_values)
-        short_value = calc_short_value(position_values)
+        longs = position_exposures > 0
+        shorts = position_exposures < 0
+
+        long_value = position_values[position_values > 0].sum()
+        short_value = position_values[position_values < 0].sum()
         gross_value = calc_gross_value(long_value, short_value)
-        long_exposure = calc_long_exposure(position_exposures)
-        short_exposure = calc_short_exposure(position_exposures)
+        long_exposure = position_exposures[longs].sum()
+        short_exposure = position_exposures[shorts].sum()
         gross_exposure = calc_gross_exposure(long_exposure, short_exposure)
-        net_exposure = calc_net(position_exposures)
-        longs_count = calc_longs_count(position_exposures)
-        shorts_count = calc_shorts_count(position_exposures)
-        net_value = calc_net(position_values)
+        net_exposure = position_exposures.sum()
+        longs_count = int(longs.sum())
+        shorts_count = int(shorts.sum())
+        net_value = position_values.sum()
 
         return PositionStats(
             long_value=long_value,
@@ -78,8 +78,13 @@ log = logbook.Logger('Performance', level=LOG_LEVEL)
 class PerformanceTracker(object):
     """
     Tracks the performance of the algorithm.
+
+    The cumulative risk metrics are recomputed over the whole history
+    on each update unless `streaming_risk` is True, in which case they
+    are updated in constant time from running aggregates.
     """
-    def __init__(self, sim_params, trading_calendar, env):
+    def __init__(self, sim_params, trading_calendar, env,
+                 streaming_risk=False):
         self.sim_params = sim_params
         self.trading_calendar = trading_calendar
         self.asset_finder = env.asset_finder
@@ -111,7 +116,8 @@ class PerformanceTracker(object):
                 risk.RiskMetricsCumulative(
                     self.sim_params,
                     self.treasury_curves,
-                    self.trading_calendar
+                    self.trading_calendar,
+                    streaming=streaming_risk
                 )
         elif self.emission_rate == 'minute':
             self.all_benchmark_returns = pd.Series(index=pd.date_range(
@@ -123,7 +129,8 @@ class PerformanceTracker(object):
                     self.sim_params,
                     self.treasury_curves,
                     self.trading_calendar,
-                    create_first_day_stats=True
+                    create_first_day_stats=True,
+                    streaming=streaming_risk
                 )
 
         # this performance period will span the entire simulation from
@@ -26,6 +26,7 @@ from .risk import (
     check_entry,
     choose_treasury
 )
+from .streaming import StreamingRiskStatistics
 
 from catalyst.patches.stats import (
     alpha_beta_aligned,
@@ -51,6 +52,10 @@ class RiskMetricsCumulative(object):
     :Usage:
         Instantiate RiskMetricsCumulative once.
         Call update() method on each dt to update the metrics.
+
+    When `streaming` is True, the metrics are derived from running
+    aggregates of the returns so each update takes constant time
+    instead of recomputing the metrics over the whole history.
     """
 
     METRIC_NAMES = (
@@ -65,7 +70,7 @@ class RiskMetricsCumulative(object):
     )
 
     def __init__(self, sim_params, treasury_curves, trading_calendar,
-                 create_first_day_stats=False):
+                 create_first_day_stats=False, streaming=False):
         self.treasury_curves = treasury_curves
         self.trading_calendar = trading_calendar
         self.start_session = sim_params.start_session
@@ -143,6 +148,33 @@ class RiskMetricsCumulative(object):
 
         self.num_trading_days = 0
 
+        self.streaming = streaming
+        # The returns of the sessions before the latest one, the latest
+        # session can be updated many times in minute emission.
+        self._stream = StreamingRiskStatistics()
+        self._stream_len = 0
+
+    def _streaming_metrics(self, dt_loc, algorithm_returns,
+                           benchmark_returns):
+        if dt_loc < self._stream_len:
+            # Only happens when going back in time, starting over.
+            self._stream = StreamingRiskStatistics()
+            self._stream_len = 0
+
+        while self._stream_len < dt_loc:
+            self._stream.add(
+                self.algorithm_returns_cont[self._stream_len],
+                self.benchmark_returns_cont[self._stream_len],
+            )
+            self._stream_len += 1
+
+        stream = self._stream.copy()
+        if self.create_first_day_stats and dt_loc == 0:
+            stream.add(0.0, 0.0)
+
+        stream.add(algorithm_returns, benchmark_returns)
+        return stream.metrics()
+
     def update(self, dt, algorithm_returns, benchmark_returns, leverage):
         warnings.filterwarnings('error')
 
@@ -161,13 +193,23 @@ class RiskMetricsCumulative(object):
             if len(self.algorithm_returns) == 1:
                 self.algorithm_returns = np.append(0.0, self.algorithm_returns)
 
-        try:
-            self.algorithm_cumulative_returns[dt_loc] = cum_returns(
-                self.algorithm_returns
-            )[-1]
-        except Exception as e:
-            log.debug('unable to calculate cum returns: {}'.format(e))
-            self.algorithm_cumulative_returns[dt_loc] = np.nan
+        self.benchmark_returns_cont[dt_loc] = benchmark_returns
+
+        if self.streaming:
+            metrics = self._streaming_metrics(
+                dt_loc, algorithm_returns, benchmark_returns
+            )
+            self.algorithm_cumulative_returns[dt_loc] = \
+                metrics['algorithm_cumulative_returns']
+        else:
+            metrics = None
+            try:
+                self.algorithm_cumulative_returns[dt_loc] = cum_returns(
+                    self.algorithm_returns
+                )[-1]
+            except Exception as e:
+                log.debug('unable to calculate cum returns: {}'.format(e))
+                self.algorithm_cumulative_returns[dt_loc] = np.nan
 
         algo_cumulative_returns_to_date = \
             self.algorithm_cumulative_returns[:dt_loc + 1]
@@ -189,22 +231,25 @@ class RiskMetricsCumulative(object):
                 self.annualized_mean_returns = np.append(
                     0.0, self.annualized_mean_returns)
 
-        self.benchmark_returns_cont[dt_loc] = benchmark_returns
         self.benchmark_returns = self.benchmark_returns_cont[:dt_loc + 1]
 
         if self.create_first_day_stats:
             if len(self.benchmark_returns) == 1:
                 self.benchmark_returns = np.append(0.0, self.benchmark_returns)
 
-        try:
-            self.benchmark_cumulative_returns[dt_loc] = cum_returns(
-                self.benchmark_returns
-            )[-1]
-        except Exception as e:
-            log.debug(
-                'unable to calculate benchmark cum returns: {}'.format(e)
-            )
-            self.benchmark_cumulative_returns[dt_loc] = np.nan
+        if metrics is not None:
+            self.benchmark_cumulative_returns[dt_loc] = \
+                metrics['benchmark_cumulative_returns']
+        else:
+            try:
+                self.benchmark_cumulative_returns[dt_loc] = cum_returns(
+                    self.benchmark_returns
+                )[-1]
+            except Exception as e:
+                log.debug(
+                    'unable to calculate benchmark cum returns: {}'.format(e)
+                )
+                self.benchmark_cumulative_returns[dt_loc] = np.nan
 
         benchmark_cumulative_returns_to_date = \
             self.benchmark_cumulative_returns[:dt_loc + 1]
@@ -244,12 +289,6 @@ algorithm_returns ({algo_count}) in range {start} : {end} on {dt}"
             raise Exception(message)
 
         self.update_current_max()
-        self.benchmark_volatility[dt_loc] = annual_volatility(
-            self.benchmark_returns
-        )
-        self.algorithm_volatility[dt_loc] = annual_volatility(
-            self.algorithm_returns
-        )
 
         # caching the treasury rates for the minutely case is a
         # big speedup, because it avoids searching the treasury
@@ -269,49 +308,65 @@ algorithm_returns ({algo_count}) in range {start} : {end} on {dt}"
             self.algorithm_cumulative_returns[dt_loc] -
             self.treasury_period_return)
 
-        self.alpha[dt_loc], self.beta[dt_loc] = alpha_beta_aligned(
-            self.algorithm_returns,
-            self.benchmark_returns,
-        )
-        self.sharpe[dt_loc] = sharpe_ratio(
-            self.algorithm_returns,
-        )
+        if metrics is not None:
+            for name in ('benchmark_volatility', 'algorithm_volatility',
+                         'alpha', 'beta', 'sharpe', 'downside_risk',
+                         'sortino', 'information'):
+                getattr(self, name)[dt_loc] = metrics[name]
 
-        try:
-            self.downside_risk[dt_loc] = downside_risk(
-                self.algorithm_returns
+            self.max_drawdown = metrics['max_drawdown']
+
+        else:
+            self.benchmark_volatility[dt_loc] = annual_volatility(
+                self.benchmark_returns
             )
-        except Exception as e:
-            log.debug(
-                'unable to calculate downside risk returns: {}'.format(e)
+            self.algorithm_volatility[dt_loc] = annual_volatility(
+                self.algorithm_returns
             )
-            self.downside_risk[dt_loc] = np.nan
 
-        try:
-            risk = self.downside_risk[dt_loc]
-            self.sortino[dt_loc] = sortino_ratio(
+            self.alpha[dt_loc], self.beta[dt_loc] = alpha_beta_aligned(
                 self.algorithm_returns,
-                _downside_risk=risk
+                self.benchmark_returns,
             )
-        except Exception as e:
-            log.debug(
-                'unable to calculate benchmark cum returns: {}'.format(e)
+            self.sharpe[dt_loc] = sharpe_ratio(
+                self.algorithm_returns,
             )
-            self.sortino[dt_loc] = np.nan
 
-        self.information[dt_loc] = information_ratio(
-            self.algorithm_returns,
-            self.benchmark_returns,
-        )
-        try:
-            self.max_drawdown = max_drawdown(
-                self.algorithm_returns
-            )
-        except Exception as e:
-            log.debug(
-                'unable to calculate max drawdown: {}'.format(e)
+            try:
+                self.downside_risk[dt_loc] = downside_risk(
+                    self.algorithm_returns
+                )
+            except Exception as e:
+                log.debug(
+                    'unable to calculate downside risk returns: {}'.format(e)
+                )
+                self.downside_risk[dt_loc] = np.nan
+
+            try:
+                risk = self.downside_risk[dt_loc]
+                self.sortino[dt_loc] = sortino_ratio(
+                    self.algorithm_returns,
+                    _downside_risk=risk
+                )
+            except Exception as e:
+                log.debug(
+                    'unable to calculate benchmark cum returns: {}'.format(e)
+                )
+                self.sortino[dt_loc] = np.nan
+
+            self.information[dt_loc] = information_ratio(
+                self.algorithm_returns,
+                self.benchmark_returns,
             )
-            self.max_drawdown = np.nan
+            try:
+                self.max_drawdown = max_drawdown(
+                    self.algorithm_returns
+                )
+            except Exception as e:
+                log.debug(
+                    'unable to calculate max drawdown: {}'.format(e)
+                )
+                self.max_drawdown = np.nan
 
         self.max_drawdowns[dt_loc] = self.max_drawdown
         self.max_leverage = self.calculate_max_leverage()
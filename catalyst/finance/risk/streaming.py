@@ -0,0 +1,201 @@
+#
+# Copyright 2018 Enigma MPC, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from __future__ import division
+
+from copy import deepcopy
+from math import isnan, sqrt
+
+import numpy as np
+
+from catalyst.patches.stats import APPROX_BDAYS_PER_YEAR
+
+
+class RunningMoments(object):
+    """
+    Running count, mean and sum of squared deviations of a series,
+    updated with Welford's method.
+    """
+    __slots__ = ('count', 'mean', 'm2')
+
+    def __init__(self):
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+
+    def add(self, value):
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (value - self.mean)
+
+    def std(self, ddof=1):
+        if self.count - ddof <= 0:
+            return np.nan
+
+        return sqrt(max(self.m2, 0.0) / (self.count - ddof))
+
+
+class RunningCoMoments(object):
+    """
+    Running means, co-moment and second moment of `y` of a pair of
+    series.
+    """
+    __slots__ = ('count', 'mean_x', 'mean_y', 'c_xy', 'm2_y')
+
+    def __init__(self):
+        self.count = 0
+        self.mean_x = 0.0
+        self.mean_y = 0.0
+        self.c_xy = 0.0
+        self.m2_y = 0.0
+
+    def add(self, x, y):
+        self.count += 1
+        dx = x - self.mean_x
+        self.mean_x += dx / self.count
+        dy = y - self.mean_y
+        self.mean_y += dy / self.count
+        self.c_xy += dx * (y - self.mean_y)
+        self.m2_y += dy * (y - self.mean_y)
+
+
+class StreamingRiskStatistics(object):
+    """
+    Running aggregates of the algorithm and benchmark returns from which
+    the cumulative risk metrics are derived in constant time.
+
+    The results follow the conventions of the functions of
+    `catalyst.patches.stats` used by `RiskMetricsCumulative`, nan returns
+    included.
+    """
+
+    def __init__(self):
+        self.count = 0
+
+        self.algorithm_wealth = 1.0
+        self.benchmark_wealth = 1.0
+
+        self.algorithm = RunningMoments()
+        self.benchmark = RunningMoments()
+        self.active = RunningMoments()
+        self.joint = RunningCoMoments()
+        self.downside_squares = 0.0
+
+        self.peak_wealth = -np.inf
+        self.max_drawdown = np.inf
+
+    def add(self, algorithm_returns, benchmark_returns):
+        """
+        Append the returns of a period.
+
+        Parameters
+        ----------
+        algorithm_returns: float
+        benchmark_returns: float
+
+        """
+        self.count += 1
+
+        algo_nan = isnan(algorithm_returns)
+        bench_nan = isnan(benchmark_returns)
+
+        if not algo_nan:
+            self.algorithm_wealth *= 1.0 + algorithm_returns
+            self.algorithm.add(algorithm_returns)
+            if algorithm_returns < 0:
+                self.downside_squares += algorithm_returns ** 2
+
+        if not bench_nan:
+            self.benchmark_wealth *= 1.0 + benchmark_returns
+            self.benchmark.add(benchmark_returns)
+
+        if not algo_nan and not bench_nan:
+            self.active.add(algorithm_returns - benchmark_returns)
+            self.joint.add(algorithm_returns, benchmark_returns)
+
+        if self.algorithm_wealth > self.peak_wealth:
+            self.peak_wealth = self.algorithm_wealth
+
+        drawdown = (self.algorithm_wealth - self.peak_wealth) / \
+            self.peak_wealth
+        if drawdown < self.max_drawdown:
+            self.max_drawdown = drawdown
+
+    def copy(self):
+        return deepcopy(self)
+
+    def metrics(self):
+        """
+        The risk metrics of the returns added so far.
+
+        Returns
+        -------
+        dict[str, float]
+
+        """
+        ann_factor = APPROX_BDAYS_PER_YEAR
+        enough = self.count >= 2
+
+        algorithm_std = self.algorithm.std()
+        benchmark_std = self.benchmark.std()
+
+        sharpe = np.nan
+        if enough and algorithm_std > 0:
+            sharpe = self.algorithm.mean / algorithm_std * sqrt(ann_factor)
+
+        downside_risk = np.nan
+        if self.algorithm.count > 0:
+            downside_risk = sqrt(
+                self.downside_squares / self.algorithm.count
+            ) * sqrt(ann_factor)
+
+        sortino = np.nan
+        if enough and downside_risk > 0:
+            sortino = self.algorithm.mean / downside_risk * ann_factor
+
+        information = np.nan
+        if enough:
+            tracking_error = self.active.std()
+            if isnan(tracking_error):
+                information = 0.0
+            elif tracking_error != 0:
+                information = self.active.mean / tracking_error
+
+        alpha, beta = np.nan, np.nan
+        joint = self.joint
+        if enough and joint.count >= 2 and \
+                abs(joint.m2_y / joint.count) >= 1.0e-30:
+            beta = joint.c_xy / joint.m2_y
+            alpha = (joint.mean_x - beta * joint.mean_y) * ann_factor
+
+        return dict(
+            algorithm_cumulative_returns=self.algorithm_wealth - 1,
+            benchmark_cumulative_returns=self.benchmark_wealth - 1,
+            algorithm_volatility=(
+                algorithm_std * sqrt(ann_factor) if enough else np.nan
+            ),
+            benchmark_volatility=(
+                benchmark_std * sqrt(ann_factor) if enough else np.nan
+            ),
+            alpha=alpha,
+            beta=beta,
+            sharpe=sharpe,
+            downside_risk=downside_risk,
+            sortino=sortino,
+            information=information,
+            max_drawdown=(
+                self.max_drawdown if self.count > 0 else np.nan
+            ),
+        )
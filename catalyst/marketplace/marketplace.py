@@ -3,7 +3,6 @@ from __future__ import print_function
 import glob
 import json
 import os
-import re
 import shutil
 import sys
 import time
@@ -13,7 +12,6 @@ import bcolz
 import logbook
 import pandas as pd
 import requests
-from requests_toolbelt import MultipartDecoder
 from requests_toolbelt.multipart.decoder import \
     NonMultipartContentTypeException
 
@@ -28,12 +26,15 @@ from catalyst.marketplace.marketplace_errors import (
     MarketplaceNoCSVFiles, MarketplaceRequiresPython3)
 from catalyst.marketplace.utils.auth_utils import get_key_secret, \
     get_signed_headers
+from catalyst.marketplace.utils.bundle_utils import append_bundle, \
+    merge_bundles, merge_ctables, read_bundle
 from catalyst.marketplace.utils.eth_utils import bin_hex, from_grains, \
     to_grains
 from catalyst.marketplace.utils.path_utils import get_bundle_folder, \
     get_data_source_folder, get_marketplace_folder, \
     get_user_pubaddr, get_temp_bundles_folder, extract_bundle, \
     save_user_pubaddr
+from catalyst.marketplace.utils.multipart_utils import iter_multipart_files
 from catalyst.utils.paths import ensure_directory
 
 if sys.version_info.major < 3:
@@ -43,6 +44,9 @@ else:
 
 log = logbook.Logger('Marketplace', level=LOG_LEVEL)
 
+# The size of the reads from the ingest response stream
+INGEST_CHUNK_SIZE = 1024 * 1024
+
 
 class Marketplace:
     def __init__(self):
@@ -454,7 +458,7 @@ class Marketplace:
               'catalyst marketplace ingest --dataset={}'.format(
                   dataset, address, dataset))
 
-    def process_temp_bundle(self, ds_name, path):
+    def process_temp_bundle(self, ds_name, path, pending=None):
         """
         Merge the temp bundle into the main bundle for the specified
         data source.
@@ -463,22 +467,60 @@ class Marketplace:
         ----------
         ds_name
         path
+        pending: list[str], optional
+            The extracted temp bundles left to merge. When given, the temp
+            bundle is appended to the main bundle if its rows sort after
+            it, and added to the pending ones otherwise, to be merged at
+            once by `merge_temp_bundles`.
 
         Returns
         -------
 
         """
         tmp_bundle = extract_bundle(path)
+        os.remove(path)
+
         bundle_folder = get_data_source_folder(ds_name)
         ensure_directory(bundle_folder)
-        if os.listdir(bundle_folder):
-            zsource = bcolz.ctable(rootdir=tmp_bundle, mode='r')
-            ztarget = bcolz.ctable(rootdir=bundle_folder, mode='a')
-            ztarget.append(zsource)
+        zsource = bcolz.ctable(rootdir=tmp_bundle, mode='r')
+        if not os.listdir(bundle_folder):
+            merge_ctables([zsource], bundle_folder)
+
+        elif pending is None:
+            ztarget = bcolz.ctable(rootdir=bundle_folder, mode='r')
+            merge_bundles(zsource, ztarget)
 
         else:
-            shutil.rmtree(bundle_folder, ignore_errors=True)
-            os.rename(tmp_bundle, bundle_folder)
+            # The bundles following a pending one are merged after it, so
+            # that their rows still take precedence.
+            if pending or not append_bundle(
+                    zsource, bcolz.ctable(rootdir=bundle_folder, mode='a')):
+                pending.append(tmp_bundle)
+                return
+
+        shutil.rmtree(tmp_bundle, ignore_errors=True)
+
+    def merge_temp_bundles(self, ds_name, tmp_bundles):
+        """
+        Merge extracted temp bundles into the main bundle for the specified
+        data source at once, the rows of the last ones taking precedence.
+
+        Parameters
+        ----------
+        ds_name
+        tmp_bundles: list[str]
+
+        Returns
+        -------
+
+        """
+        bundle_folder = get_data_source_folder(ds_name)
+        ztarget = bcolz.ctable(rootdir=bundle_folder, mode='r')
+        merge_bundles(
+            [bcolz.ctable(rootdir=tmp_bundle, mode='r')
+             for tmp_bundle in reversed(tmp_bundles)],
+            ztarget,
+        )
 
     def ingest(self, ds_name=None, start=None, end=None, force_download=False):
 
@@ -555,34 +597,28 @@ class Marketplace:
             stream=True,
         )
         if r.status_code == 200:
-            log.info('Dataset downloaded successfully. Processing dataset...')
+            log.info('Processing dataset as it downloads...')
             bundle_folder = get_data_source_folder(ds_name)
             shutil.rmtree(bundle_folder, ignore_errors=True)
             target_path = get_temp_bundles_folder()
+            pending = []
             try:
-                decoder = MultipartDecoder.from_response(r)
-                # with maybe_show_progress(
-                #     iter(decoder.parts),
-                #     True,
-                #     label='Processing files') as part:
-                counter = 1
-                for part in decoder.parts:
-                    log.info("Processing file {} of {}".format(
-                        counter, len(decoder.parts)))
-                    h = part.headers[b'Content-Disposition'].decode('utf-8')
-                    # Extracting the filename from the header
-                    name = re.search(r'filename="(.*)"', h).group(1)
-
-                    filename = os.path.join(target_path, name)
-                    with open(filename, 'wb') as f:
-                        # for chunk in part.content.iter_content(
-                        #         chunk_size=1024):
-                        #     if chunk: # filter out keep-alive new chunks
-                        #         f.write(chunk)
-                        f.write(part.content)
-
-                    self.process_temp_bundle(ds_name, filename)
-                    counter += 1
+                # The parts are parsed from the stream and written to disk
+                # as they arrive. Each one is appended to the bundle when
+                # it sorts after it, the other ones are merged at the end.
+                filenames = iter_multipart_files(
+                    r.iter_content(chunk_size=INGEST_CHUNK_SIZE),
+                    r.headers.get('content-type', ''),
+                    target_path,
+                )
+                for counter, filename in enumerate(filenames, 1):
+                    log.info('Processing file {}: {}'.format(
+                        counter, os.path.basename(filename)))
+                    self.process_temp_bundle(ds_name, filename, pending)
+
+                if pending:
+                    log.info('Merging {} files'.format(len(pending)))
+                    self.merge_temp_bundles(ds_name, pending)
 
             except NonMultipartContentTypeException:
                 response = r.json()
@@ -590,6 +626,10 @@ class Marketplace:
                     request='ingest dataset',
                     error=response,
                 )
+
+            finally:
+                for tmp_bundle in pending:
+                    shutil.rmtree(tmp_bundle, ignore_errors=True)
         else:
             raise MarketplaceHTTPRequest(
                 request='ingest dataset',
@@ -598,24 +638,30 @@ class Marketplace:
 
         log.info('{} ingested successfully'.format(ds_name))
 
-    def get_dataset(self, ds_name, start=None, end=None):
+    def get_dataset(self, ds_name, start=None, end=None, columns=None):
+        """
+        The rows of an ingested dataset dated in [start, end).
+
+        Parameters
+        ----------
+        ds_name: str
+        start: pd.Timestamp or str, optional
+        end: pd.Timestamp or str, optional
+        columns: list[str], optional
+            The columns to read, all by default.
+
+        Returns
+        -------
+        pd.DataFrame
+            The rows indexed by date and symbol.
+
+        """
         ds_name = ds_name.lower()
 
-        # TODO: filter ctable by start and end date
         bundle_folder = get_data_source_folder(ds_name)
         z = bcolz.ctable(rootdir=bundle_folder, mode='r')
 
-        if start is not None and end is not None:
-            z = z.fetchwhere('(date>=start_date) & (date<end_date)',
-                             user_dict={'start_date': start.encode(),
-                                        'end_date': end.encode()})
-        elif start is not None:
-            z = z.fetchwhere('(date>=start_date)',
-                             user_dict={'start_date': start.encode()})
-        elif end is not None:
-            z = z.fetchwhere('(date<end_date)',
-                             user_dict={'end_date': end.encode()})
-        df = z.todataframe()  # type: pd.DataFrame
+        df = read_bundle(z, start, end, columns)
         df.set_index(['date', 'symbol'], drop=True, inplace=True)
 
         return df
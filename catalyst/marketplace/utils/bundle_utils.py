@@ -2,6 +2,8 @@ import os
 import random
 import re
 import shutil
+import tempfile
+from collections import namedtuple
 
 import bcolz
 import numpy as np
@@ -9,37 +11,509 @@ import pandas as pd
 from six import string_types
 
 
-def merge_bundles(zsource, ztarget):
+DATE_COLUMN = 'date'
+SYMBOL_COLUMN = 'symbol'
+
+# The number of rows held in memory while sorting or merging bundles
+DEFAULT_BLOCK_LEN = 2 ** 20
+
+# The smallest read from a sorted run during the merge
+MIN_RUN_READ_LEN = 1024
+
+# The sidecar file of a bundle holding the dates of its blocks
+DATE_INDEX_FILENAME = 'date_index.npz'
+
+DateIndex = namedtuple('DateIndex', 'block_len min_dates max_dates')
+
+
+def _to_datetime64(values):
+    if values.dtype.kind == 'M':
+        return values.astype('M8[ns]')
+
+    if values.dtype.kind == 'S':
+        values = values.astype('U')
+
+    return pd.to_datetime(values).values.astype('M8[ns]')
+
+
+def _merged_dtype(ztables):
+    """
+    The dtype holding the columns of all the tables, with typed dates.
+
+    String columns take the widest width so that no value is truncated.
+    """
+    fields = []
+    dtypes = {}
+    for z in ztables:
+        for name in z.dtype.names:
+            dtype = z.dtype[name]
+            if name not in dtypes:
+                fields.append(name)
+                dtypes[name] = dtype
+            else:
+                dtypes[name] = np.promote_types(dtypes[name], dtype)
+
+    dtypes[DATE_COLUMN] = np.dtype('M8[ns]')
+    return np.dtype([(name, dtypes[name]) for name in fields])
+
+
+def _normalize_block(block, dtype):
+    out = np.zeros(len(block), dtype=dtype)
+    for name in dtype.names:
+        if name not in block.dtype.names:
+            if dtype[name].kind == 'f':
+                out[name] = np.nan
+        elif name == DATE_COLUMN:
+            out[name] = _to_datetime64(block[name])
+        else:
+            out[name] = block[name]
+
+    return out
+
+
+def _first_of_keys(block):
+    """
+    A mask of the first row of each (date, symbol) in a sorted block.
+    """
+    dates = block[DATE_COLUMN]
+    symbols = block[SYMBOL_COLUMN]
+
+    keep = np.ones(len(block), dtype=bool)
+    keep[1:] = (dates[1:] != dates[:-1]) | (symbols[1:] != symbols[:-1])
+    return keep
+
+
+def _is_sorted_unique(z, blen):
+    """
+    Whether the rows of a table are sorted by unique (date, symbol).
+
+    Only the key columns are read, block by block.
+    """
+    last_date = last_symbol = None
+    for start in range(0, len(z), blen):
+        dates = _to_datetime64(z.cols[DATE_COLUMN][start:start + blen])
+        symbols = z.cols[SYMBOL_COLUMN][start:start + blen]
+        if last_date is not None:
+            dates = np.concatenate([[last_date], dates])
+            symbols = np.concatenate([[last_symbol], symbols])
+
+        increasing = (dates[1:] > dates[:-1]) | (
+            (dates[1:] == dates[:-1]) & (symbols[1:] > symbols[:-1])
+        )
+        if not increasing.all():
+            return False
+
+        last_date, last_symbol = dates[-1], symbols[-1]
+
+    return True
+
+
+def _sorted_runs(z, dtype, blen, tmpdir):
+    """
+    Split a table into runs sorted by unique (date, symbol) on disk.
+
+    A table which is already sorted is a run by itself.
+    """
+    if _is_sorted_unique(z, blen):
+        return [z]
+
+    runs = []
+    for start in range(0, len(z), blen):
+        block = _normalize_block(z[start:start + blen], dtype)
+        block = block[np.lexsort(
+            (block[SYMBOL_COLUMN], block[DATE_COLUMN])
+        )]
+        runs.append(bcolz.ctable(
+            block[_first_of_keys(block)],
+            rootdir=os.path.join(tmpdir, 'run-{}'.format(len(runs))),
+            mode='w',
+        ))
+
+    return runs
+
+
+class _SortedRun(object):
+    """
+    The rows of a sorted run read from disk a few at a time.
+    """
+
+    def __init__(self, z, priority, dtype):
+        self.z = z
+        self.priority = priority
+        self.dtype = dtype
+        self.position = 0
+        self.rows = np.zeros(0, dtype=dtype)
+
+    @property
+    def remaining(self):
+        return self.position < len(self.z)
+
+    def read(self, length):
+        end = self.position + length
+        block = _normalize_block(self.z[self.position:end], self.dtype)
+        self.rows = np.concatenate([self.rows, block])
+        self.position = min(end, len(self.z))
+
+    def take_before(self, date):
+        """
+        Remove and return the rows dated before ``date``, all the rows
+        if ``date`` is None.
+        """
+        if date is None:
+            count = len(self.rows)
+        else:
+            count = np.searchsorted(self.rows[DATE_COLUMN], date, 'left')
+
+        rows, self.rows = self.rows[:count], self.rows[count:]
+        return rows
+
+
+def merge_ctables(sources, rootdir, blen=DEFAULT_BLOCK_LEN):
+    """
+    Merge tables into a new table sorted by unique (date, symbol).
+
+    The tables are split into runs of at most ``blen`` sorted rows
+    written to disk, which are then merged block by block: only the rows
+    dated before the earliest last date read from the runs still on disk
+    are written out at each step. At most about ``blen`` rows are held in
+    memory, plus the rows sharing a single date.
+
+    Parameters
+    ----------
+    sources: list[bcolz.ctable]
+        The tables to merge. The rows of the first tables take precedence
+        over the rows of the next ones with the same date and symbol.
+    rootdir: str
+        The folder of the merged table, overwritten.
+    blen: int
+        The number of rows sorted in memory at once.
+
+    Returns
+    -------
+    bcolz.ctable
+
+    """
+    dtype = _merged_dtype(sources)
+    tmpdir = tempfile.mkdtemp(
+        prefix='.merge-', dir=os.path.dirname(os.path.abspath(rootdir))
+    )
+    try:
+        runs = []
+        for priority, z in enumerate(sources):
+            runs.extend(
+                _SortedRun(run, priority, dtype)
+                for run in _sorted_runs(z, dtype, blen, tmpdir)
+            )
+        read_len = max(
+            blen // max(len(runs), 1), min(blen, MIN_RUN_READ_LEN)
+        )
+
+        ztarget = bcolz.ctable(
+            np.zeros(0, dtype=dtype), rootdir=rootdir, mode='w'
+        )
+        while True:
+            for run in runs:
+                if not len(run.rows) and run.remaining:
+                    run.read(read_len)
+
+            pending = [run for run in runs if len(run.rows)]
+            if not pending:
+                break
+
+            # Rows dated before the frontier cannot be followed by rows
+            # of the same date and symbol in any run.
+            on_disk = [run for run in pending if run.remaining]
+            if on_disk:
+                frontier = min(run.rows[DATE_COLUMN][-1] for run in on_disk)
+            else:
+                frontier = None
+
+            blocks = []
+            priorities = []
+            for run in pending:
+                rows = run.take_before(frontier)
+                if len(rows):
+                    blocks.append(rows)
+                    priorities.append(np.full(len(rows), run.priority))
+
+            if not blocks:
+                # All the rows in memory are dated at the frontier
+                for run in on_disk:
+                    if run.rows[DATE_COLUMN][-1] == frontier:
+                        run.read(read_len)
+                continue
+
+            block = np.concatenate(blocks)
+            block = block[np.lexsort((
+                np.concatenate(priorities),
+                block[SYMBOL_COLUMN],
+                block[DATE_COLUMN],
+            ))]
+            ztarget.append(block[_first_of_keys(block)])
+
+        ztarget.flush()
+        write_date_index(ztarget)
+
+    finally:
+        shutil.rmtree(tmpdir, ignore_errors=True)
+
+    return ztarget
+
+
+def write_date_index(z):
+    """
+    Write the first and last date of each block of a sorted bundle.
+
+    The blocks match the chunks of the date column, so that a date range
+    query only decompresses the chunks it overlaps.
+
+    Parameters
+    ----------
+    z: bcolz.ctable
+
+    """
+    dates = z.cols[DATE_COLUMN]
+    block_len = dates.chunklen
+
+    min_dates = []
+    max_dates = []
+    for start in range(0, len(z), block_len):
+        block = dates[start:start + block_len]
+        min_dates.append(block[0])
+        max_dates.append(block[-1])
+
+    # The dates of the bundles written by previous versions are strings
+    np.savez(
+        os.path.join(z.rootdir, DATE_INDEX_FILENAME),
+        block_len=block_len,
+        nrows=len(z),
+        min_dates=_to_datetime64(np.array(min_dates)).view('int64'),
+        max_dates=_to_datetime64(np.array(max_dates)).view('int64'),
+    )
+
+
+def read_date_index(z):
+    """
+    The date index of a bundle.
+
+    Parameters
+    ----------
+    z: bcolz.ctable
+
+    Returns
+    -------
+    DateIndex
+        None if the bundle has no index or if it is not up to date.
+
+    """
+    filename = os.path.join(z.rootdir, DATE_INDEX_FILENAME)
+    if not os.path.isfile(filename):
+        return None
+
+    with np.load(filename) as index:
+        if int(index['nrows']) != len(z):
+            return None
+
+        return DateIndex(
+            block_len=int(index['block_len']),
+            min_dates=index['min_dates'].view('M8[ns]'),
+            max_dates=index['max_dates'].view('M8[ns]'),
+        )
+
+
+def _to_bundle_date(dt):
+    if dt is None:
+        return None
+
+    dt = pd.Timestamp(dt)
+    if dt.tzinfo is not None:
+        dt = dt.tz_convert('UTC').tz_localize(None)
+
+    return np.datetime64(dt.value, 'ns')
+
+
+def _date_range_rows(z, index, start, end):
+    """
+    The rows of a sorted bundle dated in [start, end).
+
+    Only the date chunks at the edges of the range are read.
+    """
+    nrows = len(z)
+    block_len = index.block_len
+    dates = z.cols[DATE_COLUMN]
+
+    first_block = 0 if start is None else np.searchsorted(
+        index.max_dates, start, 'left'
+    )
+    last_block = len(index.min_dates) if end is None else np.searchsorted(
+        index.min_dates, end, 'left'
+    )
+    if first_block >= last_block:
+        return 0, 0
+
+    start_row = first_block * block_len
+    stop_row = min(last_block * block_len, nrows)
+
+    if end is not None:
+        block_start = (last_block - 1) * block_len
+        stop_row = block_start + np.searchsorted(
+            _to_datetime64(dates[block_start:stop_row]), end, 'left'
+        )
+
+    if start is not None:
+        block_stop = min(start_row + block_len, stop_row)
+        start_row += np.searchsorted(
+            _to_datetime64(dates[start_row:block_stop]), start, 'left'
+        )
+
+    return start_row, max(start_row, stop_row)
+
+
+def read_bundle(z, start=None, end=None, columns=None):
+    """
+    The rows of a bundle dated in [start, end).
+
+    Sorted bundles with a date index only decompress the chunks overlapping
+    the date range, of the requested columns.
+
+    Parameters
+    ----------
+    z: bcolz.ctable
+    start: pd.Timestamp or str, optional
+    end: pd.Timestamp or str, optional
+    columns: list[str], optional
+        The columns to read, all by default. The date and symbol are
+        always read.
+
+    Returns
+    -------
+    pd.DataFrame
+
+    """
+    if columns is None:
+        names = list(z.names)
+    else:
+        unknown = set(columns) - set(z.names)
+        if unknown:
+            raise ValueError(
+                'Unknown columns: {}'.format(', '.join(sorted(unknown)))
+            )
+
+        names = [DATE_COLUMN, SYMBOL_COLUMN] + [
+            name for name in columns
+            if name not in (DATE_COLUMN, SYMBOL_COLUMN)
+        ]
+
+    start = _to_bundle_date(start)
+    end = _to_bundle_date(end)
+
+    index = read_date_index(z)
+    if index is not None:
+        start_row, stop_row = _date_range_rows(z, index, start, end)
+        data = {name: z.cols[name][start_row:stop_row] for name in names}
+        data[DATE_COLUMN] = _to_datetime64(data[DATE_COLUMN])
+
+    else:
+        # Bundles written before the index are scanned in full
+        dates = _to_datetime64(z.cols[DATE_COLUMN][:])
+        mask = np.ones(len(dates), dtype=bool)
+        if start is not None:
+            mask &= dates >= start
+        if end is not None:
+            mask &= dates < end
+
+        data = {
+            name: z.cols[name][:][mask] for name in names
+            if name != DATE_COLUMN
+        }
+        data[DATE_COLUMN] = dates[mask]
+
+    return pd.DataFrame(data, columns=names)
+
+
+def append_bundle(zsource, ztarget, blen=DEFAULT_BLOCK_LEN):
     """
-    Merge
+    Append a bundle to another one if all its rows sort after the rows of
+    the target bundle.
+
+    Nothing is written when the source bundle is not sorted by unique
+    (date, symbol), overlaps the target bundle or has columns which do not
+    fit in the columns of the target bundle.
+
     Parameters
     ----------
-    zsource
-    ztarget
+    zsource: bcolz.ctable
+        The new bundle.
+    ztarget: bcolz.ctable
+        The sorted bundle appended to, opened in append mode.
+    blen: int
+        The number of rows held in memory at once.
 
     Returns
     -------
+    bool
+        Whether the source bundle was appended.
+
+    """
+    dtype = ztarget.dtype
+    if _merged_dtype([ztarget, zsource]) != dtype:
+        return False
+
+    if not _is_sorted_unique(zsource, blen):
+        return False
+
+    if len(zsource) and len(ztarget):
+        first_date = _to_datetime64(zsource.cols[DATE_COLUMN][:1])[0]
+        last_date = _to_datetime64(ztarget.cols[DATE_COLUMN][-1:])[0]
+        first_symbol = zsource.cols[SYMBOL_COLUMN][0]
+        last_symbol = ztarget.cols[SYMBOL_COLUMN][len(ztarget) - 1]
+        if (first_date, first_symbol) <= (last_date, last_symbol):
+            return False
 
+    for start in range(0, len(zsource), blen):
+        ztarget.append(
+            _normalize_block(zsource[start:start + blen], dtype)
+        )
+
+    ztarget.flush()
+    write_date_index(ztarget)
+    return True
+
+
+def merge_bundles(zsource, ztarget, blen=DEFAULT_BLOCK_LEN):
     """
-    # TODO: find a way to do this iteratively instead of in-memory
-    df_source = zsource.todataframe()
-    df_target = ztarget.todataframe()
+    Merge a bundle into another one, out of memory.
 
-    df = pd.concat(
-        [df_source, df_target], ignore_index=True
-    )  # type: pd.DataFrame
-    df.drop_duplicates(inplace=True)
-    df.set_index(['date', 'symbol'], drop=False, inplace=True)
+    Parameters
+    ----------
+    zsource: bcolz.ctable or list[bcolz.ctable]
+        The new bundles, their rows replace the rows of the target bundle
+        with the same date and symbol. The rows of the first bundles take
+        precedence over the rows of the next ones.
+    ztarget: bcolz.ctable
+        The bundle merged into, replaced on disk.
+    blen: int
+        The number of rows held in memory at once.
 
-    sanitize_df(df)
+    Returns
+    -------
+    bcolz.ctable
+
+    """
+    rootdir = ztarget.rootdir
+    dirname = os.path.basename(rootdir)
+    merge_dir = os.path.join(
+        os.path.dirname(rootdir), '.{}.merge'.format(dirname)
+    )
+    bak_dir = os.path.join(os.path.dirname(rootdir), '.{}'.format(dirname))
 
-    dirname = os.path.basename(ztarget.rootdir)
-    bak_dir = ztarget.rootdir.replace(dirname, '.{}'.format(dirname))
-    shutil.move(ztarget.rootdir, bak_dir)
+    sources = zsource if isinstance(zsource, list) else [zsource]
+    merge_ctables(sources + [ztarget], merge_dir, blen)
 
-    z = bcolz.ctable.fromdataframe(df=df, rootdir=ztarget.rootdir)
+    shutil.move(rootdir, bak_dir)
+    shutil.move(merge_dir, rootdir)
     shutil.rmtree(bak_dir)
-    return z
+    return bcolz.ctable(rootdir=rootdir, mode='r')
 
 
 def sanitize_df(df):
@@ -0,0 +1,198 @@
+import os
+import re
+
+from requests_toolbelt.multipart.decoder import \
+    NonMultipartContentTypeException
+
+CRLF = b'\r\n'
+HEADERS_END = CRLF + CRLF
+
+# Parser states
+_PREAMBLE = 'preamble'
+_DELIMITER = 'delimiter'
+_HEADERS = 'headers'
+_BODY = 'body'
+_EPILOGUE = 'epilogue'
+
+# The headers of a part are buffered in full, anything bigger is not a
+# header block we want to hold in memory.
+MAX_HEADERS_SIZE = 64 * 1024
+
+
+class IncompleteMultipartError(ValueError):
+    pass
+
+
+def get_boundary(content_type):
+    """
+    The boundary of a multipart content type.
+
+    Parameters
+    ----------
+    content_type: str
+
+    Returns
+    -------
+    bytes
+
+    """
+    mimetype = content_type.split(';')[0].strip().lower()
+    if not mimetype.startswith('multipart'):
+        raise NonMultipartContentTypeException(
+            'Unexpected mimetype in content-type header: {}'.format(mimetype)
+        )
+
+    match = re.search(r'boundary="?([^";]+)"?', content_type)
+    if match is None:
+        raise NonMultipartContentTypeException(
+            'No boundary in content-type header: {}'.format(content_type)
+        )
+
+    return match.group(1).strip().encode('utf-8')
+
+
+def parse_part_headers(block):
+    """
+    The headers of a multipart part, keyed by lowercase name.
+
+    Parameters
+    ----------
+    block: bytes
+
+    Returns
+    -------
+    dict[str, str]
+
+    """
+    headers = {}
+    for line in block.decode('utf-8').split('\r\n'):
+        if ':' not in line:
+            continue
+
+        name, value = line.split(':', 1)
+        headers[name.strip().lower()] = value.strip()
+
+    return headers
+
+
+def get_part_filename(headers, default):
+    disposition = headers.get('content-disposition', '')
+    match = re.search(r'filename="(.*?)"', disposition)
+    if match is None:
+        return default
+
+    # Never let the server choose where we write
+    return os.path.basename(match.group(1)) or default
+
+
+def iter_multipart_files(chunks, content_type, folder):
+    """
+    Write the parts of a streamed multipart body to files as they arrive.
+
+    The body is parsed incrementally: the bytes of each part are written
+    to disk as soon as they are known not to belong to the next boundary,
+    so only a chunk and a few bytes of look-behind are held in memory.
+
+    Parameters
+    ----------
+    chunks: iterable[bytes]
+        The body of the response, e.g. ``response.iter_content(...)``.
+    content_type: str
+        The content-type header of the response.
+    folder: str
+        The folder where the parts are written.
+
+    Returns
+    -------
+    iterator[str]
+        The path of each part, yielded once the part is fully written.
+
+    """
+    boundary = get_boundary(content_type)
+    # The leading CRLF lets the first delimiter match at the start of
+    # the body when there is no preamble.
+    delimiter = CRLF + b'--' + boundary
+    lookbehind = len(delimiter) - 1
+
+    buf = CRLF
+    state = _PREAMBLE
+    counter = 0
+    f = None
+    filename = None
+    try:
+        for chunk in chunks:
+            if not chunk:
+                # filter out keep-alive chunks
+                continue
+
+            buf += chunk
+            while True:
+                if state in (_PREAMBLE, _BODY):
+                    idx = buf.find(delimiter)
+                    if idx < 0:
+                        if len(buf) > lookbehind:
+                            if state == _BODY:
+                                f.write(buf[:-lookbehind])
+                            buf = buf[-lookbehind:]
+                        break
+
+                    if state == _BODY:
+                        f.write(buf[:idx])
+                        f.close()
+                        f = None
+                        yield filename
+
+                    buf = buf[idx + len(delimiter):]
+                    state = _DELIMITER
+
+                elif state == _DELIMITER:
+                    if len(buf) < 2:
+                        break
+
+                    if buf[:2] == b'--':
+                        state = _EPILOGUE
+                        break
+
+                    # Skip the transport padding up to the line break
+                    idx = buf.find(CRLF)
+                    if idx < 0:
+                        break
+
+                    buf = buf[idx + len(CRLF):]
+                    state = _HEADERS
+
+                elif state == _HEADERS:
+                    idx = buf.find(HEADERS_END)
+                    if idx < 0:
+                        if len(buf) > MAX_HEADERS_SIZE:
+                            raise IncompleteMultipartError(
+                                'Part headers exceed {} bytes'.format(
+                                    MAX_HEADERS_SIZE)
+                            )
+                        break
+
+                    headers = parse_part_headers(buf[:idx])
+                    buf = buf[idx + len(HEADERS_END):]
+
+                    counter += 1
+                    filename = os.path.join(folder, get_part_filename(
+                        headers, 'part-{}'.format(counter)
+                    ))
+                    f = open(filename, 'wb')
+                    state = _BODY
+
+                else:
+                    # Anything after the close delimiter is ignored
+                    buf = b''
+                    break
+
+        if state != _EPILOGUE:
+            raise IncompleteMultipartError(
+                'The multipart body ended before its close delimiter'
+            )
+
+    finally:
+        if f is not None:
+            # Never leave a truncated part behind
+            f.close()
+            os.remove(filename)
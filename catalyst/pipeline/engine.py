@@ -5,19 +5,29 @@ from abc import (
     ABCMeta,
     abstractmethod,
 )
+import multiprocessing
+from multiprocessing.pool import ThreadPool
+import os
+import sys
 from uuid import uuid4
 
-import six
 from six import (
     iteritems,
+    reraise,
     with_metaclass,
 )
+from six.moves.queue import Queue
 from numpy import array
 from pandas import DataFrame, MultiIndex
 from toolz import groupby, juxt
-from toolz.curried.operator import getitem
+from toolz.curried.operator import attrgetter, getitem
 
-from catalyst.lib.adjusted_array import ensure_adjusted_array, ensure_ndarray
+from catalyst.lib.adjusted_array import (
+    NOMASK,
+    AdjustedArray,
+    ensure_adjusted_array,
+    ensure_ndarray,
+)
 from catalyst.errors import NoFurtherDataError
 from catalyst.utils.numpy_utils import (
     as_column,
@@ -26,6 +36,7 @@ from catalyst.utils.numpy_utils import (
 )
 from catalyst.utils.pandas_utils import explode
 
+from .graph import ExecutionPlan
 from .term import AssetExists, InputDates, LoadableTerm
 
 from catalyst.utils.date_utils import compute_date_range_chunks
@@ -106,6 +117,34 @@ class PipelineEngine(with_metaclass(ABCMeta)):
         """
         raise NotImplementedError("run_chunked_pipeline")
 
+    def run_pipelines(self, pipelines, start_date, end_date):
+        """
+        Compute values for several pipelines between ``start_date`` and
+        ``end_date``.
+
+        Engines able to share the terms common to the pipelines should
+        override this method, which runs the pipelines one after the other.
+
+        Parameters
+        ----------
+        pipelines : dict[str -> catalyst.pipeline.Pipeline]
+            The pipelines to run, by name.
+        start_date : pd.Timestamp
+            Start date of the computed matrices.
+        end_date : pd.Timestamp
+            End date of the computed matrices.
+
+        Returns
+        -------
+        results : dict[str -> pd.DataFrame]
+            The frame of computed results of each pipeline, as returned by
+            ``run_pipeline``.
+        """
+        return {
+            name: self.run_pipeline(pipeline, start_date, end_date)
+            for name, pipeline in iteritems(pipelines)
+        }
+
 
 class NoEngineRegistered(Exception):
     """
@@ -185,6 +224,19 @@ class SimplePipelineEngine(PipelineEngine):
         computing a pipeline. See
         :func:`catalyst.pipeline.engine.default_populate_initial_workspace`
         for more info.
+    max_workers : int, optional
+        The number of threads computing the ready terms of a chunk
+        concurrently. Terms are computed one after the other by default.
+    chunk_processes : int, optional
+        The number of processes computing the date chunks of
+        ``run_chunked_pipeline`` concurrently. The chunks are computed one
+        after the other by default, or where processes cannot be forked.
+
+    Attributes
+    ----------
+    load_count : int
+        The number of calls made to the loaders by the last run of
+        ``run_pipeline`` or ``run_chunked_pipeline``.
 
     See Also
     --------
@@ -197,13 +249,19 @@ class SimplePipelineEngine(PipelineEngine):
         '_root_mask_term',
         '_root_mask_dates_term',
         '_populate_initial_workspace',
+        '_max_workers',
+        '_chunk_processes',
+        '_adjusted_terms',
+        'load_count',
     )
 
     def __init__(self,
                  get_loader,
                  calendar,
                  asset_finder,
-                 populate_initial_workspace=None):
+                 populate_initial_workspace=None,
+                 max_workers=None,
+                 chunk_processes=None):
         self._get_loader = get_loader
         self._calendar = calendar
         self._finder = asset_finder
@@ -215,6 +273,14 @@ class SimplePipelineEngine(PipelineEngine):
             populate_initial_workspace or default_populate_initial_workspace
         )
 
+        self._max_workers = max_workers or 1
+        self._chunk_processes = chunk_processes or 1
+
+        # The loadable terms found with adjustments, whose groups are no
+        # longer loaded along with the groups needing more extra rows.
+        self._adjusted_terms = set()
+        self.load_count = 0
+
     def run_pipeline(self, pipeline, start_date, end_date):
         """
         Compute a pipeline.
@@ -277,11 +343,7 @@ class SimplePipelineEngine(PipelineEngine):
         :meth:`catalyst.pipeline.engine.PipelineEngine.run_pipeline`
         :meth:`catalyst.pipeline.engine.PipelineEngine.run_chunked_pipeline`
         """
-        if end_date < start_date:
-            raise ValueError(
-                "start_date must be before or equal to end_date \n"
-                "start_date=%s, end_date=%s" % (start_date, end_date)
-            )
+        _validate_date_range(start_date, end_date)
 
         screen_name = uuid4().hex
         graph = pipeline.to_execution_plan(
@@ -291,6 +353,87 @@ class SimplePipelineEngine(PipelineEngine):
             start_date,
             end_date,
         )
+        results, dates, assets = self._compute_plan(
+            graph, start_date, end_date,
+        )
+
+        return self._to_narrow(
+            graph.outputs,
+            results,
+            results.pop(screen_name),
+            dates,
+            assets,
+        )
+
+    def run_pipelines(self, pipelines, start_date, end_date):
+        """
+        Compute several pipelines over the same dates.
+
+        The pipelines are compiled into a single execution plan, so the terms
+        they share are loaded and computed once.
+
+        Parameters
+        ----------
+        pipelines : dict[str -> catalyst.pipeline.Pipeline]
+            The pipelines to run, by name.
+        start_date : pd.Timestamp
+            Start date of the computed matrices.
+        end_date : pd.Timestamp
+            End date of the computed matrices.
+
+        Returns
+        -------
+        results : dict[str -> pd.DataFrame]
+            The frame of computed results of each pipeline, as returned by
+            ``run_pipeline``.
+        """
+        _validate_date_range(start_date, end_date)
+
+        names = list(pipelines)
+
+        # The outputs are keyed by the position of their pipeline, with None
+        # standing for its screen.
+        terms = {}
+        for idx, name in enumerate(names):
+            pipeline = pipelines[name]
+            for column, term in iteritems(pipeline.columns):
+                terms[idx, column] = term
+            screen = pipeline.screen
+            terms[idx, None] = \
+                self._root_mask_term if screen is None else screen
+
+        graph = ExecutionPlan(terms, self._calendar, start_date, end_date)
+        results, dates, assets = self._compute_plan(
+            graph, start_date, end_date,
+        )
+
+        out = {}
+        for idx, name in enumerate(names):
+            columns = pipelines[name].columns
+            out[name] = self._to_narrow(
+                columns,
+                {column: results[idx, column] for column in columns},
+                results[idx, None],
+                dates,
+                assets,
+            )
+        return out
+
+    def _compute_plan(self, graph, start_date, end_date):
+        """
+        Compute the outputs of an execution plan between two dates.
+
+        Returns
+        -------
+        results : dict
+            Dictionary mapping the outputs of the plan to their values.
+        dates : pd.DatetimeIndex
+            Row labels of the results.
+        assets : pd.Int64Index
+            Column labels of the results.
+        """
+        self.load_count = 0
+
         extra_rows = graph.extra_rows[self._root_mask_term]
         root_mask = self._compute_root_mask(start_date, end_date, extra_rows)
         dates, assets, root_mask_values = explode(root_mask)
@@ -313,13 +456,7 @@ class SimplePipelineEngine(PipelineEngine):
             initial_workspace,
         )
 
-        return self._to_narrow(
-            graph.outputs,
-            results,
-            results.pop(screen_name),
-            dates[extra_rows:],
-            assets,
-        )
+        return results, dates[extra_rows:], assets
 
     @copydoc(PipelineEngine.run_chunked_pipeline)
     def run_chunked_pipeline(self, pipeline, start_date, end_date, chunksize):
@@ -329,9 +466,42 @@ class SimplePipelineEngine(PipelineEngine):
             end_date,
             chunksize,
         )
-        chunks = [self.run_pipeline(pipeline, s, e) for s, e in ranges]
+        context = None
+        if self._chunk_processes > 1 and len(ranges) > 1:
+            context = _fork_context()
+
+        if context is not None:
+            results = self._run_chunks_in_processes(pipeline, ranges, context)
+        else:
+            results = [
+                _run_chunk(self, pipeline, s, e) for s, e in ranges
+            ]
+
+        self.load_count = sum(load_count for _, load_count in results)
+
+        return categorical_df_concat(
+            [chunk for chunk, _ in results], inplace=True,
+        )
 
-        return categorical_df_concat(chunks, inplace=True)
+    def _run_chunks_in_processes(self, pipeline, ranges, context):
+        """
+        Run the date chunks of a pipeline in a pool of forked processes.
+
+        The engine and the pipeline are inherited by the forked processes
+        rather than pickled, since the loaders seldom can be. Only the
+        computed frames are sent back.
+        """
+        global _forked_chunk_context
+        _forked_chunk_context = (self, pipeline)
+        try:
+            pool = context.Pool(min(self._chunk_processes, len(ranges)))
+            try:
+                return pool.map(_run_forked_chunk, ranges)
+            finally:
+                pool.close()
+                pool.join()
+        finally:
+            _forked_chunk_context = None
 
     def _compute_root_mask(self, start_date, end_date, extra_rows):
         """
@@ -402,7 +572,19 @@ class SimplePipelineEngine(PipelineEngine):
         """
         offsets = graph.offset
         out = []
-        if term.windowed:
+        if term.windowed and getattr(term, '_block_computable', False) and \
+                not any(getattr(workspace[input_], 'adjustments', None)
+                        for input_ in term.inputs):
+            # Terms computing blocks take the rows of all their windows at
+            # once, which is only possible when there are no adjustments to
+            # apply as the windows roll. The arrays are shared with the
+            # other terms of the workspace, so they are passed read-only.
+            for input_ in term.inputs:
+                input_data = ensure_ndarray(workspace[input_])
+                input_data = input_data[offsets[term, input_]:].view()
+                input_data.setflags(write=False)
+                out.append(input_data)
+        elif term.windowed:
             # If term is windowed, then all input data should be instances of
             # AdjustedArray.
             for input_ in term.inputs:
@@ -467,6 +649,36 @@ class SimplePipelineEngine(PipelineEngine):
 
         refcounts = graph.initial_refcounts(workspace)
 
+        if self._max_workers > 1:
+            self._compute_terms_in_threads(
+                graph, dates, assets, workspace, refcounts, loader_groups,
+                loader_group_key,
+            )
+        else:
+            self._compute_terms(
+                graph, dates, assets, workspace, refcounts, loader_groups,
+                loader_group_key,
+            )
+
+        out = {}
+        graph_extra_rows = graph.extra_rows
+        for name, term in iteritems(graph.outputs):
+            # Truncate off extra rows from outputs.
+            out[name] = workspace[term][graph_extra_rows[term]:]
+        return out
+
+    def _compute_terms(self,
+                       graph,
+                       dates,
+                       assets,
+                       workspace,
+                       refcounts,
+                       loader_groups,
+                       loader_group_key):
+        """
+        Compute the terms of the graph one after the other, in their
+        topological order.
+        """
         for term in graph.execution_order(refcounts):
             # `term` may have been supplied in `initial_workspace`, and in the
             # future we may pre-compute loadable terms coming from the same
@@ -485,17 +697,16 @@ class SimplePipelineEngine(PipelineEngine):
             )
 
             if isinstance(term, LoadableTerm):
-                # term_key = loader_group_key(term)
-                # TODO: temp workaround
-                to_load = sorted(
-                    six.next(six.itervalues(loader_groups)),
-                    key=lambda t: t.dataset
-                )
-                loader = get_loader(term)
-                loaded = loader.load_adjusted_array(
-                    to_load, mask_dates, assets, mask,
+                workspace.update(
+                    self._load_shared_groups(
+                        graph,
+                        loader_groups,
+                        loader_group_key(term),
+                        dates,
+                        assets,
+                        workspace,
+                    )
                 )
-                workspace.update(loaded)
             else:
                 workspace[term] = term._compute(
                     self._inputs_for_term(term, workspace, graph),
@@ -513,13 +724,232 @@ class SimplePipelineEngine(PipelineEngine):
                 for garbage_term in graph.decref_dependencies(term, refcounts):
                     del workspace[garbage_term]
 
+    def _compute_terms_in_threads(self,
+                                  graph,
+                                  dates,
+                                  assets,
+                                  workspace,
+                                  refcounts,
+                                  loader_groups,
+                                  loader_group_key):
+        """
+        Compute the terms of the graph in a pool of threads, as soon as
+        their inputs are available.
+
+        Only the computations run in the pool. The loaders, the workspace
+        and the refcounts are used from the calling thread alone: the inputs
+        of a term are collected before it is submitted, and a term is only
+        released from the workspace once all the terms depending on it are
+        computed.
+        """
+        pending = {
+            term: {
+                parent for parent in graph.graph.predecessors(term)
+                if parent not in workspace
+            }
+            for term in graph.execution_order(refcounts)
+            if term not in workspace
+        }
+        ready = [term for term, parents in iteritems(pending) if not parents]
+        shapes = {}
+        done = Queue()
+        running = 0
+
+        pool = ThreadPool(self._max_workers)
+        try:
+            while pending:
+                while ready:
+                    term = ready.pop()
+                    if term in workspace:
+                        # Loaded along with another term of its loader.
+                        done.put((term, None, None))
+                    elif isinstance(term, LoadableTerm):
+                        workspace.update(
+                            self._load_shared_groups(
+                                graph,
+                                loader_groups,
+                                loader_group_key(term),
+                                dates,
+                                assets,
+                                workspace,
+                            )
+                        )
+                        done.put((term, None, None))
+                    else:
+                        mask, mask_dates = graph.mask_and_dates_for_term(
+                            term,
+                            self._root_mask_term,
+                            workspace,
+                            dates,
+                        )
+                        if term.ndim == 2:
+                            shapes[term] = mask.shape
+                        else:
+                            shapes[term] = (mask.shape[0], 1)
+                        pool.apply_async(
+                            _compute_term,
+                            (
+                                term,
+                                self._inputs_for_term(term, workspace, graph),
+                                mask_dates,
+                                assets,
+                                mask,
+                                done,
+                            ),
+                        )
+                    running += 1
+
+                if not running:
+                    # Nothing would ever be put on the queue.
+                    raise ValueError(
+                        'Unable to compute the pipeline terms {}, their '
+                        'inputs are never computed.'.format(list(pending))
+                    )
+
+                term, result, exc_info = done.get()
+                running -= 1
+                if exc_info is not None:
+                    reraise(*exc_info)
+
+                if term in shapes:
+                    assert result.shape == shapes.pop(term)
+                    workspace[term] = result
+
+                    for garbage_term in graph.decref_dependencies(
+                            term, refcounts):
+                        del workspace[garbage_term]
+
+                del pending[term]
+                for child in graph.graph.successors(term):
+                    parents = pending.get(child)
+                    if parents is not None:
+                        parents.discard(term)
+                        if not parents:
+                            ready.append(child)
+        finally:
+            if running:
+                # Stop the computations still running on an error, their
+                # results are not needed.
+                pool.terminate()
+            else:
+                pool.close()
+            pool.join()
+
+    def _load_shared_groups(self,
+                            graph,
+                            loader_groups,
+                            group_key,
+                            dates,
+                            assets,
+                            workspace):
+        """
+        Load the group of loadable terms identified by ``group_key``,
+        along with the other groups of the same loader and mask.
+
+        The terms of all these groups are loaded in a single call over the
+        dates of the group with the most extra rows. The arrays of the
+        groups needing fewer extra rows are sliced from the loaded ones when
+        they carry no adjustments, which would be indexed on the loaded
+        rows; the others are loaded on their own. The groups whose terms
+        were found with adjustments are left out of the shared call from
+        then on.
+
+        Parameters
+        ----------
+        graph : catalyst.pipeline.graph.TermGraph
+        loader_groups : dict[(PipelineLoader, int) -> list[LoadableTerm]]
+            The loadable terms grouped by loader and extra rows.
+        group_key : (PipelineLoader, int)
+            The group of the term to load.
+        dates : pd.DatetimeIndex
+            Row labels for our root mask.
+        assets : pd.Int64Index
+            Column labels for our root mask.
+        workspace : dict
+            Map from term -> output.
+
+        Returns
+        -------
+        loaded : dict[LoadableTerm -> AdjustedArray]
+            The arrays of every term of the shared groups.
+        """
+        loader, _ = group_key
+        mask_term = loader_groups[group_key][0].mask
+
+        candidates = [
+            key for key, terms in iteritems(loader_groups)
+            if key[0] is loader and terms[0].mask is mask_term
+        ]
+        extra_rows = max(key[1] for key in candidates)
+        adjusted = self._adjusted_terms
+        shared = [
+            key for key in candidates
+            if key[1] == extra_rows or
+            not any(t in adjusted for t in loader_groups[key])
+        ]
+        if group_key not in shared:
+            terms = loader_groups[group_key]
+            return self._load_terms(
+                graph, loader, terms, terms[0], dates, assets, workspace,
+            )
+
+        widest = loader_groups[loader, extra_rows][0]
+
+        loaded = self._load_terms(
+            graph,
+            loader,
+            [t for key in shared for t in loader_groups[key]],
+            widest,
+            dates,
+            assets,
+            workspace,
+        )
+
         out = {}
-        graph_extra_rows = graph.extra_rows
-        for name, term in iteritems(graph.outputs):
-            # Truncate off extra rows from outputs.
-            out[name] = workspace[term][graph_extra_rows[term]:]
+        for key in shared:
+            offset = extra_rows - key[1]
+            terms = loader_groups[key]
+            if not offset:
+                out.update((t, loaded[t]) for t in terms)
+            elif not any(loaded[t].adjustments for t in terms):
+                for t in terms:
+                    out[t] = AdjustedArray(
+                        loaded[t].data[offset:],
+                        NOMASK,
+                        {},
+                        loaded[t].missing_value,
+                    )
+            else:
+                adjusted.update(
+                    t for t in terms if loaded[t].adjustments
+                )
+                out.update(
+                    self._load_terms(
+                        graph, loader, terms, terms[0], dates, assets,
+                        workspace,
+                    )
+                )
         return out
 
+    def _load_terms(self, graph, loader, terms, term, dates, assets,
+                    workspace):
+        """
+        Load ``terms`` with ``loader``, over the mask and dates of ``term``.
+        """
+        mask, mask_dates = graph.mask_and_dates_for_term(
+            term,
+            self._root_mask_term,
+            workspace,
+            dates,
+        )
+        self.load_count += 1
+        return loader.load_adjusted_array(
+            sorted(terms, key=attrgetter('dataset')),
+            mask_dates,
+            assets,
+            mask,
+        )
+
     def _to_narrow(self, terms, data, mask, dates, assets):
         """
         Convert raw computed pipeline results into a DataFrame for public APIs.
@@ -615,3 +1045,59 @@ class SimplePipelineEngine(PipelineEngine):
                     implied=implied_shape,
                 )
             )
+
+
+def _validate_date_range(start_date, end_date):
+    if end_date < start_date:
+        raise ValueError(
+            "start_date must be before or equal to end_date \n"
+            "start_date=%s, end_date=%s" % (start_date, end_date)
+        )
+
+
+def _compute_term(term, inputs, dates, assets, mask, done):
+    """
+    Compute ``term`` from a pool thread, putting the result or the
+    exception raised on the ``done`` queue.
+    """
+    try:
+        done.put((term, term._compute(inputs, dates, assets, mask), None))
+    except BaseException:
+        done.put((term, None, sys.exc_info()))
+
+
+def _fork_context():
+    """
+    The multiprocessing context starting its processes with ``fork``, or
+    None where processes cannot be forked.
+
+    The processes must be forked to inherit ``_forked_chunk_context``,
+    they would start without it with ``spawn`` or ``forkserver``.
+    """
+    try:
+        get_context = multiprocessing.get_context
+    except AttributeError:
+        # Python 2 always forks where it can.
+        return multiprocessing if hasattr(os, 'fork') else None
+
+    try:
+        return get_context('fork')
+    except ValueError:
+        return None
+
+
+def _run_chunk(engine, pipeline, start_date, end_date):
+    """
+    Run a date chunk of a pipeline along with the number of loader calls.
+    """
+    result = engine.run_pipeline(pipeline, start_date, end_date)
+    return result, engine.load_count
+
+
+# The engine and the pipeline of the chunks run in forked processes.
+_forked_chunk_context = None
+
+
+def _run_forked_chunk(dates):
+    engine, pipeline = _forked_chunk_context
+    return _run_chunk(engine, pipeline, *dates)
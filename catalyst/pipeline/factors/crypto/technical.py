@@ -12,16 +12,24 @@ from numpy import (
     clip,
     diff,
     dstack,
+    errstate,
     exp,
     fmax,
     full,
     inf,
+    isfinite,
+    isinf,
     isnan,
     log,
+    maximum,
+    nan,
     NINF,
     sqrt,
     sum as np_sum,
+    where,
+    zeros,
 )
+from numpy.lib.stride_tricks import as_strided
 from numexpr import evaluate
 
 from catalyst.pipeline.data import CryptoPricing
@@ -44,6 +52,96 @@ from catalyst.utils.numpy_utils import (
 from ..factor import CustomFactor
 
 
+def _rolling_sum(data, length):
+    """
+    The sums of every window of ``length`` rows of ``data``, computed from
+    its cumulative sums.
+    """
+    cumsum = zeros((len(data) + 1,) + data.shape[1:], dtype=float64_dtype)
+    data.cumsum(axis=0, dtype=float64_dtype, out=cumsum[1:])
+    return cumsum[length:] - cumsum[:-length]
+
+
+def _rolling_nansum(data, length):
+    """
+    The sums and the counts of the non-nan values of every window of
+    ``length`` rows of ``data``, with the semantics of ``nansum``.
+    """
+    sums = _rolling_sum(where(isfinite(data), data, 0.0), length)
+    counts = _rolling_sum(~isnan(data), length)
+
+    if isinf(data).any():
+        # Infinite values are counted apart so they do not spill into the
+        # following windows.
+        positive = _rolling_sum(data == inf, length) > 0
+        negative = _rolling_sum(data == NINF, length) > 0
+        sums[positive] = inf
+        sums[negative] = NINF
+        sums[positive & negative] = nan
+    return sums, counts
+
+
+def _rolling_nanmean(data, length):
+    """
+    The means of the non-nan values of every window of ``length`` rows of
+    ``data``.
+    """
+    sums, counts = _rolling_nansum(data, length)
+    with errstate(divide='ignore', invalid='ignore'):
+        return sums / counts
+
+
+def _rolling_nanstd(data, length):
+    """
+    The standard deviations of the non-nan values of every window of
+    ``length`` rows of ``data``.
+    """
+    centered = _center_columns(data)
+
+    sums, counts = _rolling_nansum(centered, length)
+    squares, _ = _rolling_nansum(centered ** 2, length)
+    with errstate(divide='ignore', invalid='ignore'):
+        mean = sums / counts
+        return sqrt(maximum(squares / counts - mean ** 2, 0.0))
+
+
+def _center_columns(data):
+    """
+    Subtract the mean of its finite values from each column of ``data``,
+    which keeps the sums of squares of the column from cancelling out.
+    """
+    with ignore_nanwarnings():
+        centers = nanmean(where(isfinite(data), data, nan), axis=0)
+    return data - where(isnan(centers), 0.0, centers)
+
+
+def _rolling_windows(data, length):
+    """
+    A view of every window of ``length`` rows of ``data``, stacked along a
+    new second axis.
+
+    Unlike ``rolling_window``, this accepts arrays of exactly ``length``
+    rows.
+    """
+    return as_strided(
+        data,
+        (len(data) - length + 1, length) + data.shape[1:],
+        (data.strides[0],) + data.strides,
+    )
+
+
+def _rolling_weighted_sum(data, weights):
+    """
+    The sums of every window of ``len(weights)`` rows of ``data``, weighted
+    row by row.
+    """
+    length = len(data) - len(weights) + 1
+    out = zeros((length,) + data.shape[1:], dtype=float64_dtype)
+    for i, weight in enumerate(weights):
+        out += weight * data[i:i + length]
+    return out
+
+
 class Returns(CustomFactor):
     """
     Calculates the percent change in close price over the given window_length.
@@ -65,6 +163,10 @@ class Returns(CustomFactor):
     def compute(self, today, assets, out, close):
         out[:] = (close[-1] - close[0]) / close[0]
 
+    def compute_block(self, dates, assets, out, mask, close):
+        start = close[:len(out)]
+        out[:] = (close[self.window_length - 1:] - start) / start
+
 
 class RSI(CustomFactor, SingleInputMixin):
     """
@@ -88,6 +190,18 @@ class RSI(CustomFactor, SingleInputMixin):
             out=out,
         )
 
+    def compute_block(self, dates, assets, out, mask, closes):
+        diffs = diff(closes, axis=0)
+        length = self.window_length - 1
+        ups = _rolling_nanmean(clip(diffs, 0, inf), length)
+        downs = abs(_rolling_nanmean(clip(diffs, -inf, 0), length))
+        evaluate(
+            "100 - (100 / (1 + (ups / downs)))",
+            local_dict={'ups': ups, 'downs': downs},
+            global_dict={},
+            out=out,
+        )
+
 
 class SimpleMovingAverage(CustomFactor, SingleInputMixin):
     """
@@ -105,6 +219,9 @@ class SimpleMovingAverage(CustomFactor, SingleInputMixin):
     def compute(self, today, assets, out, data):
         out[:] = nanmean(data, axis=0)
 
+    def compute_block(self, dates, assets, out, mask, data):
+        out[:] = _rolling_nanmean(data, self.window_length)
+
 
 class WeightedAverageValue(CustomFactor):
     """
@@ -117,6 +234,11 @@ class WeightedAverageValue(CustomFactor):
     def compute(self, today, assets, out, base, weight):
         out[:] = nansum(base * weight, axis=0) / nansum(weight, axis=0)
 
+    def compute_block(self, dates, assets, out, mask, base, weight):
+        weighted, _ = _rolling_nansum(base * weight, self.window_length)
+        weights, _ = _rolling_nansum(weight, self.window_length)
+        out[:] = weighted / weights
+
 
 class VWAP(WeightedAverageValue):
     """
@@ -163,6 +285,10 @@ class AverageDollarVolume(CustomFactor):
     def compute(self, today, assets, out, close, volume):
         out[:] = nansum(close * volume, axis=0) / len(close)
 
+    def compute_block(self, dates, assets, out, mask, close, volume):
+        dollar_volume, _ = _rolling_nansum(close * volume, self.window_length)
+        out[:] = dollar_volume / self.window_length
+
 
 def exponential_weights(length, decay_rate):
     """
@@ -389,6 +515,10 @@ class ExponentialWeightedMovingAverage(_ExponentialWeightedFactor):
             weights=exponential_weights(len(data), decay_rate),
         )
 
+    def compute_block(self, dates, assets, out, mask, data, decay_rate):
+        weights = exponential_weights(self.window_length, decay_rate)
+        out[:] = _rolling_weighted_sum(data, weights) / np_sum(weights)
+
 
 class LinearWeightedMovingAverage(CustomFactor, SingleInputMixin):
     """
@@ -418,6 +548,15 @@ class LinearWeightedMovingAverage(CustomFactor, SingleInputMixin):
         # Compute weighted averages
         out[:] = nansum(weighted_data, axis=0) / normalizer
 
+    def compute_block(self, dates, assets, out, mask, data):
+        ndays = self.window_length
+        weights = arange(1, ndays + 1, dtype=float64_dtype)
+        normalizer = (ndays * (ndays + 1)) / 2
+
+        out[:] = _rolling_weighted_sum(
+            where(isnan(data), 0.0, data), weights,
+        ) / normalizer
+
 
 class ExponentialWeightedMovingStdDev(_ExponentialWeightedFactor):
     """
@@ -462,6 +601,25 @@ class ExponentialWeightedMovingStdDev(_ExponentialWeightedFactor):
         )
         out[:] = sqrt(variance * bias_correction)
 
+    def compute_block(self, dates, assets, out, mask, data, decay_rate):
+        weights = exponential_weights(self.window_length, decay_rate)
+        weight_sum = np_sum(weights)
+
+        centered = _center_columns(data)
+
+        mean = _rolling_weighted_sum(centered, weights) / weight_sum
+        variance = maximum(
+            _rolling_weighted_sum(centered ** 2, weights) / weight_sum -
+            mean ** 2,
+            0.0,
+        )
+
+        squared_weight_sum = weight_sum ** 2
+        bias_correction = (
+            squared_weight_sum / (squared_weight_sum - np_sum(weights ** 2))
+        )
+        out[:] = sqrt(variance * bias_correction)
+
 
 class BollingerBands(CustomFactor):
     """
@@ -491,6 +649,12 @@ class BollingerBands(CustomFactor):
         out.upper = middle + difference
         out.lower = middle - difference
 
+    def compute_block(self, dates, assets, out, mask, close, k):
+        difference = k * _rolling_nanstd(close, self.window_length)
+        out.middle = middle = _rolling_nanmean(close, self.window_length)
+        out.upper = middle + difference
+        out.lower = middle - difference
+
 
 class Aroon(CustomFactor):
     """
@@ -530,6 +694,29 @@ class Aroon(CustomFactor):
             out=out.down,
         )
 
+    def compute_block(self, dates, assets, out, mask, lows, highs):
+        wl = self.window_length
+        # The masked out assets may have windows without any value, which
+        # nanargmax and nanargmin reject, so the missing values are replaced
+        # by values which are never picked.
+        high_date_index = _rolling_windows(
+            where(isnan(highs), NINF, highs), wl,
+        ).argmax(axis=1)
+        low_date_index = _rolling_windows(
+            where(isnan(lows), inf, lows), wl,
+        ).argmin(axis=1)
+
+        out.up = where(
+            _rolling_sum(isfinite(highs), wl) > 0,
+            (100 * high_date_index) / (wl - 1),
+            nan,
+        )
+        out.down = where(
+            _rolling_sum(isfinite(lows), wl) > 0,
+            (100 * low_date_index) / (wl - 1),
+            nan,
+        )
+
 
 class FastStochasticOscillator(CustomFactor):
     """
@@ -571,6 +758,19 @@ class FastStochasticOscillator(CustomFactor):
             out=out,
         )
 
+    def compute_block(self, dates, assets, out, mask, closes, lows, highs):
+        wl = self.window_length
+        evaluate(
+            '((tc - ll) / (hh - ll)) * 100',
+            local_dict={
+                'tc': closes[wl - 1:],
+                'll': nanmin(_rolling_windows(lows, wl), axis=1),
+                'hh': nanmax(_rolling_windows(highs, wl), axis=1),
+            },
+            global_dict={},
+            out=out,
+        )
+
 
 class IchimokuKinkoHyo(CustomFactor):
     """Compute the various metrics for the Ichimoku Kinko Hyo (Ichimoku Cloud).
@@ -641,6 +841,33 @@ class IchimokuKinkoHyo(CustomFactor):
         out.senkou_span_b = (high.max(axis=0) + low.min(axis=0)) / 2
         out.chikou_span = close[chikou_span_length]
 
+    def compute_block(self,
+                      dates,
+                      assets,
+                      out,
+                      mask,
+                      high,
+                      low,
+                      close,
+                      tenkan_sen_length,
+                      kijun_sen_length,
+                      chikou_span_length):
+        wl = self.window_length
+
+        def midpoints(length):
+            # A length of 0 spans the whole window, as ``high[-0:]`` does.
+            length = length or wl
+            return (
+                _rolling_windows(high[wl - length:], length).max(axis=1) +
+                _rolling_windows(low[wl - length:], length).min(axis=1)
+            ) / 2
+
+        out.tenkan_sen = tenkan_sen = midpoints(tenkan_sen_length)
+        out.kijun_sen = kijun_sen = midpoints(kijun_sen_length)
+        out.senkou_span_a = (tenkan_sen + kijun_sen) / 2
+        out.senkou_span_b = midpoints(wl)
+        out.chikou_span = close[chikou_span_length:][:len(out)]
+
 
 class RateOfChangePercentage(CustomFactor):
     """
@@ -664,6 +891,16 @@ class RateOfChangePercentage(CustomFactor):
                  out=out,
                  )
 
+    def compute_block(self, dates, assets, out, mask, close):
+        evaluate('((tc - pc) / pc) * 100',
+                 local_dict={
+                     'tc': close[self.window_length - 1:],
+                     'pc': close[:len(out)]
+                 },
+                 global_dict={},
+                 out=out,
+                 )
+
 
 class TrueRange(CustomFactor):
     """
@@ -697,6 +934,10 @@ class TrueRange(CustomFactor):
             2
         )
 
+    def compute_block(self, dates, assets, out, mask, highs, lows, closes):
+        # Each window holds a single day along with the previous close.
+        self.compute(dates, assets, out, highs, lows, closes)
+
 
 class MovingAverageConvergenceDivergenceSignal(CustomFactor):
     """
@@ -805,6 +1046,11 @@ class AnnualizedVolatility(CustomFactor):
     def compute(self, today, assets, out, returns, annualization_factor):
         out[:] = nanstd(returns, axis=0) * (annualization_factor ** .5)
 
+    def compute_block(self, dates, assets, out, mask, returns,
+                      annualization_factor):
+        out[:] = _rolling_nanstd(returns, self.window_length) * \
+            (annualization_factor ** .5)
+
 
 # Convenience aliases.
 EWMA = ExponentialWeightedMovingAverage
@@ -6,6 +6,7 @@ from textwrap import dedent
 from numpy import (
     array,
     full,
+    ndarray,
     recarray,
     vstack,
 )
@@ -104,6 +105,10 @@ class CustomTermMixin(object):
     Implements `_compute` in terms of a user-defined `compute` function, which
     is mapped over the input windows.
 
+    Terms may also implement `compute_block`, which computes the output of
+    every date at once from the whole input arrays. It is used instead of
+    `compute` when none of the inputs carries adjustments.
+
     Used by CustomFactor, CustomFilter, CustomClassifier, etc.
     """
     ctx = nullctx()
@@ -146,6 +151,41 @@ class CustomTermMixin(object):
         """
         raise NotImplementedError()
 
+    def compute_block(self, dates, assets, out, mask, *arrays):
+        """
+        Override this method with a function that writes the values of every
+        date into `out`.
+
+        Parameters
+        ----------
+        dates : pd.DatetimeIndex
+            The dates of the rows of `out`.
+        assets : np.ndarray[int64]
+            The sids of the columns of `out`.
+        out : np.ndarray
+            The output array, with a row per date.
+        mask : np.ndarray[bool]
+            Whether each asset is included on each date. The values of the
+            masked out assets are discarded.
+        *arrays : np.ndarray
+            The inputs, with ``window_length - 1`` more rows than `out`: the
+            window of the row ``i`` of `out` is ``array[i:i + window_length]``.
+        """
+        raise NotImplementedError()
+
+    @property
+    def _block_computable(self):
+        """
+        Whether `compute_block` was implemented along with, or instead of,
+        the `compute` used by this term.
+        """
+        for cls in type(self).__mro__:
+            if 'compute' in vars(cls):
+                return 'compute_block' in vars(cls)
+            if 'compute_block' in vars(cls):
+                return True
+        return False
+
     def _allocate_output(self, windows, shape):
         """
         Allocate an output array whose rows should be passed to `self.compute`.
@@ -191,6 +231,10 @@ class CustomTermMixin(object):
         Call the user's `compute` function on each window with a pre-built
         output array.
         """
+        if windows and all(isinstance(w, ndarray) for w in windows):
+            # The engine provides whole arrays to the terms computing blocks.
+            return self._compute_block(windows, dates, assets, mask)
+
         format_inputs = self._format_inputs
         compute = self.compute
         params = self.params
@@ -215,6 +259,25 @@ class CustomTermMixin(object):
                 out[idx][out_mask] = out_row
         return out
 
+    def _compute_block(self, arrays, dates, assets, mask):
+        """
+        Call the user's `compute_block` function on the whole inputs with a
+        pre-built output array.
+        """
+        ndim = self.ndim
+
+        shape = (len(mask), 1) if ndim == 1 else mask.shape
+        out = self._allocate_output(arrays, shape)
+
+        with self.ctx:
+            self.compute_block(dates, assets, out, mask, *arrays,
+                               **self.params)
+
+        # Never apply a mask to 1D outputs.
+        if ndim != 1:
+            out[~mask] = self.missing_value
+        return out
+
     def short_repr(self):
         return type(self).__name__ + '(%d)' % self.window_length
 
@@ -1,15 +1,46 @@
 from datetime import time
 from pytz import timezone
 
-from pandas import Timestamp
+import numpy as np
+import pandas as pd
+from pandas import DataFrame, DatetimeIndex, Timestamp
 from pandas.tseries.offsets import DateOffset
 
+from catalyst.utils.input_validation import (
+    attrgetter,
+    coerce,
+    preprocess,
+)
 from catalyst.utils.memoize import lazyval
 
-from .trading_calendar import TradingCalendar
+from .trading_calendar import TradingCalendar, end_default, NANOS_IN_MINUTE
+
+MINUTES_IN_DAY = 1440
+NANOS_IN_DAY = MINUTES_IN_DAY * NANOS_IN_MINUTE
+
+# The offset of the close from the session label
+CLOSE_OFFSET_NANOS = (MINUTES_IN_DAY - 1) * NANOS_IN_MINUTE
+
+
+def _ceil_div(a, b):
+    return -(-a // b)
 
 
 class OpenExchangeCalendar(TradingCalendar):
+    """
+    A calendar trading every minute of every day.
+
+    Since every session holds the same 1440 contiguous minutes, the
+    conversions between minutes, their positions and their sessions
+    are computed arithmetically. The schedule, the sessions and the
+    minutes of the calendar are only built when requested.
+
+    Parameters
+    ----------
+    end: pd.Timestamp
+        The date of the last session.
+    """
+
     @property
     def name(self):
         return 'OPEN'
@@ -30,6 +61,314 @@ class OpenExchangeCalendar(TradingCalendar):
     def day(self):
         return DateOffset(days=1)
 
-    def __init__(self, *args, **kwargs):
-        super(OpenExchangeCalendar, self).__init__(
-            start=Timestamp('2015-3-1', tz='UTC'), **kwargs)
+    def __init__(self, end=end_default):
+        start = Timestamp('2015-3-1', tz='UTC')
+
+        self._first_nanos = start.value
+        self._session_count = int(
+            (Timestamp(end).value - self._first_nanos) // NANOS_IN_DAY
+        ) + 1
+        self._minute_count = self._session_count * MINUTES_IN_DAY
+
+        self.first_trading_session = start
+        self.last_trading_session = self._session(self._session_count - 1)
+
+        self._early_closes = DatetimeIndex([], tz='UTC')
+
+    def _session(self, idx):
+        if idx < 0 or idx >= self._session_count:
+            raise IndexError('session index out of range: {}'.format(idx))
+
+        return Timestamp(self._first_nanos + idx * NANOS_IN_DAY, tz='UTC')
+
+    def _minute(self, idx):
+        if idx < 0 or idx >= self._minute_count:
+            raise IndexError('minute index out of range: {}'.format(idx))
+
+        return Timestamp(self._first_nanos + idx * NANOS_IN_MINUTE, tz='UTC')
+
+    def _session_idx(self, session_label):
+        """
+        The position of a session label, KeyError if it is not a session.
+
+        """
+        offset = Timestamp(session_label).value - self._first_nanos
+        idx, remainder = divmod(offset, NANOS_IN_DAY)
+        if remainder != 0 or idx < 0 or idx >= self._session_count:
+            raise KeyError(session_label)
+
+        return int(idx)
+
+    def _minutes_range(self, start_idx, end_idx):
+        """
+        The minutes between two positions, end excluded.
+
+        """
+        start_idx = min(max(start_idx, 0), self._minute_count)
+        end_idx = min(max(end_idx, start_idx), self._minute_count)
+
+        return pd.date_range(
+            start=Timestamp(
+                self._first_nanos + start_idx * NANOS_IN_MINUTE, tz='UTC'
+            ),
+            periods=end_idx - start_idx,
+            freq='T',
+        )
+
+    def _sessions_range(self, start_idx, end_idx):
+        """
+        The sessions between two positions, end excluded.
+
+        """
+        start_idx = min(max(start_idx, 0), self._session_count)
+        end_idx = min(max(end_idx, start_idx), self._session_count)
+
+        return pd.date_range(
+            start=Timestamp(
+                self._first_nanos + start_idx * NANOS_IN_DAY, tz='UTC'
+            ),
+            periods=end_idx - start_idx,
+            freq=self.day,
+        )
+
+    @lazyval
+    def all_sessions(self):
+        return self._sessions_range(0, self._session_count)
+
+    @lazyval
+    def _opens(self):
+        return self.all_sessions
+
+    @lazyval
+    def _closes(self):
+        return self.all_sessions + pd.Timedelta(CLOSE_OFFSET_NANOS)
+
+    @lazyval
+    def schedule(self):
+        return DataFrame(
+            index=self.all_sessions,
+            columns=['market_open', 'market_close'],
+            data={
+                'market_open': self._opens,
+                'market_close': self._closes,
+            },
+            dtype='datetime64[ns, UTC]',
+        )
+
+    @lazyval
+    def market_opens_nanos(self):
+        return self._first_nanos + np.arange(
+            self._session_count, dtype=np.int64
+        ) * NANOS_IN_DAY
+
+    @lazyval
+    def market_closes_nanos(self):
+        return self.market_opens_nanos + CLOSE_OFFSET_NANOS
+
+    @lazyval
+    def _trading_minutes_nanos(self):
+        return self._first_nanos + np.arange(
+            self._minute_count, dtype=np.int64
+        ) * NANOS_IN_MINUTE
+
+    @lazyval
+    def all_minutes(self):
+        return self._minutes_range(0, self._minute_count)
+
+    @property
+    def first_session(self):
+        return self.first_trading_session
+
+    @property
+    def last_session(self):
+        return self.last_trading_session
+
+    def minutes_count_for_sessions_in_range(self, start_session, end_session):
+        return len(
+            self.sessions_in_range(start_session, end_session)
+        ) * MINUTES_IN_DAY
+
+    def is_session(self, dt):
+        try:
+            self._session_idx(dt)
+            return True
+        except KeyError:
+            return False
+
+    def is_open_on_minute(self, dt):
+        offset = dt.value - self._first_nanos
+        idx, remainder = divmod(offset, NANOS_IN_DAY)
+        return 0 <= idx < self._session_count and \
+            remainder <= CLOSE_OFFSET_NANOS
+
+    def next_open(self, dt):
+        offset = dt.value - self._first_nanos
+        return self._session(max(offset // NANOS_IN_DAY + 1, 0))
+
+    def next_close(self, dt):
+        offset = dt.value - self._first_nanos - CLOSE_OFFSET_NANOS
+        idx = max(offset // NANOS_IN_DAY + 1, 0)
+        return self._session(idx) + pd.Timedelta(CLOSE_OFFSET_NANOS)
+
+    def previous_open(self, dt):
+        offset = dt.value - self._first_nanos
+        idx = _ceil_div(offset, NANOS_IN_DAY) - 1
+        if idx < 0:
+            raise ValueError("Cannot go earlier in calendar!")
+
+        return self._session(min(idx, self._session_count - 1))
+
+    def previous_close(self, dt):
+        offset = dt.value - self._first_nanos - CLOSE_OFFSET_NANOS
+        idx = _ceil_div(offset, NANOS_IN_DAY) - 1
+        if idx < 0:
+            raise ValueError("Cannot go earlier in calendar!")
+
+        idx = min(idx, self._session_count - 1)
+        return self._session(idx) + pd.Timedelta(CLOSE_OFFSET_NANOS)
+
+    def next_minute(self, dt):
+        offset = dt.value - self._first_nanos
+        return self._minute(max(offset // NANOS_IN_MINUTE + 1, 0))
+
+    def previous_minute(self, dt):
+        offset = dt.value - self._first_nanos
+        idx = _ceil_div(offset, NANOS_IN_MINUTE) - 1
+        if idx < 0:
+            raise ValueError("Cannot go earlier in calendar!")
+
+        return self._minute(min(idx, self._minute_count - 1))
+
+    def next_session_label(self, session_label):
+        idx = self._session_idx(session_label)
+        if idx == self._session_count - 1:
+            raise ValueError("There is no next session as this is the end"
+                             " of the exchange calendar.")
+
+        return self._session(idx + 1)
+
+    def previous_session_label(self, session_label):
+        idx = self._session_idx(session_label)
+        if idx == 0:
+            raise ValueError("There is no previous session as this is the"
+                             " beginning of the exchange calendar.")
+
+        return self._session(idx - 1)
+
+    def minutes_for_session(self, session_label):
+        start_idx = self._session_idx(session_label) * MINUTES_IN_DAY
+        return self._minutes_range(start_idx, start_idx + MINUTES_IN_DAY)
+
+    def minutes_window(self, start_dt, count):
+        offset = start_dt.value - self._first_nanos
+        start_idx = offset // NANOS_IN_MINUTE
+
+        if start_idx < 0 or start_idx >= self._minute_count:
+            raise KeyError("Can't start minute window at {}".format(start_dt))
+
+        end_idx = start_idx + count
+
+        if start_idx > end_idx:
+            return self._minutes_range(max(end_idx + 1, 0), start_idx + 1)
+        else:
+            return self._minutes_range(start_idx, end_idx)
+
+    def sessions_in_range(self, start_session_label, end_session_label):
+        start_offset = \
+            Timestamp(start_session_label).value - self._first_nanos
+        end_offset = Timestamp(end_session_label).value - self._first_nanos
+
+        return self._sessions_range(
+            _ceil_div(start_offset, NANOS_IN_DAY),
+            end_offset // NANOS_IN_DAY + 1,
+        )
+
+    def sessions_window(self, session_label, count):
+        start_idx = self._session_idx(session_label)
+        end_idx = start_idx + count
+
+        return self._sessions_range(
+            min(start_idx, end_idx), max(start_idx, end_idx) + 1
+        )
+
+    def session_distance(self, start_session_label, end_session_label):
+        start = self.minute_to_session_label(start_session_label)
+        end = self.minute_to_session_label(end_session_label)
+
+        return abs(int((end.value - start.value) // NANOS_IN_DAY))
+
+    def minutes_in_range(self, start_minute, end_minute):
+        start_offset = start_minute.value - self._first_nanos
+        end_offset = end_minute.value - self._first_nanos
+
+        return self._minutes_range(
+            _ceil_div(start_offset, NANOS_IN_MINUTE),
+            end_offset // NANOS_IN_MINUTE + 1,
+        )
+
+    def open_and_close_for_session(self, session_label):
+        session = self._session(self._session_idx(session_label))
+        return session, session + pd.Timedelta(CLOSE_OFFSET_NANOS)
+
+    def session_open(self, session_label):
+        return self._session(self._session_idx(session_label))
+
+    def session_close(self, session_label):
+        return self.session_open(session_label) + \
+            pd.Timedelta(CLOSE_OFFSET_NANOS)
+
+    def session_opens_in_range(self, start_session_label, end_session_label):
+        sessions = self.sessions_in_range(
+            start_session_label, end_session_label
+        )
+        return pd.Series(sessions, index=sessions, name='market_open')
+
+    def session_closes_in_range(self, start_session_label, end_session_label):
+        sessions = self.sessions_in_range(
+            start_session_label, end_session_label
+        )
+        return pd.Series(
+            sessions + pd.Timedelta(CLOSE_OFFSET_NANOS),
+            index=sessions,
+            name='market_close',
+        )
+
+    @preprocess(dt=coerce(pd.Timestamp, attrgetter('value')))
+    def minute_to_session_label(self, dt, direction="next"):
+        offset = dt - self._first_nanos - CLOSE_OFFSET_NANOS
+
+        # The first session closing on or after the minute
+        idx = max(_ceil_div(offset, NANOS_IN_DAY), 0)
+        current_or_next_session = self._session(idx)
+
+        if direction == "next":
+            return current_or_next_session
+
+        is_open = dt >= current_or_next_session.value
+        if direction == "previous":
+            if not is_open:
+                # if the exchange is closed, use the previous session
+                return self._session(idx - 1)
+        elif direction == "none":
+            if not is_open:
+                # if the exchange is closed, blow up
+                raise ValueError("The given dt is not an exchange minute!")
+        else:
+            # invalid direction
+            raise ValueError("Invalid direction parameter: "
+                             "{0}".format(direction))
+
+        return current_or_next_session
+
+    def minute_index_to_session_labels(self, index):
+        offsets = index.values.astype(np.int64) - \
+            self._first_nanos - CLOSE_OFFSET_NANOS
+
+        idx = np.maximum(-(-offsets // NANOS_IN_DAY), 0)
+        if len(idx) > 0 and idx.max() >= self._session_count:
+            raise IndexError('minutes past the end of the calendar')
+
+        return DatetimeIndex(
+            (self._first_nanos + idx * NANOS_IN_DAY).astype('datetime64[ns]'),
+            tz='UTC',
+        )
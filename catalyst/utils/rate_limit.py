@@ -0,0 +1,96 @@
+from threading import Lock
+from time import sleep, time
+
+
+class TokenBucket(object):
+    """
+    A thread-safe token bucket limiting the rate of requests.
+
+    Parameters
+    ----------
+    rate : float
+        The number of tokens added per second.
+    capacity : int, optional
+        The maximum number of tokens, i.e. the largest burst of requests.
+        One token by default.
+    """
+    def __init__(self, rate, capacity=1):
+        if rate <= 0:
+            raise ValueError('rate must be positive, got %r' % rate)
+
+        self.rate = float(rate)
+        self.capacity = max(capacity, 1)
+
+        self._tokens = float(self.capacity)
+        self._last = time()
+        self._lock = Lock()
+
+    def _refill(self, now):
+        self._tokens = min(
+            self.capacity, self._tokens + (now - self._last) * self.rate
+        )
+        self._last = now
+
+    def try_acquire(self, tokens=1):
+        """Take tokens from the bucket without waiting.
+
+        Returns
+        -------
+        acquired : bool
+            Whether the tokens were available.
+        """
+        with self._lock:
+            self._refill(time())
+            if self._tokens >= tokens:
+                self._tokens -= tokens
+                return True
+
+            return False
+
+    def acquire(self, tokens=1):
+        """Take tokens from the bucket, waiting until they are available.
+
+        Returns
+        -------
+        waited : float
+            The number of seconds spent waiting.
+        """
+        waited = 0.0
+        while True:
+            with self._lock:
+                self._refill(time())
+                if self._tokens >= tokens:
+                    self._tokens -= tokens
+                    return waited
+
+                wait = (tokens - self._tokens) / self.rate
+
+            sleep(wait)
+            waited += wait
+
+
+_buckets = {}
+_buckets_lock = Lock()
+
+
+def get_token_bucket(name, rate, capacity=1):
+    """The token bucket shared by all the users of a rate limit.
+
+    Parameters
+    ----------
+    name : str
+        The name of the rate limit, e.g. the exchange name.
+    rate : float
+        The number of tokens added per second, used on creation only.
+    capacity : int, optional
+        The size of the bucket, used on creation only.
+
+    Returns
+    -------
+    bucket : TokenBucket
+    """
+    with _buckets_lock:
+        if name not in _buckets:
+            _buckets[name] = TokenBucket(rate, capacity)
+
+        return _buckets[name]
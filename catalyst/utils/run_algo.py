@@ -98,7 +98,11 @@ def _run(handle_data,
          analyze_live,
          simulate_orders,
          auth_aliases,
-         stats_output):
+         stats_output,
+         checkpoint_interval=1,
+         market_data_folder=None,
+         bar_interval='1T',
+         streaming_risk=False):
     """Run a backtest for the given algorithm.
 
     This is shared between the cli and :func:`catalyst.run_algo`.
@@ -209,10 +213,14 @@ def _run(handle_data,
     )
     env.asset_finder = ExchangeAssetFinder(exchanges=exchanges)
 
+    # A single loader lets the pipeline engine load all the pricing columns
+    # of a chunk together.
+    pricing_loader = ExchangePricingLoader(data_frequency)
+
     def choose_loader(column):
         bound_cols = TradingPairPricing.columns
         if column in bound_cols:
-            return ExchangePricingLoader(data_frequency)
+            return pricing_loader
         raise ValueError(
             "No PipelineLoader registered for column %s." % column
         )
@@ -245,7 +253,8 @@ def _run(handle_data,
             exchanges=exchanges,
             asset_finder=env.asset_finder,
             trading_calendar=open_calendar,
-            first_trading_day=pd.to_datetime('today', utc=True)
+            first_trading_day=pd.to_datetime('today', utc=True),
+            market_data_folder=market_data_folder,
         )
 
         sim_params = create_simulation_parameters(
@@ -267,6 +276,8 @@ def _run(handle_data,
             simulate_orders=simulate_orders,
             stats_output=stats_output,
             analyze_live=analyze_live,
+            checkpoint_interval=checkpoint_interval,
+            bar_interval=bar_interval,
             start=start,
             is_start=is_start,
             end=end,
@@ -347,6 +358,7 @@ def _run(handle_data,
         env=env,
         get_pipeline_loader=choose_loader,
         sim_params=sim_params,
+        streaming_risk=streaming_risk,
         **{
             'initialize': initialize,
             'handle_data': handle_data,
@@ -448,7 +460,11 @@ def run_algorithm(initialize,
                   simulate_orders=True,
                   auth_aliases=None,
                   stats_output=None,
-                  output=os.devnull):
+                  output=os.devnull,
+                  checkpoint_interval=1,
+                  market_data_folder=None,
+                  bar_interval='1T',
+                  streaming_risk=False):
     """
     Run a trading algorithm.
 
@@ -534,6 +550,18 @@ def run_algorithm(initialize,
     output: str, optional
         The output file path to which the algorithm performance
         is serialized.
+    checkpoint_interval: int, optional
+        The number of bars between checkpoints of the live algorithm state.
+    market_data_folder: str, optional
+        The folder where live algorithms running on the same machine share
+        the tickers and candles fetched from the exchanges.
+    bar_interval: str or pd.Timedelta, optional
+        The time between two bars of a live algorithm, e.g. '15s'.
+        One minute by default.
+    streaming_risk: bool, optional
+        Whether the cumulative risk metrics are updated from running
+        aggregates instead of being recomputed over the whole history
+        on each update.
 
     Returns
     -------
@@ -640,5 +668,9 @@ def run_algorithm(initialize,
         analyze_live=analyze_live,
         simulate_orders=simulate_orders,
         auth_aliases=auth_aliases,
-        stats_output=stats_output
+        stats_output=stats_output,
+        checkpoint_interval=checkpoint_interval,
+        market_data_folder=market_data_folder,
+        bar_interval=bar_interval,
+        streaming_risk=streaming_risk,
     )
@@ -0,0 +1,90 @@
+"""
+Benchmark the block compute of the crypto technical factors against their
+date by date compute.
+
+Usage: python etc/benchmark_block_compute.py [ndates] [nassets]
+"""
+from __future__ import print_function
+
+import sys
+from timeit import default_timer
+
+import numpy as np
+import pandas as pd
+
+from catalyst.lib.adjusted_array import AdjustedArray
+from catalyst.pipeline.data import CryptoPricing
+from catalyst.pipeline.factors.crypto import (
+    AnnualizedVolatility,
+    BollingerBands,
+    EWMA,
+    FastStochasticOscillator,
+    RSI,
+    SimpleMovingAverage,
+    VWAP,
+)
+
+
+FACTORS = [
+    SimpleMovingAverage(inputs=[CryptoPricing.close], window_length=50),
+    RSI(),
+    BollingerBands(window_length=20, k=2),
+    EWMA.from_span(
+        inputs=[CryptoPricing.close], window_length=50, span=20,
+    ),
+    AnnualizedVolatility(window_length=30),
+    VWAP(window_length=20),
+    FastStochasticOscillator(),
+]
+
+
+def make_inputs(factor, ndates, nassets):
+    rand = np.random.RandomState(0)
+    shape = (ndates + factor.window_length - 1, nassets)
+    arrays = [rand.uniform(90, 110, shape) for _ in factor.inputs]
+    dates = pd.date_range('2017-01-01', periods=ndates, tz='UTC')
+    assets = np.arange(nassets, dtype=np.int64)
+    mask = np.ones((ndates, nassets), dtype=bool)
+    return arrays, dates, assets, mask
+
+
+def best_of(func, repeat=3):
+    timings = []
+    for _ in range(repeat):
+        start = default_timer()
+        func()
+        timings.append(default_timer() - start)
+    return min(timings)
+
+
+def main(ndates=365, nassets=1000):
+    print('{:<36}{:>12}{:>12}{:>10}'.format(
+        'factor', 'per row (s)', 'block (s)', 'speedup',
+    ))
+    for factor in FACTORS:
+        arrays, dates, assets, mask = make_inputs(factor, ndates, nassets)
+
+        def per_row():
+            windows = [
+                AdjustedArray(a, None, {}, np.nan).traverse(
+                    factor.window_length,
+                )
+                for a in arrays
+            ]
+            factor._compute(windows, dates, assets, mask)
+
+        def block():
+            factor._compute(arrays, dates, assets, mask)
+
+        per_row_time = best_of(per_row)
+        block_time = best_of(block)
+        print('{:<36}{:>12.4f}{:>12.4f}{:>9.1f}x'.format(
+            factor.short_repr(),
+            per_row_time,
+            block_time,
+            per_row_time / block_time,
+        ))
+
+
+if __name__ == '__main__':
+    main(*map(int, sys.argv[1:]))
@@ -0,0 +1,166 @@
+from datetime import time
+from unittest import TestCase
+
+import numpy as np
+import pandas as pd
+from pandas.tseries.offsets import DateOffset
+from pandas.util.testing import assert_index_equal
+from pytz import timezone
+
+from catalyst.utils.calendars.exchange_calendar_open import \
+    OpenExchangeCalendar
+from catalyst.utils.calendars.trading_calendar import TradingCalendar
+from catalyst.utils.memoize import lazyval
+
+
+class EagerOpenCalendar(TradingCalendar):
+    """
+    The OPEN calendar built with the generic schedule as a reference.
+    """
+    @property
+    def name(self):
+        return 'EAGER_OPEN'
+
+    @property
+    def tz(self):
+        return timezone('UTC')
+
+    @property
+    def open_time(self):
+        return time(0)
+
+    @property
+    def close_time(self):
+        return time(23, 59)
+
+    @lazyval
+    def day(self):
+        return DateOffset(days=1)
+
+
+class OpenCalendarTestCase(TestCase):
+    @classmethod
+    def setUpClass(cls):
+        end = pd.Timestamp('2015-06-01', tz='UTC')
+        cls.calendar = OpenExchangeCalendar(end=end)
+        cls.expected = EagerOpenCalendar(
+            start=pd.Timestamp('2015-3-1', tz='UTC'), end=end
+        )
+
+        first = cls.expected.all_minutes[0].value
+        # Leaving out the last sessions which have no next open
+        last = cls.expected.all_minutes[-2 * 1440].value
+        random = np.random.RandomState(0)
+        nanos = random.randint(first // 10 ** 9, last // 10 ** 9, 200)
+        cls.dts = [pd.Timestamp(n * 10 ** 9, tz='UTC') for n in nanos] + [
+            cls.expected.all_minutes[1],
+            cls.expected.all_minutes[1439],
+            cls.expected.all_minutes[1440],
+            pd.Timestamp('2015-04-01 23:59:30', tz='UTC'),
+        ]
+
+    def test_sessions_and_minutes(self):
+        assert_index_equal(
+            self.calendar.all_sessions, self.expected.all_sessions
+        )
+        assert_index_equal(
+            self.calendar.all_minutes, self.expected.all_minutes
+        )
+        self.assertEqual(
+            self.calendar.first_trading_session,
+            self.expected.first_trading_session,
+        )
+        self.assertEqual(
+            self.calendar.last_trading_session,
+            self.expected.last_trading_session,
+        )
+        np.testing.assert_array_equal(
+            self.calendar.market_closes_nanos,
+            self.expected.market_closes_nanos,
+        )
+
+    def test_minute_lookups(self):
+        for dt in self.dts:
+            for direction in ['next', 'previous']:
+                self.assertEqual(
+                    self.calendar.minute_to_session_label(dt, direction),
+                    self.expected.minute_to_session_label(dt, direction),
+                )
+
+            self.assertEqual(
+                self.calendar.is_open_on_minute(dt),
+                self.expected.is_open_on_minute(dt),
+            )
+            for method in ['next_open', 'next_close', 'previous_open',
+                           'previous_close', 'next_minute',
+                           'previous_minute']:
+                try:
+                    expected = getattr(self.expected, method)(dt)
+                except ValueError:
+                    # Before the first open or close of the calendar
+                    with self.assertRaises(ValueError):
+                        getattr(self.calendar, method)(dt)
+                    continue
+
+                self.assertEqual(
+                    getattr(self.calendar, method)(dt), expected, method
+                )
+
+        minutes = pd.DatetimeIndex(sorted(self.dts)).floor('1 min')
+        assert_index_equal(
+            self.calendar.minute_index_to_session_labels(minutes),
+            self.expected.minute_index_to_session_labels(minutes),
+        )
+
+    def test_ranges(self):
+        start = pd.Timestamp('2015-03-10 13:21', tz='UTC')
+        end = pd.Timestamp('2015-03-12 02:07:30', tz='UTC')
+        assert_index_equal(
+            self.calendar.minutes_in_range(start, end),
+            self.expected.minutes_in_range(start, end),
+        )
+        assert_index_equal(
+            self.calendar.minutes_window(start, 100),
+            self.expected.minutes_window(start, 100),
+        )
+        assert_index_equal(
+            self.calendar.minutes_window(start, -100),
+            self.expected.minutes_window(start, -100),
+        )
+        assert_index_equal(
+            self.calendar.sessions_in_range(start, end),
+            self.expected.sessions_in_range(start, end),
+        )
+
+        session = pd.Timestamp('2015-03-10', tz='UTC')
+        assert_index_equal(
+            self.calendar.minutes_for_session(session),
+            self.expected.minutes_for_session(session),
+        )
+        assert_index_equal(
+            self.calendar.sessions_window(session, -5),
+            self.expected.sessions_window(session, -5),
+        )
+        self.assertEqual(
+            self.calendar.open_and_close_for_session(session),
+            self.expected.open_and_close_for_session(session),
+        )
+        self.assertEqual(
+            self.calendar.next_session_label(session),
+            self.expected.next_session_label(session),
+        )
+        self.assertEqual(
+            self.calendar.session_distance(start, end),
+            self.expected.session_distance(start, end),
+        )
+        self.assertEqual(
+            self.calendar.minutes_count_for_sessions_in_range(
+                session, pd.Timestamp('2015-03-20', tz='UTC')
+            ),
+            self.expected.minutes_count_for_sessions_in_range(
+                session, pd.Timestamp('2015-03-20', tz='UTC')
+            ),
+        )
+
+        with self.assertRaises(KeyError):
+            self.calendar.open_and_close_for_session(start)
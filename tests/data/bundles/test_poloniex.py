@@ -0,0 +1,146 @@
+import json
+import threading
+
+import numpy as np
+import pandas as pd
+from six.moves.BaseHTTPServer import BaseHTTPRequestHandler, HTTPServer
+from six.moves.urllib.parse import parse_qs, urlparse
+
+from catalyst.data.bundles.poloniex import PoloniexBundle
+from catalyst.testing.fixtures import CatalystTestCase, WithInstanceTmpDir
+from catalyst.utils.cache import dataframe_cache
+from catalyst.utils.calendars import get_calendar
+
+SYMBOLS = ['BTC_ETH', 'BTC_LTC', 'BTC_XRP', 'USDT_BTC', 'USDT_ETH']
+
+DAYS = pd.date_range('2017-01-01', '2017-03-31', tz='UTC')
+
+
+class ChartDataHandler(BaseHTTPRequestHandler):
+    requests = []
+    lock = threading.Lock()
+
+    def do_GET(self):
+        query = parse_qs(urlparse(self.path).query)
+        symbol = query['currencyPair'][0]
+        start = pd.Timestamp(float(query['start'][0]), unit='s', tz='UTC')
+        end = pd.Timestamp(float(query['end'][0]), unit='s', tz='UTC')
+        with self.lock:
+            self.requests.append((symbol, start, end))
+
+        price = float(SYMBOLS.index(symbol) + 1)
+        days = DAYS[(DAYS >= start) & (DAYS <= end)]
+        body = json.dumps([
+            dict(
+                date=int(day.value // 10 ** 9),
+                open=price,
+                high=price,
+                low=price,
+                close=price,
+                volume=float(day.day),
+            ) for day in days
+        ]).encode('utf-8')
+
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+class PoloniexBundleTestCase(WithInstanceTmpDir, CatalystTestCase):
+    @classmethod
+    def init_class_fixtures(cls):
+        super(PoloniexBundleTestCase, cls).init_class_fixtures()
+        # A local stand-in for the poloniex public api
+        cls.server = HTTPServer(('127.0.0.1', 0), ChartDataHandler)
+        thread = threading.Thread(target=cls.server.serve_forever)
+        thread.daemon = True
+        thread.start()
+        cls.add_class_callback(cls.server.server_close)
+        cls.add_class_callback(cls.server.shutdown)
+
+        url = 'http://127.0.0.1:{}/public'.format(cls.server.server_port)
+
+        class LocalPoloniexBundle(PoloniexBundle):
+            @property
+            def api_url(self):
+                return url
+
+        cls.bundle_class = LocalPoloniexBundle
+
+    def init_instance_fixtures(self):
+        super(PoloniexBundleTestCase, self).init_instance_fixtures()
+        del ChartDataHandler.requests[:]
+
+    def fetch(self, bundle, cache, end_session, start_session=DAYS[0]):
+        return list(bundle._fetch_symbol_iter(
+            None,
+            cache,
+            pd.Series(SYMBOLS),
+            get_calendar('OPEN'),
+            start_session,
+            end_session,
+            'daily',
+            1,
+        ))
+
+    def test_incremental_fetch(self):
+        bundle = self.bundle_class(fetch_workers=3)
+        cache = dataframe_cache(
+            self.instance_tmpdir.path, serialization='pickle',
+        )
+
+        end_session = pd.Timestamp('2017-02-28', tz='UTC')
+        frames = self.fetch(bundle, cache, end_session)
+        self.assertEqual(
+            [asset_id for asset_id, _ in frames], list(range(len(SYMBOLS))),
+        )
+        self.assertEqual(
+            sorted(symbol for symbol, _, _ in ChartDataHandler.requests),
+            sorted(SYMBOLS),
+        )
+        for _, start, _ in ChartDataHandler.requests:
+            self.assertEqual(start, DAYS[0])
+
+        del ChartDataHandler.requests[:]
+
+        # Only the bars from the last cached one on are requested
+        end_session = DAYS[-1]
+        frames = self.fetch(bundle, cache, end_session)
+        self.assertEqual(len(ChartDataHandler.requests), len(SYMBOLS))
+        for _, start, _ in ChartDataHandler.requests:
+            self.assertEqual(start, pd.Timestamp('2017-02-28', tz='UTC'))
+
+        for asset_id, raw_data in frames:
+            self.assertEqual(list(raw_data.index), list(DAYS))
+            np.testing.assert_array_equal(
+                raw_data['volume'].values, DAYS.day.astype(float),
+            )
+            np.testing.assert_array_equal(
+                raw_data['close'].values, np.full(len(DAYS), asset_id + 1.),
+            )
+            self.assertEqual(
+                list(cache['{}.daily.frame'.format(SYMBOLS[asset_id])].index),
+                list(raw_data.index),
+            )
+
+    def test_fetch_before_cached_start(self):
+        bundle = self.bundle_class(fetch_workers=3)
+        cache = dataframe_cache(
+            self.instance_tmpdir.path, serialization='pickle',
+        )
+        self.fetch(bundle, cache, DAYS[-1], start_session=DAYS[30])
+        del ChartDataHandler.requests[:]
+
+        # The sessions before the cached ones are fetched as well
+        frames = self.fetch(bundle, cache, DAYS[-1])
+        self.assertEqual(len(ChartDataHandler.requests), len(SYMBOLS))
+        for _, start, _ in ChartDataHandler.requests:
+            self.assertEqual(start, DAYS[0])
+
+        for _, raw_data in frames:
+            self.assertEqual(list(raw_data.index), list(DAYS))
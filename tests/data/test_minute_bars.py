@@ -391,6 +391,113 @@ class BcolzMinuteBarTestCase(WithTradingCalendars,
         with self.assertRaises(BcolzMinuteOverlappingData):
             self.writer.write_sid(sid, data)
 
+    def _chunk_contents(self, sid, field):
+        path = os.path.join(self.writer.sidpath(sid), field, 'data')
+        contents = {}
+        for name in os.listdir(path):
+            with open(os.path.join(path, name), 'rb') as f:
+                contents[name] = f.read()
+        return contents
+
+    def test_overwrite_backfill(self):
+        sid = 1
+        sessions = self.market_opens.index
+        first_minute = self.market_opens[sessions[0]]
+        last_minute = self.market_opens[sessions[-1]]
+
+        ohlcv = {
+            'open': [10.0],
+            'high': [20.0],
+            'low': [30.0],
+            'close': [40.0],
+            'volume': [50.0]
+        }
+        self.writer.write_sid(sid, DataFrame(ohlcv, index=[last_minute]))
+        last_date = self.writer.last_date_in_output_for_sid(sid)
+
+        # Prime the reader caches before the backfill
+        self.assertEqual(
+            self.reader.get_last_traded_dt(
+                self.asset_finder.retrieve_asset(sid), first_minute
+            ),
+            NaT,
+        )
+        chunks = self._chunk_contents(sid, 'close')
+        self.assertGreater(len(chunks), 2)
+
+        minutes = [first_minute, first_minute + Timedelta(minutes=2)]
+        backfill = DataFrame(
+            data={
+                'open': [1.0, 2.0],
+                'high': [3.0, 4.0],
+                'low': [0.5, 1.5],
+                'close': [2.0, 3.0],
+                'volume': [5.0, 6.0]
+            },
+            index=minutes)
+
+        with self.assertRaises(BcolzMinuteOverlappingData):
+            self.writer.write_sid(sid, backfill)
+
+        self.writer.write_sid(sid, backfill, overwrite=True)
+        self.reader.invalidate_sids([sid])
+
+        # Only the chunk holding the range is rewritten
+        contents = self._chunk_contents(sid, 'close')
+        changed = [
+            name for name, content in contents.items()
+            if chunks.get(name) != content
+        ]
+        self.assertEqual(len(changed), 1)
+        self.assertEqual(
+            self.writer.last_date_in_output_for_sid(sid), last_date,
+        )
+
+        self.assertEqual(self.reader.get_value(sid, minutes[0], 'close'), 2.0)
+        self.assertEqual(self.reader.get_value(sid, minutes[1], 'close'), 3.0)
+        self.assertEqual(
+            self.reader.get_value(sid, last_minute, 'close'), 40.0,
+        )
+        self.assertEqual(
+            self.reader.get_last_traded_dt(
+                self.asset_finder.retrieve_asset(sid), minutes[1]
+            ),
+            minutes[1],
+        )
+
+    def test_overwrite_past_end(self):
+        sid = 1
+        first_minute = self.market_opens[TEST_CALENDAR_START]
+        minutes = date_range(first_minute, periods=4, freq='min')
+
+        self.writer.write_sid(sid, DataFrame(
+            data={
+                'open': [10.0, 11.0],
+                'high': [20.0, 21.0],
+                'low': [30.0, 31.0],
+                'close': [40.0, 41.0],
+                'volume': [50.0, 51.0]
+            },
+            index=minutes[:2]))
+
+        # The range replaces the minutes written and extends the ctable,
+        # the minute missing from the data has no trades.
+        self.writer.write_sid(sid, DataFrame(
+            data={
+                'open': [12.0, 13.0],
+                'high': [22.0, 23.0],
+                'low': [32.0, 33.0],
+                'close': [42.0, 43.0],
+                'volume': [52.0, 53.0]
+            },
+            index=minutes[[0, 3]]), overwrite=True)
+
+        self.assertEqual(self.reader.table_len(sid), 4)
+        closes = [
+            self.reader.get_value(sid, minute, 'close') for minute in minutes
+        ]
+        assert_array_equal(closes, [42.0, nan, nan, 43.0])
+
     def test_append_to_same_day(self):
         """
         Test writing data with the same date as existing data in our file.
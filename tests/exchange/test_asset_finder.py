@@ -0,0 +1,72 @@
+import numpy as np
+import pandas as pd
+from mock import Mock
+
+from catalyst.assets._assets import TradingPair
+from catalyst.exchange.exchange_asset_finder import ExchangeAssetFinder
+
+
+class TestExchangeAssetFinder:
+    def setup(self):
+        random = np.random.RandomState(0)
+        first = pd.Timestamp('2018-01-01', tz='UTC')
+
+        self.exchanges = dict()
+        for name, sids in [('bitfinex', range(0, 30)),
+                           ('poloniex', range(20, 50))]:
+            assets = []
+            for sid in sids:
+                start = first + pd.Timedelta(days=random.randint(0, 60))
+                end = start + pd.Timedelta(days=random.randint(1, 60))
+                assets.append(TradingPair(
+                    symbol='a{}_btc'.format(sid),
+                    exchange=name,
+                    start_date=start,
+                    end_minute=end,
+                    sid=sid,
+                ))
+
+            exchange = Mock()
+            exchange.name = name
+            exchange.assets = assets
+            self.exchanges[name] = exchange
+
+        self.finder = ExchangeAssetFinder(exchanges=self.exchanges)
+
+    def test_retrieve(self):
+        assert sorted(self.finder.sids) == list(range(50))
+
+        # The first exchange owns the shared sids
+        assert self.finder.retrieve_asset(25).exchange == 'bitfinex'
+        assert self.finder.retrieve_asset(45).exchange == 'poloniex'
+        assert self.finder.retrieve_asset(99) is None
+
+        assets = self.finder.retrieve_all([45, 99, 3])
+        assert [asset.sid for asset in assets] == [45, 3]
+
+        assets = self.finder.retrieve_all([45, 99], default_none=True)
+        assert assets[1] is None
+
+    def test_lifetimes(self):
+        dates = pd.date_range('2018-01-01', '2018-04-01', tz='UTC')
+        for include_start_date in (True, False):
+            df = self.finder.lifetimes(dates, include_start_date)
+            assert len(df.columns) == 50
+            assert df.columns.is_unique
+
+            for asset in df.columns:
+                if include_start_date:
+                    expected = (asset.start_date <= dates) & \
+                        (dates < asset.end_minute)
+                else:
+                    expected = (asset.start_date < dates) & \
+                        (dates < asset.end_minute)
+
+                np.testing.assert_array_equal(df[asset].values, expected)
+
+    def test_reload_assets(self):
+        self.finder.sids
+        exchange = self.exchanges['poloniex']
+        exchange.assets = exchange.assets[:10]
+
+        assert sorted(self.finder.sids) == list(range(30))
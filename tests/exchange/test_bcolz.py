@@ -2,6 +2,7 @@ import random
 import shutil
 import tempfile
 
+import numpy as np
 import pandas as pd
 from nose.tools import assert_equals
 
@@ -147,3 +148,52 @@ class TestBcolzWriter(object):
 
     def _test_bcolz_poloniex_daily_write_read(self):
         self.bcolz_exchange_daily_write_read('poloniex')
+
+    def test_bcolz_load_multiple_sids(self):
+        start = pd.to_datetime('2016-01-01', utc=True)
+        end = pd.to_datetime('2016-03-31', utc=True)
+        freq = 'daily'
+
+        bundle = ExchangeBundle('bitfinex')
+        periods = bundle.get_calendar_periods_range(start, end, freq)
+
+        # Each sid has its own holes in the data
+        dfs = dict()
+        for sid in [1, 2, 3]:
+            df = pd.DataFrame(
+                np.random.RandomState(sid).uniform(
+                    0.01, 10, (len(periods), len(self.columns))
+                ),
+                index=periods,
+                columns=self.columns
+            )
+            df.iloc[sid * 10:sid * 10 + 5] = np.nan
+            df['volume'] = df['volume'].fillna(0)
+            dfs[sid] = df
+
+        writer = BcolzExchangeBarWriter(
+            rootdir=self.root_dir,
+            start_session=start,
+            end_session=end,
+            data_frequency=freq,
+            write_metadata=True)
+        writer.write(
+            [(sid, df.fillna(0)) for sid, df in dfs.items()],
+            invalid_data_behavior='ignore'
+        )
+
+        for read_threads in [1, 3]:
+            reader = BcolzExchangeBarReader(rootdir=self.root_dir,
+                                            data_frequency=freq,
+                                            read_threads=read_threads)
+            arrays = reader.load_raw_arrays(self.columns, start, end,
+                                            [3, 1, 2])
+
+            for index, sid in enumerate([3, 1, 2]):
+                for field_index, field in enumerate(self.columns):
+                    np.testing.assert_allclose(
+                        arrays[field_index][:, index],
+                        dfs[sid][field].values,
+                        rtol=1e-6,
+                        equal_nan=True
+                    )
@@ -0,0 +1,333 @@
+import os
+import shutil
+import tarfile
+import tempfile
+import threading
+import time
+from uuid import uuid4
+
+import numpy as np
+import pandas as pd
+from mock import patch
+
+from catalyst.assets._assets import TradingPair
+from catalyst.exchange.exchange_bcolz import BcolzExchangeBarWriter
+from catalyst.exchange.exchange_bundle import ExchangeBundle
+from catalyst.exchange.utils.bundle_utils import ChunkManifest, \
+    CoverageIndex, get_bcolz_chunk
+
+
+class TestChunkManifest:
+    def setup(self):
+        self.folder = tempfile.mkdtemp()
+        self.path = os.path.join(self.folder, 'minute_manifest.txt')
+
+    def teardown(self):
+        shutil.rmtree(self.folder)
+
+    def test_add_and_reload(self):
+        manifest = ChunkManifest(self.path)
+        assert ('eth_btc', '2018-01') not in manifest
+
+        manifest.add('eth_btc', '2018-01')
+        manifest.add('eth_btc', '2018-02')
+        manifest.add('eth_btc', '2018-01')
+
+        reloaded = ChunkManifest(self.path)
+        assert len(reloaded) == 2
+        assert ('eth_btc', '2018-01') in reloaded
+        assert ('eth_btc', '2018-02') in reloaded
+
+    def test_partial_line_ignored(self):
+        manifest = ChunkManifest(self.path)
+        manifest.add('eth_btc', '2018-01')
+
+        # Simulating a crash in the middle of a write
+        with open(self.path, 'a') as f:
+            f.write('eth_btc 2018')
+
+        reloaded = ChunkManifest(self.path)
+        assert len(reloaded) == 1
+        assert ('eth_btc', '2018') not in reloaded
+
+    def test_clear(self):
+        manifest = ChunkManifest(self.path)
+        manifest.add('eth_btc', '2018-01')
+        manifest.clear()
+
+        assert len(manifest) == 0
+        assert not os.path.exists(self.path)
+
+
+class TestCoverageIndex:
+    def setup(self):
+        self.folder = tempfile.mkdtemp()
+        self.path = os.path.join(self.folder, 'minute_coverage.txt')
+
+    def teardown(self):
+        shutil.rmtree(self.folder)
+
+    def test_merge_and_reload(self):
+        coverage = CoverageIndex(self.path, 'minute')
+        assert 1 not in coverage
+
+        coverage.add(1, pd.Timestamp('2018-01-01 00:00', tz='UTC'),
+                     pd.Timestamp('2018-01-01 11:59', tz='UTC'))
+        coverage.add(1, pd.Timestamp('2018-01-01 12:00', tz='UTC'),
+                     pd.Timestamp('2018-01-01 23:59', tz='UTC'))
+        coverage.add(1, pd.Timestamp('2018-01-03 00:00', tz='UTC'),
+                     pd.Timestamp('2018-01-03 23:59', tz='UTC'))
+
+        reloaded = CoverageIndex(self.path, 'minute')
+        assert reloaded.ranges(1) == [
+            (pd.Timestamp('2018-01-01 00:00', tz='UTC'),
+             pd.Timestamp('2018-01-01 23:59', tz='UTC')),
+            (pd.Timestamp('2018-01-03 00:00', tz='UTC'),
+             pd.Timestamp('2018-01-03 23:59', tz='UTC')),
+        ]
+
+        assert reloaded.covers(1, pd.Timestamp('2018-01-01 06:00', tz='UTC'),
+                               pd.Timestamp('2018-01-01 18:00', tz='UTC'))
+        assert not reloaded.covers(
+            1, pd.Timestamp('2018-01-01 00:00', tz='UTC'),
+            pd.Timestamp('2018-01-03 23:59', tz='UTC')
+        )
+        assert not reloaded.covers(
+            2, pd.Timestamp('2018-01-01 00:00', tz='UTC'),
+            pd.Timestamp('2018-01-01 00:00', tz='UTC')
+        )
+
+    def test_gaps(self):
+        coverage = CoverageIndex(self.path, 'daily')
+        coverage.add(1, pd.Timestamp('2018-01-03', tz='UTC'),
+                     pd.Timestamp('2018-01-05', tz='UTC'))
+        coverage.add(1, pd.Timestamp('2018-01-08', tz='UTC'),
+                     pd.Timestamp('2018-01-09', tz='UTC'))
+
+        gaps = coverage.gaps(1, pd.Timestamp('2018-01-01', tz='UTC'),
+                             pd.Timestamp('2018-01-10', tz='UTC'))
+        assert gaps == [
+            (pd.Timestamp('2018-01-01', tz='UTC'),
+             pd.Timestamp('2018-01-02', tz='UTC')),
+            (pd.Timestamp('2018-01-06', tz='UTC'),
+             pd.Timestamp('2018-01-07', tz='UTC')),
+            (pd.Timestamp('2018-01-10', tz='UTC'),
+             pd.Timestamp('2018-01-10', tz='UTC')),
+        ]
+        assert coverage.gaps(1, pd.Timestamp('2018-01-04', tz='UTC'),
+                             pd.Timestamp('2018-01-05', tz='UTC')) == []
+
+    def test_partial_line_ignored(self):
+        coverage = CoverageIndex(self.path, 'minute')
+        coverage.add(1, pd.Timestamp('2018-01-01', tz='UTC'),
+                     pd.Timestamp('2018-01-02', tz='UTC'))
+
+        with open(self.path, 'a') as f:
+            f.write('2 1514764800')
+
+        reloaded = CoverageIndex(self.path, 'minute')
+        assert len(reloaded) == 1
+        assert 2 not in reloaded
+
+    def test_clear(self):
+        coverage = CoverageIndex(self.path, 'minute')
+        coverage.add(1, pd.Timestamp('2018-01-01', tz='UTC'),
+                     pd.Timestamp('2018-01-02', tz='UTC'))
+        coverage.clear()
+
+        assert len(coverage) == 0
+        assert not os.path.exists(self.path)
+
+
+class TestGetBcolzChunk:
+    def setup(self):
+        self.root = tempfile.mkdtemp()
+        self.source = tempfile.mkdtemp()
+
+    def teardown(self):
+        shutil.rmtree(self.root)
+        shutil.rmtree(self.source)
+
+    def test_local_source(self):
+        exchange_name = 'test_{}'.format(uuid4().hex)
+        name = '{}-minute-eth_btc-2018-01'.format(exchange_name)
+
+        content = os.path.join(self.source, 'content')
+        os.mkdir(content)
+        with open(os.path.join(content, 'metadata.json'), 'w') as f:
+            f.write('{}')
+
+        with tarfile.open(
+                os.path.join(self.source, '{}.tar.gz'.format(name)),
+                'w:gz') as tar:
+            tar.add(content, arcname='.')
+
+        with patch.dict(os.environ, {'CATALYST_ROOT': self.root}):
+            path = get_bcolz_chunk(
+                exchange_name=exchange_name,
+                symbol='eth_btc',
+                data_frequency='minute',
+                period='2018-01',
+                source=self.source,
+            )
+
+        assert os.path.basename(path) == name
+        assert os.path.isfile(os.path.join(path, 'metadata.json'))
+        assert not os.path.exists('{}.part'.format(path))
+
+
+class TestIngestChunks:
+    def setup(self):
+        self.root = tempfile.mkdtemp()
+        self.source = tempfile.mkdtemp()
+        self.asset = TradingPair(
+            symbol='eth_btc',
+            exchange='bitfinex',
+            start_date=pd.Timestamp('2017-01-01', tz='UTC'),
+            sid=1,
+        )
+
+    def teardown(self):
+        shutil.rmtree(self.root)
+        shutil.rmtree(self.source)
+
+    def write_chunk(self, period, value):
+        start = pd.Timestamp('{}-01-01'.format(period), tz='UTC')
+        end = pd.Timestamp('{}-12-31'.format(period), tz='UTC')
+        path = os.path.join(self.source, period)
+        os.mkdir(path)
+
+        writer = BcolzExchangeBarWriter(
+            rootdir=path,
+            start_session=start,
+            end_session=end,
+            write_metadata=True,
+            data_frequency='daily',
+        )
+        days = pd.date_range(start, end, tz='UTC')
+        df = pd.DataFrame(
+            dict(open=value, high=value, low=value, close=value, volume=1.0),
+            index=days,
+        )
+        writer.write([(self.asset.sid, df)])
+        return path
+
+    def test_chunks_completed_out_of_order(self):
+        bundle = ExchangeBundle('test_{}'.format(uuid4().hex))
+        paths = {
+            '2017': self.write_chunk('2017', 1.0),
+            '2018': self.write_chunk('2018', 2.0),
+        }
+
+        # The download of the older chunk completes last
+        newer_done = threading.Event()
+
+        def download_chunk(asset, data_frequency, period):
+            if period == '2017':
+                newer_done.wait(5)
+            else:
+                newer_done.set()
+            return paths[period]
+
+        bundle.download_chunk = download_chunk
+        chunks = [
+            dict(asset=self.asset, period=period, final=True)
+            for period in ('2017', '2018')
+        ]
+
+        start = pd.Timestamp('2017-01-01', tz='UTC')
+        end = pd.Timestamp('2018-12-31', tz='UTC')
+        with patch.dict(os.environ, {'CATALYST_ROOT': self.root}):
+            writer = bundle.get_writer(start, end, 'daily')
+            bundle._ingest_chunks(
+                chunks, 'daily', writer, False, 'test', download_workers=2,
+            )
+
+            reader = bundle.get_reader('daily')
+            closes, = reader.load_raw_arrays(
+                ['close'], start, end, [self.asset.sid],
+            )
+            manifest = bundle.get_manifest('daily')
+
+        days = pd.date_range(start, end, tz='UTC')
+        expected = np.where(days.year == 2017, 1.0, 2.0)
+        np.testing.assert_array_equal(closes[:, 0], expected)
+
+        assert ('eth_btc', '2017') in manifest
+        assert ('eth_btc', '2018') in manifest
+
+    def test_downloads_ahead_bounded(self):
+        bundle = ExchangeBundle('test_{}'.format(uuid4().hex))
+        lock = threading.Lock()
+        downloaded = []
+        ingested = []
+
+        def download_chunk(asset, data_frequency, period):
+            with lock:
+                downloaded.append(period)
+            return None
+
+        def ingest_ctable(period, **kwargs):
+            # Give the workers time to run ahead
+            time.sleep(0.01)
+            with lock:
+                assert len(downloaded) <= len(ingested) + 4
+            ingested.append(period)
+            return []
+
+        bundle.download_chunk = download_chunk
+        bundle.ingest_ctable = ingest_ctable
+        chunks = [
+            dict(asset=self.asset, period=str(period))
+            for period in range(2000, 2020)
+        ]
+
+        with patch.dict(os.environ, {'CATALYST_ROOT': self.root}):
+            bundle._ingest_chunks(
+                chunks, 'daily', None, False, 'test', download_workers=2,
+            )
+
+        assert ingested == [chunk['period'] for chunk in chunks]
+
+    def test_coverage_seeded_from_bundle(self):
+        bundle = ExchangeBundle('test_{}'.format(uuid4().hex))
+
+        def frame(start, end):
+            days = pd.date_range(start, end, tz='UTC')
+            return pd.DataFrame(
+                dict(open=1.0, high=1.0, low=1.0, close=1.0, volume=1.0),
+                index=days,
+            )
+
+        start = pd.Timestamp('2017-01-01', tz='UTC')
+        end = pd.Timestamp('2019-12-31', tz='UTC')
+        with patch.dict(os.environ, {'CATALYST_ROOT': self.root}):
+            writer = bundle.get_writer(start, end, 'daily')
+            # Ingested before the coverage index existed
+            writer.write([(self.asset.sid, frame('2017-01-01', '2017-12-31'))])
+
+            bundle._write(
+                [(self.asset.sid, frame('2019-01-01', '2019-12-31'))],
+                writer,
+                'daily',
+            )
+            coverage = bundle.get_coverage('daily')
+
+            assert coverage.ranges(self.asset.sid) == [
+                (pd.Timestamp('2017-01-01', tz='UTC'),
+                 pd.Timestamp('2017-12-31', tz='UTC')),
+                (pd.Timestamp('2019-01-01', tz='UTC'),
+                 pd.Timestamp('2019-12-31', tz='UTC')),
+            ]
+            assert bundle.range_in_bundle(
+                self.asset,
+                pd.Timestamp('2017-03-01', tz='UTC'),
+                pd.Timestamp('2017-06-01', tz='UTC'),
+                'daily',
+            )
+            assert not bundle.range_in_bundle(
+                self.asset,
+                pd.Timestamp('2018-03-01', tz='UTC'),
+                pd.Timestamp('2018-06-01', tz='UTC'),
+                'daily',
+            )
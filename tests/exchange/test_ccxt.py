@@ -8,8 +8,10 @@ from catalyst.exchange.exchange_errors import ExchangeRequestError
 from .base import BaseExchangeTestCase
 from catalyst.exchange.ccxt.ccxt_exchange import CCXT
 from catalyst.exchange.exchange_execution import ExchangeLimitOrder
+from catalyst.assets._assets import TradingPair
 from catalyst.exchange.utils.exchange_utils import get_exchange_auth
 from catalyst.finance.order import Order
+from catalyst.utils.rate_limit import TokenBucket
 
 log = Logger('test_ccxt')
 
@@ -529,3 +531,161 @@ class TestCCXT(BaseExchangeTestCase):
     #
     # def test_get_fees(self):
     #     pass
+
+
+class TestCCXTAssetIndex:
+    def setup(self):
+        self.exchange = CCXT(
+            exchange_name='bittrex',
+            key='',
+            secret='',
+            password='',
+            quote_currency='btc',
+        )
+        self.exchange.markets = [
+            dict(
+                id='BTC-{}'.format(base),
+                symbol='{}/BTC'.format(base),
+                base=base,
+                quote='BTC',
+                precision=dict(amount=8, price=8),
+                limits=dict(amount=dict(min=0.001, max=None)),
+                maker=0.0025,
+                taker=0.0025,
+            ) for base in ('ETH', 'LTC', 'NEO')
+        ]
+        symbol_maps = [
+            {
+                'BTC-ETH': dict(
+                    symbol='eth_btc',
+                    start_date='2017-01-01',
+                    end_daily='2018-01-01',
+                    end_minute='N/A',
+                ),
+            },
+            {
+                'btc-eth': dict(
+                    symbol='eth_btc',
+                    start_date='2017-01-01',
+                    end_daily='N/A',
+                    end_minute='2018-01-01',
+                ),
+            },
+        ]
+        with patch.object(
+                CCXT, '_fetch_symbol_map',
+                side_effect=lambda is_local: symbol_maps[int(is_local)]):
+            self.exchange.load_assets()
+            self.exchange.index_assets()
+
+    def test_get_asset(self):
+        exchange = self.exchange
+        asset = exchange.get_asset('ltc_btc')
+        assert asset.exchange_symbol == 'BTC-LTC'
+        assert exchange.get_asset('btc-ltc', is_exchange_symbol=True) is asset
+
+        assert exchange.get_asset('eth_btc', is_local=False).data_source \
+            == 'catalyst'
+        assert exchange.get_asset('eth_btc', is_local=True).data_source \
+            == 'local'
+        assert exchange.get_asset(
+            'eth_btc', data_frequency='minute'
+        ).data_source == 'local'
+
+    def test_get_market(self):
+        assert self.exchange.get_market('neo_btc')['id'] == 'BTC-NEO'
+        assert self.exchange.get_market('xrp_btc') is None
+
+
+class TestCCXTCandles:
+    def setup(self):
+        self.exchange = CCXT(
+            exchange_name='bittrex',
+            key='',
+            secret='',
+            password='',
+            quote_currency='btc',
+        )
+        # The shared bittrex rate limit would throttle the mocked requests
+        self.exchange.token_bucket = TokenBucket(rate=1e6, capacity=1000)
+        self.assets = [
+            TradingPair(
+                symbol='a{}_btc'.format(sid),
+                exchange='bittrex',
+                start_date=pd.Timestamp('2018-01-01', tz='UTC'),
+                sid=sid,
+            ) for sid in range(1, 21)
+        ]
+
+        def fetch_ohlcv(symbol, timeframe, since, limit, params):
+            start = since + 60000 * int(symbol[1:symbol.index('/')])
+            return [
+                [start + 60000 * i, 1.0, 2.0, 0.5, 1.5, float(i)]
+                for i in reversed(range(limit))
+            ]
+
+        self.exchange.api = Mock()
+        self.exchange.api.timeframes = {'1m': '1m'}
+        self.exchange.api.common_currency_code.side_effect = lambda c: c
+        self.exchange.api.fetch_ohlcv.side_effect = fetch_ohlcv
+
+    def test_get_candles_frames(self):
+        end_dt = pd.Timestamp('2018-05-01 12:00', tz='UTC')
+        for workers in (1, 8):
+            self.exchange.candles_workers = workers
+            frames = self.exchange.get_candles_frames(
+                '1T', self.assets, bar_count=5, end_dt=end_dt
+            )
+            assert len(frames) == 20
+
+            df = frames[self.assets[2]]
+            assert list(df.columns) == \
+                ['close', 'high', 'low', 'open', 'volume']
+            assert df.index.is_monotonic_increasing
+            assert list(df['volume']) == [0.0, 1.0, 2.0, 3.0, 4.0]
+            # The window starts 5 minutes before end_dt and the fake
+            # candles of each asset are shifted by its sid.
+            assert df.index[0] == end_dt - pd.Timedelta(minutes=2)
+
+        candles = self.exchange.get_candles(
+            '1T', self.assets[0], bar_count=5, end_dt=end_dt
+        )
+        assert candles[0]['open'] == 1.0
+        assert candles[0]['close'] == 1.5
+        assert candles[0]['last_traded'] == end_dt - pd.Timedelta(minutes=4)
+
+    def test_fetch_error(self):
+        self.exchange.api.fetch_ohlcv.side_effect = RequestTimeout('timeout')
+        try:
+            self.exchange.get_candles_frames('1T', self.assets, bar_count=5)
+        except ExchangeRequestError:
+            pass
+        else:
+            raise AssertionError('ExchangeRequestError not raised')
+
+    def test_get_history_windows(self):
+        end_dt = pd.Timestamp('2018-05-01 12:00', tz='UTC')
+        assets = self.assets[:3]
+        frames = self.exchange.get_history_windows(
+            assets, end_dt, 5, '1T', ['open', 'close', 'volume'], 'minute'
+        )
+        # The candles of all the fields come from a single request
+        # per asset.
+        assert self.exchange.api.fetch_ohlcv.call_count == 3
+        assert sorted(frames.keys()) == ['close', 'open', 'volume']
+        assert list(frames['open'].columns) == assets
+        assert (frames['open'].values == 1.0).all()
+        assert (frames['close'].values == 1.5).all()
+
+    def test_get_spot_values(self):
+        self.exchange.tickers = Mock(return_value={
+            self.assets[1]: dict(last=1.5, volume=10.0),
+        })
+        values = self.exchange.get_spot_values(
+            self.assets[:2], ['price', 'volume']
+        )
+        self.exchange.tickers.assert_called_once_with(self.assets[:2])
+
+        assert values.shape == (2, 2)
+        assert pd.isnull(values[0]).all()
+        assert list(values[1]) == [1.5, 10.0]
@@ -0,0 +1,117 @@
+import os
+import shutil
+import tempfile
+
+import pandas as pd
+
+from catalyst.assets._assets import TradingPair
+from catalyst.exchange.utils.checkpoint import AlgoCheckpoint, \
+    perf_period_entries, position_tracker_entries, restore_perf_period, \
+    restore_position_tracker
+from catalyst.finance.performance.period import PerformancePeriod
+from catalyst.finance.performance.position_tracker import PositionTracker
+from catalyst.finance.transaction import Transaction
+
+
+class TestAlgoCheckpoint:
+    def setup(self):
+        self.folder = tempfile.mkdtemp()
+        self.path = os.path.join(self.folder, 'checkpoint_live')
+
+    def teardown(self):
+        shutil.rmtree(self.folder)
+
+    def test_save_deltas_and_reload(self):
+        checkpoint = AlgoCheckpoint(self.path, compact_every=3)
+        checkpoint.save({('state', 'a'): 1, ('state', 'b'): [1, 2]})
+        size = os.path.getsize(checkpoint.journal_filename)
+
+        # Nothing changed, nothing is written
+        checkpoint.save({('state', 'a'): 1, ('state', 'b'): [1, 2]})
+        assert os.path.getsize(checkpoint.journal_filename) == size
+
+        checkpoint.save({('state', 'a'): 2})
+        assert not os.path.exists(checkpoint.journal_filename)
+
+        checkpoint.save({('state', 'a'): 3, ('state', 'c'): 'c'})
+        assert AlgoCheckpoint(self.path).load() == {
+            ('state', 'a'): 3, ('state', 'c'): 'c'
+        }
+
+    def test_frozen_entries(self):
+        checkpoint = AlgoCheckpoint(self.path)
+        checkpoint.save({('txn', 1): 'a'})
+        checkpoint.save({('txn', 1): 'b'}, frozen=lambda key: True)
+        assert AlgoCheckpoint(self.path).load() == {('txn', 1): 'a'}
+
+    def test_truncated_journal(self):
+        checkpoint = AlgoCheckpoint(self.path)
+        checkpoint.save({('state', 'a'): 1})
+
+        # Simulating a crash in the middle of a write
+        with open(checkpoint.journal_filename, 'ab') as f:
+            f.write(b'\x80\x04\x95')
+
+        checkpoint = AlgoCheckpoint(self.path)
+        assert checkpoint.load() == {('state', 'a'): 1}
+
+        checkpoint.save({('state', 'a'): 2})
+        assert AlgoCheckpoint(self.path).load() == {('state', 'a'): 2}
+
+    def test_perf_period_roundtrip(self):
+        period = PerformancePeriod(1000.0, 'minute', keep_orders=True)
+        dt = pd.Timestamp('2018-01-01', tz='UTC')
+        period.processed_transactions[dt] = ['txn']
+        period.cash_flow = -10.0
+
+        checkpoint = AlgoCheckpoint(self.path)
+        checkpoint.save(perf_period_entries('cumulative', period))
+
+        restored = restore_perf_period(
+            'cumulative', AlgoCheckpoint(self.path).load()
+        )
+        assert restored.processed_transactions == {dt: ['txn']}
+        assert restored.cash_flow == -10.0
+        assert restored.starting_cash == 1000.0
+
+    def test_touched_positions(self):
+        assets = [
+            TradingPair(
+                symbol='a{}_btc'.format(sid),
+                exchange='bittrex',
+                start_date=pd.Timestamp('2018-01-01', tz='UTC'),
+                sid=sid,
+            ) for sid in range(1, 4)
+        ]
+        dt = pd.Timestamp('2018-01-02', tz='UTC')
+        tracker = PositionTracker('minute')
+        for asset in assets:
+            tracker.execute_transaction(Transaction(
+                asset=asset, amount=10, dt=dt, price=1.0, order_id=None,
+            ))
+        assert tracker.pop_touched_assets() == set(assets)
+        assert tracker.pop_touched_assets() == set()
+
+        tracker.update_position(assets[1], last_sale_price=2.0)
+        tracker.handle_commission(assets[2], 0.5)
+        touched = tracker.pop_touched_assets()
+        assert touched == {assets[1], assets[2]}
+
+        # The untouched positions are not serialized again
+        checkpoint = AlgoCheckpoint(self.path)
+        checkpoint.save(position_tracker_entries(tracker))
+        tracker.update_position(assets[0], amount=20)
+        touched = tracker.pop_touched_assets()
+        tracker.positions[assets[1]].amount = 30
+        checkpoint.save(
+            position_tracker_entries(tracker),
+            frozen=lambda key: (
+                key[0] == 'positions' and key[1] not in touched
+            ),
+        )
+
+        restored = restore_position_tracker(AlgoCheckpoint(self.path).load())
+        assert restored.touched_assets == set()
+        assert restored.positions[assets[0]].amount == 20
+        assert restored.positions[assets[1]].amount == 10
+        assert restored.positions[assets[2]].amount == 10
@@ -0,0 +1,116 @@
+from copy import copy
+from unittest import TestCase
+
+import numpy as np
+import pandas as pd
+
+from catalyst.assets._assets import TradingPair
+from catalyst.exchange.exchange_blotter import TradingPairFixedSlippage
+from catalyst.finance.order import Order
+
+
+class FakeBarData(object):
+    def __init__(self, dt, prices):
+        self.current_dt = dt
+        self.prices = prices
+        self.calls = 0
+
+    def current(self, assets, field):
+        self.calls += 1
+        if isinstance(assets, TradingPair):
+            return self.prices[assets]
+
+        return pd.Series([self.prices[asset] for asset in assets],
+                         index=assets, name=field)
+
+
+def simulate_order_by_order(slippage, dt, prices, orders):
+    """
+    The fills of the orders simulated one by one with Order.check_triggers.
+    """
+    fills = []
+    for order in orders:
+        if order.open_amount == 0:
+            continue
+
+        price = prices[order.asset]
+        order.check_triggers(price, dt)
+        if not order.triggered or np.isnan(price):
+            continue
+
+        if order.amount > 0:
+            execution_price = price * (1 + slippage.slippage)
+        else:
+            execution_price = price * (1 - slippage.slippage)
+        fills.append((order.id, execution_price, order.amount))
+
+    return fills
+
+
+class TradingPairFixedSlippageTestCase(TestCase):
+    def setUp(self):
+        self.assets = [
+            TradingPair(
+                symbol='a{}_btc'.format(sid),
+                exchange='bittrex',
+                start_date=pd.Timestamp('2018-01-01', tz='UTC'),
+                sid=sid,
+            ) for sid in range(1, 21)
+        ]
+        self.dt = pd.Timestamp('2018-02-01', tz='UTC')
+
+    def make_orders(self, rand, count):
+        orders = []
+        for _ in range(count):
+            asset = self.assets[rand.randint(len(self.assets))]
+            amount = rand.choice([-1, 1]) * rand.randint(1, 100)
+            stop = rand.choice([None, rand.uniform(90, 110)])
+            limit = rand.choice([None, rand.uniform(90, 110)])
+            order = Order(self.dt, asset, amount, stop=stop, limit=limit)
+            if rand.uniform() < .1:
+                order.filled = order.amount
+            orders.append(order)
+        return orders
+
+    def test_batch_matches_order_by_order(self):
+        rand = np.random.RandomState(0)
+        slippage = TradingPairFixedSlippage(slippage=0.001)
+
+        orders = self.make_orders(rand, 500)
+        expected_orders = [copy(order) for order in orders]
+
+        orders_by_asset = {}
+        for order in orders:
+            orders_by_asset.setdefault(order.asset, []).append(order)
+
+        # Several bars to go through the state changes of the orders
+        for bar in range(5):
+            dt = self.dt + pd.Timedelta(minutes=bar)
+            prices = {
+                asset: rand.uniform(90, 110) for asset in self.assets
+            }
+            prices[self.assets[0]] = np.nan
+
+            data = FakeBarData(dt, prices)
+            fills = [
+                (order.id, txn.price, txn.amount)
+                for order, txn in slippage.simulate_orders(
+                    data, orders_by_asset
+                )
+            ]
+            self.assertEqual(data.calls, 1)
+
+            expected = simulate_order_by_order(
+                slippage, dt, prices, expected_orders,
+            )
+            self.assertEqual(sorted(fills), sorted(expected))
+
+            for order, expected_order in zip(orders, expected_orders):
+                self.assertEqual(order.stop, expected_order.stop)
+                self.assertEqual(
+                    order.stop_reached, expected_order.stop_reached
+                )
+                self.assertEqual(
+                    order.limit_reached, expected_order.limit_reached
+                )
+                self.assertEqual(order.dt, expected_order.dt)
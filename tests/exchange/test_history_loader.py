@@ -0,0 +1,142 @@
+from datetime import timedelta
+
+import numpy as np
+import pandas as pd
+
+from catalyst.assets._assets import TradingPair
+from catalyst.exchange.exchange_history_loader import ExchangeHistoryLoader, \
+    resample_history_array
+from catalyst.exchange.utils.exchange_utils import resample_history_df
+from catalyst.testing.fixtures import WithLogger, CatalystTestCase
+
+
+class FakeBundle(object):
+    """
+    Serves random minute bars and counts the bundle reads.
+    """
+
+    def __init__(self, start_dt, end_dt):
+        self.dts = pd.date_range(start_dt, end_dt, freq='T', tz='UTC')
+        self.calls = 0
+
+    def get_history_window_frames_and_load(self, assets, end_dt, bar_count,
+                                           fields, data_frequency,
+                                           algo_end_dt=None):
+        self.calls += 1
+        dts = pd.date_range(
+            end=end_dt, periods=bar_count, freq='T', tz='UTC'
+        )
+        return {
+            field: pd.DataFrame({
+                asset: pd.Series(
+                    (dts.asi8 // 60000000000 + asset.sid + len(field)) % 97,
+                    index=dts
+                ).astype(np.float64)
+                for asset in assets
+            }) for field in fields
+        }
+
+    def get_history_window_series_and_load(self, assets, end_dt, bar_count,
+                                           field, data_frequency,
+                                           algo_end_dt=None):
+        return self.get_history_window_frames_and_load(
+            assets, end_dt, bar_count, [field], data_frequency, algo_end_dt
+        )[field]
+
+
+class TestExchangeHistoryLoader(WithLogger, CatalystTestCase):
+    def _assets(self, count):
+        return [
+            TradingPair(
+                symbol='a{}_btc'.format(sid),
+                exchange='test',
+                start_date=pd.Timestamp('2018-01-01', tz='UTC'),
+                end_minute=pd.Timestamp('2018-02-01', tz='UTC'),
+                end_daily=pd.Timestamp('2018-02-01', tz='UTC'),
+                sid=sid,
+            ) for sid in range(1, count + 1)
+        ]
+
+    def test_resample_matches_pandas(self):
+        dts = pd.date_range(
+            '2018-01-02 17:23', periods=1000, freq='T', tz='UTC'
+        )
+        values = np.random.RandomState(0).rand(len(dts), 3)
+        values[np.random.RandomState(1).rand(len(dts), 3) > 0.8] = np.nan
+        values[100:120, 1] = np.nan
+
+        for field in ['open', 'high', 'low', 'close', 'volume']:
+            for freq, delta in [('5T', timedelta(minutes=5)),
+                                ('7T', timedelta(minutes=7)),
+                                ('1D', timedelta(days=1))]:
+                expected = resample_history_df(
+                    pd.DataFrame(values, index=dts), freq, field, dts[0]
+                )
+                out, labels = resample_history_array(
+                    values, dts, delta, field
+                )
+                keep = labels >= dts[0]
+
+                np.testing.assert_array_equal(
+                    labels[keep], expected.index
+                )
+                np.testing.assert_allclose(
+                    out[keep], expected.values, equal_nan=True
+                )
+
+    def test_sliding_window(self):
+        assets = self._assets(3)
+        bundle = FakeBundle('2018-01-01', '2018-02-01')
+        loader = ExchangeHistoryLoader(bundle, prefetch_length=100)
+
+        end_dt = pd.Timestamp('2018-01-10 12:00', tz='UTC')
+        for minute in range(100):
+            dt = end_dt + timedelta(minutes=minute)
+            df = loader.history(
+                assets, dt, 50, 'close', 'minute',
+                algo_end_dt=pd.Timestamp('2018-01-31', tz='UTC'),
+            )
+            expected = bundle.get_history_window_series_and_load(
+                assets, dt, 50, 'close', 'minute'
+            )
+
+            self.assertEqual(len(df), 50)
+            self.assertEqual(df.index[-1], dt)
+            np.testing.assert_array_equal(
+                df.values, expected[assets].values
+            )
+
+        # The block holds 100 bars past the first window so a single
+        # read serves every window, the reads of the expected frames
+        # are counted as well.
+        self.assertEqual(bundle.calls, 100 + 1)
+
+    def test_multiple_fields(self):
+        assets = self._assets(2)
+        bundle = FakeBundle('2018-01-01', '2018-02-01')
+        loader = ExchangeHistoryLoader(bundle, prefetch_length=100)
+        algo_end_dt = pd.Timestamp('2018-01-31', tz='UTC')
+
+        dt = pd.Timestamp('2018-01-10 12:00', tz='UTC')
+        frames = loader.histories(
+            assets, dt, 50, ['open', 'close', 'volume'], 'minute',
+            algo_end_dt=algo_end_dt,
+        )
+        # A single read for all the fields
+        self.assertEqual(bundle.calls, 1)
+
+        for field in ['open', 'close', 'volume']:
+            expected = bundle.get_history_window_series_and_load(
+                assets, dt, 50, field, 'minute'
+            )
+            np.testing.assert_array_equal(
+                frames[field].values, expected[assets].values
+            )
+
+        # Only the field missing from the blocks is read
+        calls = bundle.calls
+        loader.histories(
+            assets, dt, 50, ['close', 'high'], 'minute',
+            algo_end_dt=algo_end_dt,
+        )
+        self.assertEqual(bundle.calls, calls + 1)
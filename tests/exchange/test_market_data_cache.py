@@ -0,0 +1,129 @@
+import shutil
+import tempfile
+
+import numpy as np
+import pandas as pd
+
+from catalyst.assets._assets import TradingPair
+from catalyst.exchange.market_data_cache import MarketDataCache
+
+
+class FakeExchange(object):
+    """
+    Serves minute candles up to the current minute and counts the
+    requests.
+    """
+    name = 'fake'
+
+    def __init__(self, limit=None):
+        self.ticker_calls = 0
+        self.candle_calls = []
+        # The most candles returned by request
+        self.limit = limit
+        # How long the candles take to be available
+        self.lag = pd.Timedelta(0)
+
+    def tickers(self, assets):
+        self.ticker_calls += 1
+        return {asset: dict(last=float(asset.sid)) for asset in assets}
+
+    def get_candles_frames(self, freq, assets, bar_count=1, start_dt=None,
+                           end_dt=None):
+        self.candle_calls.append((bar_count, start_dt))
+        if start_dt is None:
+            start_dt = (end_dt or pd.Timestamp.utcnow()).floor('1T') - \
+                pd.Timedelta(minutes=bar_count - 1)
+
+        dts = pd.date_range(start_dt, periods=bar_count, freq='T')
+        dts = dts[dts <= pd.Timestamp.utcnow() - self.lag][:self.limit]
+        dts.name = 'last_traded'
+        return {
+            asset: pd.DataFrame(
+                dict(close=np.arange(len(dts), dtype=np.float64)),
+                index=dts,
+            ) for asset in assets
+        }
+
+
+class TestMarketDataCache:
+    def setup(self):
+        self.assets = [
+            TradingPair(
+                symbol='a{}_btc'.format(sid),
+                exchange='fake',
+                start_date=pd.Timestamp('2018-01-01', tz='UTC'),
+                sid=sid,
+            ) for sid in range(1, 4)
+        ]
+        self.folder = tempfile.mkdtemp()
+
+    def teardown(self):
+        shutil.rmtree(self.folder)
+
+    def test_tickers_ttl(self):
+        exchange = FakeExchange()
+        cache = MarketDataCache(exchange, ticker_ttl=60)
+
+        tickers = cache.tickers(self.assets)
+        assert list(tickers.keys()) == self.assets
+        cache.tickers(self.assets[:2])
+        assert exchange.ticker_calls == 1
+
+        cache.ticker_ttl = pd.Timedelta(0)
+        cache.tickers(self.assets[:1])
+        assert exchange.ticker_calls == 2
+
+    def test_candles_buffer(self):
+        exchange = FakeExchange()
+        cache = MarketDataCache(exchange, candles_ttl=60)
+
+        frames = cache.get_candles_frames('1T', self.assets, bar_count=100)
+        assert len(frames[self.assets[0]]) == 100
+        assert exchange.candle_calls == [(100, None)]
+
+        # A shorter window of the same bar is served from the buffer
+        frames = cache.get_candles_frames('1T', self.assets, bar_count=50)
+        assert len(frames[self.assets[0]]) == 100
+        assert len(exchange.candle_calls) == 1
+
+        # Once expired, only the candles since the last one are fetched
+        cache.candles_ttl = pd.Timedelta(0)
+        cache.get_candles_frames('1T', self.assets, bar_count=50)
+        assert len(exchange.candle_calls) == 2
+        bar_count, start_dt = exchange.candle_calls[-1]
+        assert start_dt is not None
+        assert bar_count <= 2
+
+    def test_candles_delta_pages(self):
+        exchange = FakeExchange()
+        exchange.lag = pd.Timedelta(minutes=30)
+        cache = MarketDataCache(exchange, candles_ttl=0)
+        cache.get_candles_frames('1T', self.assets, bar_count=100)
+
+        # The missing candles exceed the limit of the exchange
+        exchange.lag = pd.Timedelta(0)
+        exchange.limit = 10
+        now = pd.Timestamp.utcnow()
+        frames = cache.get_candles_frames('1T', self.assets, bar_count=100)
+
+        assert len(exchange.candle_calls) >= 4
+        for bar_count, start_dt in exchange.candle_calls[1:]:
+            assert start_dt is not None
+
+        frame = frames[self.assets[0]]
+        assert frame.index[-1] >= now.floor('1T')
+        assert (frame.index[1:] - frame.index[:-1] ==
+                pd.Timedelta(minutes=1)).all()
+
+    def test_shared_folder(self):
+        first = FakeExchange()
+        MarketDataCache(first, ticker_ttl=60, folder=self.folder) \
+            .tickers(self.assets)
+
+        second = FakeExchange()
+        tickers = MarketDataCache(
+            second, ticker_ttl=60, folder=self.folder
+        ).tickers(self.assets)
+
+        assert second.ticker_calls == 0
+        assert tickers[self.assets[2]]['last'] == 3.0
@@ -0,0 +1,189 @@
+import pandas as pd
+
+from catalyst import TradingAlgorithm
+from catalyst.exchange.simple_clock import SimpleClock
+from catalyst.finance.asset_restrictions import NoRestrictions
+from catalyst.finance.performance import PerformanceTracker
+from catalyst.gens.sim_engine import BAR, SESSION_END, SESSION_START
+from catalyst.gens.tradesimulation import AlgorithmSimulator
+from catalyst.testing.core import FakeDataPortal
+from catalyst.testing.fixtures import CatalystTestCase, WithTradingEnvironment
+from catalyst.utils import factory
+
+
+class FakeTimeSource(object):
+    def __init__(self, dt):
+        self.dt = pd.Timestamp(dt, tz='UTC')
+        self.sleeps = []
+
+    def now(self):
+        return self.dt
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.dt += pd.Timedelta(seconds=seconds)
+
+
+class SessionRecordingAlgorithm(TradingAlgorithm):
+    def __init__(self, *args, **kwargs):
+        self.sessions_at = []
+        super(SessionRecordingAlgorithm, self).__init__(*args, **kwargs)
+
+    def handle_data(self, data):
+        self.sessions_at.append(
+            (self.datetime, self.perf_tracker.todays_performance.period_open)
+        )
+
+
+class TestSimpleClock:
+    def make_clock(self, now, **kwargs):
+        time_source = FakeTimeSource(now)
+        clock = SimpleClock(None, time_source=time_source, **kwargs)
+        return clock, time_source
+
+    def test_sub_minute_bars(self):
+        clock, time_source = self.make_clock(
+            '2018-01-01 00:00:07',
+            bar_interval='15s',
+            end=pd.Timestamp('2018-01-01 00:01:00', tz='UTC'),
+        )
+
+        events = list(clock)
+        assert events == [
+            (pd.Timestamp('2018-01-01 00:00:07', tz='UTC'), SESSION_START),
+            (pd.Timestamp('2018-01-01 00:00:00', tz='UTC'), BAR),
+            (pd.Timestamp('2018-01-01 00:00:15', tz='UTC'), BAR),
+            (pd.Timestamp('2018-01-01 00:00:30', tz='UTC'), BAR),
+            (pd.Timestamp('2018-01-01 00:00:45', tz='UTC'), BAR),
+            (pd.Timestamp('2018-01-01 00:01:00', tz='UTC'), SESSION_END),
+        ]
+        # Each wait ends exactly on the next bar
+        assert time_source.sleeps == [8, 15, 15, 15]
+        assert clock.skipped_bars == 0
+
+    def test_late_start(self):
+        start = pd.Timestamp('2018-01-01 00:02:00', tz='UTC')
+        clock, time_source = self.make_clock(
+            '2018-01-01 00:00:30', start=start,
+        )
+
+        dt, action = next(iter(clock))
+        assert (dt, action) == (start, SESSION_START)
+        assert time_source.sleeps == [90]
+
+    def test_skipped_bars(self):
+        clock, time_source = self.make_clock(
+            '2018-01-01 00:00:00',
+            bar_interval='5s',
+            end=pd.Timestamp('2018-01-01 00:00:30', tz='UTC'),
+        )
+
+        bars = []
+        for dt, action in clock:
+            if action != BAR:
+                continue
+
+            bars.append(dt)
+            if len(bars) == 2:
+                # The bar takes 12 seconds to handle
+                time_source.dt += pd.Timedelta(seconds=12)
+
+        assert bars == [
+            pd.Timestamp('2018-01-01 00:00:00', tz='UTC'),
+            pd.Timestamp('2018-01-01 00:00:05', tz='UTC'),
+            pd.Timestamp('2018-01-01 00:00:15', tz='UTC'),
+            pd.Timestamp('2018-01-01 00:00:20', tz='UTC'),
+            pd.Timestamp('2018-01-01 00:00:25', tz='UTC'),
+        ]
+        assert clock.skipped_bars == 1
+
+    def test_sessions(self):
+        clock, time_source = self.make_clock(
+            '2018-01-01 23:58:30',
+            end=pd.Timestamp('2018-01-02 00:01:00', tz='UTC'),
+        )
+
+        events = list(clock)[1:]
+        assert events == [
+            (pd.Timestamp('2018-01-01 23:58', tz='UTC'), BAR),
+            (pd.Timestamp('2018-01-01 23:59', tz='UTC'), BAR),
+            (pd.Timestamp('2018-01-01 23:59', tz='UTC'), SESSION_END),
+            (pd.Timestamp('2018-01-02 00:00', tz='UTC'), SESSION_START),
+            (pd.Timestamp('2018-01-02 00:00', tz='UTC'), BAR),
+            (pd.Timestamp('2018-01-02 00:01', tz='UTC'), SESSION_END),
+        ]
+
+    def test_sub_minute_sessions(self):
+        clock, time_source = self.make_clock(
+            '2018-01-01 23:59:30',
+            bar_interval='15s',
+            end=pd.Timestamp('2018-01-02 00:00:30', tz='UTC'),
+        )
+
+        events = list(clock)[1:]
+        assert events == [
+            (pd.Timestamp('2018-01-01 23:59:30', tz='UTC'), BAR),
+            (pd.Timestamp('2018-01-01 23:59:45', tz='UTC'), BAR),
+            (pd.Timestamp('2018-01-01 23:59:45', tz='UTC'), SESSION_END),
+            (pd.Timestamp('2018-01-02 00:00', tz='UTC'), SESSION_START),
+            (pd.Timestamp('2018-01-02 00:00', tz='UTC'), BAR),
+            (pd.Timestamp('2018-01-02 00:00:15', tz='UTC'), BAR),
+            (pd.Timestamp('2018-01-02 00:00:30', tz='UTC'), SESSION_END),
+        ]
+        dts = [dt for dt, _ in events]
+        assert dts == sorted(dts)
+
+
+class TestLiveSimulation(WithTradingEnvironment, CatalystTestCase):
+    TRADING_CALENDAR_PRIMARY_CAL = 'OPEN'
+
+    def test_simulation_across_midnight(self):
+        sim_params = factory.create_simulation_parameters(
+            start=pd.Timestamp('2018-01-01', tz='UTC'),
+            end=pd.Timestamp('2018-01-05', tz='UTC'),
+            data_frequency='minute',
+            emission_rate='minute',
+            trading_calendar=self.trading_calendar,
+        )
+        algo = SessionRecordingAlgorithm(
+            sim_params=sim_params,
+            env=self.env,
+            trading_calendar=self.trading_calendar,
+        )
+        algo.perf_tracker = PerformanceTracker(
+            sim_params=sim_params,
+            trading_calendar=self.trading_calendar,
+            env=self.env,
+        )
+
+        clock = SimpleClock(
+            None,
+            bar_interval='15s',
+            end=pd.Timestamp('2018-01-02 00:00:30', tz='UTC'),
+            time_source=FakeTimeSource('2018-01-01 23:59:30'),
+        )
+        algo_simulator = AlgorithmSimulator(
+            algo,
+            sim_params,
+            FakeDataPortal(self.env, trading_calendar=self.trading_calendar),
+            clock,
+            None,
+            NoRestrictions(),
+            None
+        )
+
+        messages = list(algo_simulator.transform())[:-1]
+
+        # The first session is closed before the bars of the next one
+        first_session = pd.Timestamp('2018-01-01', tz='UTC')
+        second_session = pd.Timestamp('2018-01-02', tz='UTC')
+        self.assertEqual(
+            [message['daily_perf']['period_open'] for message in messages],
+            [first_session, second_session],
+        )
+        self.assertEqual(algo.sessions_at, [
+            (pd.Timestamp('2018-01-01 23:59:30', tz='UTC'), first_session),
+            (pd.Timestamp('2018-01-01 23:59:45', tz='UTC'), first_session),
+            (pd.Timestamp('2018-01-02 00:00', tz='UTC'), second_session),
+            (pd.Timestamp('2018-01-02 00:00:15', tz='UTC'), second_session),
+        ])
@@ -0,0 +1,57 @@
+import numpy as np
+import pandas as pd
+from pandas.util.testing import assert_frame_equal
+
+from catalyst.exchange.utils.stats_recorder import FrameStatsRecorder
+
+
+class TestFrameStatsRecorder:
+    def setup(self):
+        self.dts = pd.date_range(
+            '2018-01-01', periods=10, freq='T', tz='UTC'
+        )
+
+    def make_stats(self, i, dt):
+        stats = dict(
+            period_close=dt,
+            portfolio_value=1000.0 + i,
+            longs_count=i % 3,
+            sharpe=None if i < 3 else 0.1 * i,
+            period_label=dt.strftime('%Y-%m'),
+            positions=[{'sid': 'btc_usdt', 'amount': i}] * (i % 2),
+            transactions=[],
+            orders=[{'id': i}] if i % 4 == 0 else [],
+        )
+        if i >= 5:
+            stats['signal'] = i * 2
+        return stats
+
+    def test_frame_matches_records(self):
+        # A small capacity to grow the columns along the way
+        recorder = FrameStatsRecorder(capacity=3)
+        records = []
+        for i, dt in enumerate(self.dts):
+            stats = self.make_stats(i, dt)
+            records.append(stats)
+            recorder.record(stats)
+
+        assert len(recorder) == len(self.dts)
+
+        expected = pd.DataFrame(records)
+        result = recorder.to_frame()
+        assert_frame_equal(
+            result[sorted(expected.columns)],
+            expected[sorted(expected.columns)],
+            check_dtype=False,
+        )
+        assert result['longs_count'].dtype == np.int64
+        assert result['period_close'].dt.tz is not None
+
+    def test_type_change(self):
+        recorder = FrameStatsRecorder()
+        recorder.record(dict(value=1.5))
+        recorder.record(dict(value='high'))
+        recorder.record(dict())
+
+        result = recorder.to_frame()
+        assert list(result['value']) == [1.5, 'high', None]
@@ -0,0 +1,66 @@
+import os
+import shutil
+import tempfile
+
+import pandas as pd
+
+from catalyst.exchange.utils.stats_store import AlgoStatsStore
+
+
+class TestAlgoStatsStore:
+    def setup(self):
+        self.folder = tempfile.mkdtemp()
+        self.path = os.path.join(self.folder, 'pnl_stats_live')
+        self.dts = pd.date_range(
+            '2018-01-01', periods=10, freq='T', tz='UTC'
+        )
+
+    def teardown(self):
+        shutil.rmtree(self.folder)
+
+    def test_append_compact_and_reload(self):
+        store = AlgoStatsStore(self.path, compact_every=4)
+        for index, dt in enumerate(self.dts):
+            row = dict(performance=float(index))
+            if index > 5:
+                row['signal'] = 'buy'
+            store.append(dt, row)
+
+        # Two compacted segments and two rows in the journal
+        assert len(store._segments) == 2
+        assert len(store._journal) == 2
+
+        reloaded = AlgoStatsStore(self.path, compact_every=4)
+        assert len(reloaded) == 10
+
+        df = reloaded.read()
+        assert list(df.index) == list(self.dts)
+        assert list(df['performance']) == [float(i) for i in range(10)]
+        assert df['signal'].isnull().sum() == 6
+
+        df = reloaded.read(columns=['signal'], start_dt=self.dts[8])
+        assert list(df.columns) == ['signal']
+        assert list(df.index) == list(self.dts[8:])
+
+    def test_truncated_journal(self):
+        store = AlgoStatsStore(self.path)
+        store.append(self.dts[0], dict(performance=1.0))
+        store.append(self.dts[1], dict(performance=2.0))
+
+        # Simulating a crash in the middle of a write
+        with open(store.journal_filename, 'ab') as f:
+            f.write(b'\x80\x04\x95')
+
+        reloaded = AlgoStatsStore(self.path)
+        assert len(reloaded) == 2
+
+        reloaded.append(self.dts[2], dict(performance=3.0))
+        assert len(AlgoStatsStore(self.path)) == 3
+
+    def test_drop_before(self):
+        store = AlgoStatsStore(self.path, compact_every=5)
+        for dt in self.dts:
+            store.append(dt, dict(performance=0.0))
+
+        store.drop_before(self.dts[5])
+        assert list(store.read().index) == list(self.dts[5:])
@@ -0,0 +1,315 @@
+import os
+import threading
+
+import bcolz
+import numpy as np
+import pandas as pd
+import requests
+from nose_parameterized import parameterized
+from six.moves.BaseHTTPServer import BaseHTTPRequestHandler, HTTPServer
+
+from catalyst.marketplace.utils.bundle_utils import append_bundle, \
+    merge_bundles, merge_ctables, read_bundle, read_date_index, \
+    write_date_index
+from catalyst.marketplace.utils.multipart_utils import \
+    IncompleteMultipartError, iter_multipart_files
+from catalyst.testing.fixtures import CatalystTestCase, WithInstanceTmpDir
+
+BOUNDARY = b'catalyst-test-boundary'
+
+PARTS = [
+    ('a.tar.gz', os.urandom(100000) + b'\r\n--catalyst'),
+    ('b.tar.gz', b''),
+    ('c.tar.gz', b'\r\n\r\n' + os.urandom(5000)),
+]
+
+
+def make_multipart_body(parts):
+    body = b''
+    for name, content in parts:
+        body += b'--' + BOUNDARY + b'\r\n'
+        body += 'Content-Disposition: form-data; name="file"; ' \
+                'filename="{}"\r\n\r\n'.format(name).encode('utf-8')
+        body += content + b'\r\n'
+    return body + b'--' + BOUNDARY + b'--\r\n'
+
+
+class MultipartHandler(BaseHTTPRequestHandler):
+    body = make_multipart_body(PARTS)
+
+    def do_POST(self):
+        self.send_response(200)
+        self.send_header(
+            'Content-Type',
+            'multipart/form-data; boundary={}'.format(BOUNDARY.decode()),
+        )
+        self.send_header('Content-Length', str(len(self.body)))
+        self.end_headers()
+        self.wfile.write(self.body)
+
+    def log_message(self, *args):
+        pass
+
+
+class MultipartStreamTestCase(WithInstanceTmpDir, CatalystTestCase):
+    @classmethod
+    def init_class_fixtures(cls):
+        super(MultipartStreamTestCase, cls).init_class_fixtures()
+        # A local stand-in for the marketplace server
+        cls.server = HTTPServer(('127.0.0.1', 0), MultipartHandler)
+        thread = threading.Thread(target=cls.server.serve_forever)
+        thread.daemon = True
+        thread.start()
+        cls.add_class_callback(cls.server.server_close)
+        cls.add_class_callback(cls.server.shutdown)
+        cls.url = 'http://127.0.0.1:{}/'.format(cls.server.server_port)
+
+    @parameterized.expand([(1,), (7,), (1024,), (1024 * 1024,)])
+    def test_parts_written_to_disk(self, chunk_size):
+        r = requests.post(self.url, stream=True)
+        filenames = list(iter_multipart_files(
+            r.iter_content(chunk_size=chunk_size),
+            r.headers['content-type'],
+            self.instance_tmpdir.path,
+        ))
+
+        self.assertEqual(
+            [os.path.basename(filename) for filename in filenames],
+            [name for name, _ in PARTS],
+        )
+        for filename, (_, content) in zip(filenames, PARTS):
+            with open(filename, 'rb') as f:
+                self.assertEqual(f.read(), content)
+
+    def test_truncated_body(self):
+        body = make_multipart_body(PARTS)
+        with self.assertRaises(IncompleteMultipartError):
+            list(iter_multipart_files(
+                [body[:50000]],
+                'multipart/mixed; boundary="{}"'.format(BOUNDARY.decode()),
+                self.instance_tmpdir.path,
+            ))
+
+        # The truncated part is removed
+        self.assertEqual(os.listdir(self.instance_tmpdir.path), [])
+
+
+class MergeBundlesTestCase(WithInstanceTmpDir, CatalystTestCase):
+    def make_ctable(self, name, dates, symbols, values):
+        df = pd.DataFrame({
+            'date': dates,
+            'symbol': symbols,
+            'value': np.asarray(values, dtype='float64'),
+        })
+        return bcolz.ctable.fromdataframe(
+            df, rootdir=self.instance_tmpdir.getpath(name),
+        )
+
+    def test_merge_dedupes_out_of_memory(self):
+        rand = np.random.RandomState(0)
+        days = pd.date_range('2018-01-01', periods=30).strftime('%Y-%m-%d')
+        symbols = ['btc', 'eth', 'ltc', 'neo']
+
+        keys = [(day, symbol) for day in days for symbol in symbols]
+        # The existing bundle is sorted, it is read a few rows at a time
+        target_keys = sorted(
+            keys[i] for i in rand.permutation(len(keys))[:80]
+        )
+        source_keys = [keys[i] for i in rand.permutation(len(keys))[:60]]
+
+        ztarget = self.make_ctable(
+            'target',
+            [day for day, _ in target_keys],
+            [symbol for _, symbol in target_keys],
+            np.zeros(len(target_keys)),
+        )
+        zsource = self.make_ctable(
+            'source',
+            [day for day, _ in source_keys],
+            [symbol for _, symbol in source_keys],
+            np.ones(len(source_keys)),
+        )
+
+        # Blocks much smaller than the tables force many sorted runs
+        z = merge_bundles(zsource, ztarget, blen=7)
+        df = z.todataframe()
+
+        expected_keys = sorted(set(target_keys) | set(source_keys))
+        self.assertEqual(
+            list(zip(df['date'].dt.strftime('%Y-%m-%d'), df['symbol'])),
+            expected_keys,
+        )
+        self.assertEqual(df['date'].dtype, np.dtype('M8[ns]'))
+
+        # The rows of the new bundle replace the existing ones
+        source_keys = set(source_keys)
+        expected = [
+            1. if key in source_keys else 0. for key in expected_keys
+        ]
+        np.testing.assert_array_equal(df['value'].values, expected)
+
+    @parameterized.expand([('sorted', 1), ('unsorted', -1)])
+    def test_merge_single_date(self, name, step):
+        # Rows sharing a date span several reads of the runs
+        symbols = ['s{:03d}'.format(i) for i in range(50)]
+        zsource = self.make_ctable(
+            'source', ['2018-01-01'] * 50, symbols[::step], np.arange(50),
+        )
+
+        z = merge_ctables(
+            [zsource], self.instance_tmpdir.getpath('merged'), blen=4,
+        )
+        self.assertEqual(list(z.cols['symbol'][:].astype('U')), symbols)
+
+    def make_target(self, dates, symbols, values):
+        zsource = self.make_ctable('part', dates, symbols, values)
+        merge_ctables([zsource], self.instance_tmpdir.getpath('target'))
+        return bcolz.ctable(
+            rootdir=self.instance_tmpdir.getpath('target'), mode='a',
+        )
+
+    def test_append_after_target(self):
+        ztarget = self.make_target(
+            ['2018-01-01', '2018-01-01', '2018-01-02'],
+            ['btc', 'eth', 'btc'],
+            [0, 1, 2],
+        )
+        zsource = self.make_ctable(
+            'source',
+            ['2018-01-02', '2018-01-03', '2018-01-03'],
+            ['eth', 'btc', 'eth'],
+            [3, 4, 5],
+        )
+
+        self.assertTrue(append_bundle(zsource, ztarget, blen=2))
+
+        df = read_bundle(ztarget)
+        self.assertEqual(
+            list(df['date'].dt.strftime('%Y-%m-%d')),
+            ['2018-01-01', '2018-01-01', '2018-01-02', '2018-01-02',
+             '2018-01-03', '2018-01-03'],
+        )
+        np.testing.assert_array_equal(df['value'].values, np.arange(6.))
+        self.assertIsNotNone(read_date_index(ztarget))
+
+    @parameterized.expand([
+        ('overlapping', ['2018-01-02', '2018-01-03'], ['btc', 'eth']),
+        ('unsorted', ['2018-01-04', '2018-01-03'], ['btc', 'eth']),
+        ('wider_symbols', ['2018-01-03', '2018-01-03'], ['btc', 'doge']),
+    ])
+    def test_append_rejected(self, name, dates, symbols):
+        ztarget = self.make_target(
+            ['2018-01-01', '2018-01-02'], ['btc', 'btc'], [0, 1],
+        )
+        zsource = self.make_ctable('source', dates, symbols, [2, 3])
+
+        self.assertFalse(append_bundle(zsource, ztarget))
+        self.assertEqual(len(ztarget), 2)
+
+    def test_merge_several_bundles(self):
+        ztarget = self.make_target(
+            ['2018-01-01', '2018-01-02'], ['btc', 'btc'], [0, 0],
+        )
+        znewer = self.make_ctable(
+            'newer', ['2018-01-02', '2018-01-03'], ['btc', 'btc'], [2, 2],
+        )
+        zolder = self.make_ctable(
+            'older', ['2018-01-03', '2018-01-01'], ['btc', 'btc'], [1, 1],
+        )
+
+        z = merge_bundles([znewer, zolder], ztarget)
+        np.testing.assert_array_equal(
+            z.cols['value'][:], [1., 2., 2.],
+        )
+
+
+class ReadBundleTestCase(WithInstanceTmpDir, CatalystTestCase):
+    def make_bundle(self):
+        rand = np.random.RandomState(0)
+        dates = pd.date_range('2017-01-01', periods=20000, freq='H')
+        df = pd.DataFrame({
+            'date': dates.strftime('%Y-%m-%d %H:%M:%S').repeat(2),
+            'symbol': np.tile(['btc', 'eth'], len(dates)),
+            'close': rand.uniform(size=2 * len(dates)),
+            'volume': rand.uniform(size=2 * len(dates)),
+        })
+        zsource = bcolz.ctable.fromdataframe(
+            df.iloc[rand.permutation(len(df))],
+            rootdir=self.instance_tmpdir.getpath('source'),
+        )
+        z = merge_ctables([zsource], self.instance_tmpdir.getpath('bundle'))
+
+        df['date'] = pd.to_datetime(df['date'])
+        return z, df
+
+    @parameterized.expand([
+        ('all', None, None),
+        ('start', '2017-06-01', None),
+        ('end', None, pd.Timestamp('2017-02-01 13:00', tz='UTC')),
+        ('range', '2017-03-01 05:00', '2017-03-03'),
+        ('before', None, '2016-01-01'),
+        ('after', '2020-01-01', None),
+    ])
+    def test_date_range(self, name, start, end):
+        z, df = self.make_bundle()
+        index = read_date_index(z)
+        self.assertIsNotNone(index)
+        self.assertGreater(len(index.min_dates), 1)
+
+        mask = np.ones(len(df), dtype=bool)
+        if start is not None:
+            mask &= df['date'] >= pd.Timestamp(start).tz_localize(None)
+        if end is not None:
+            mask &= df['date'] < pd.Timestamp(end).tz_localize(None)
+        expected = df[mask].reset_index(drop=True)
+
+        result = read_bundle(z, start, end)
+        pd.util.testing.assert_frame_equal(
+            result, expected[list(z.names)], check_dtype=False,
+        )
+
+    def test_columns(self):
+        z, df = self.make_bundle()
+        result = read_bundle(z, '2017-03-01', '2017-03-02', ['volume'])
+        self.assertEqual(list(result.columns), ['date', 'symbol', 'volume'])
+        self.assertEqual(len(result), 48)
+
+        with self.assertRaises(ValueError):
+            read_bundle(z, columns=['open'])
+
+    def test_stale_index(self):
+        z, df = self.make_bundle()
+        z = bcolz.ctable(rootdir=z.rootdir, mode='a')
+        z.append(z[:1])
+        self.assertIsNone(read_date_index(z))
+        self.assertEqual(len(read_bundle(z)), len(df) + 1)
+
+    @parameterized.expand([
+        ('strings', '2017-03-01 05:00', '2017-03-03'),
+        ('timestamps', pd.Timestamp('2017-03-01 05:00', tz='UTC'),
+         pd.Timestamp('2017-03-03', tz='UTC')),
+    ])
+    def test_string_dates(self, name, start, end):
+        z, df = self.make_bundle()
+        expected = df[
+            (df['date'] >= pd.Timestamp('2017-03-01 05:00')) &
+            (df['date'] < pd.Timestamp('2017-03-03'))
+        ].reset_index(drop=True)[list(z.names)]
+
+        # The dates of the bundles of previous versions are strings
+        legacy = df.copy()
+        legacy['date'] = legacy['date'].dt.strftime('%Y-%m-%d %H:%M:%S')
+        z = bcolz.ctable.fromdataframe(
+            legacy[list(z.names)],
+            rootdir=self.instance_tmpdir.getpath('legacy'),
+        )
+        self.assertIsNone(read_date_index(z))
+        pd.util.testing.assert_frame_equal(
+            read_bundle(z, start, end), expected, check_dtype=False,
+        )
+
+        write_date_index(z)
+        self.assertIsNotNone(read_date_index(z))
+        pd.util.testing.assert_frame_equal(
+            read_bundle(z, start, end), expected, check_dtype=False,
+        )
@@ -0,0 +1,176 @@
+"""
+Tests for the block compute of the crypto technical factors.
+"""
+from __future__ import division
+
+from nose_parameterized import parameterized
+import numpy as np
+import pandas as pd
+
+from catalyst.lib.adjusted_array import AdjustedArray
+from catalyst.pipeline import CustomFactor
+from catalyst.pipeline.data import CryptoPricing
+from catalyst.pipeline.engine import SimplePipelineEngine
+from catalyst.pipeline.factors.crypto import (
+    AnnualizedVolatility,
+    Aroon,
+    AverageDollarVolume,
+    BollingerBands,
+    EWMA,
+    EWMSTD,
+    FastStochasticOscillator,
+    IchimokuKinkoHyo,
+    LinearWeightedMovingAverage,
+    RateOfChangePercentage,
+    Returns,
+    RSI,
+    SimpleMovingAverage,
+    TrueRange,
+    VWAP,
+)
+from catalyst.testing.fixtures import CatalystTestCase
+
+
+def compute_per_row(factor, arrays, dates, assets, mask):
+    """
+    Compute ``factor`` date by date, as the engine does when its inputs
+    carry adjustments.
+    """
+    windows = [
+        AdjustedArray(array, None, {}, np.nan).traverse(factor.window_length)
+        for array in arrays
+    ]
+    return factor._compute(windows, dates, assets, mask)
+
+
+def compute_block(factor, arrays, dates, assets, mask):
+    # The engine passes read-only views of the workspace arrays
+    views = []
+    for array in arrays:
+        view = array.view()
+        view.setflags(write=False)
+        views.append(view)
+    return factor._compute(views, dates, assets, mask)
+
+
+class BlockComputeTestCase(CatalystTestCase):
+    ndates = 40
+    nassets = 6
+
+    def make_inputs(self, factor, seed=0):
+        rand = np.random.RandomState(seed)
+        nrows = self.ndates + factor.window_length - 1
+
+        lows = rand.uniform(90, 100, (nrows, self.nassets))
+        highs = lows + rand.uniform(0, 10, (nrows, self.nassets))
+        closes = rand.uniform(lows, highs)
+        volumes = rand.uniform(0, 1000, (nrows, self.nassets))
+
+        # Missing values and an asset without any trades
+        closes[rand.uniform(size=closes.shape) < .1] = np.nan
+        closes[:, -1] = np.nan
+        volumes[:, -1] = np.nan
+
+        # A pair with a few missing bars, and one not listed yet
+        lows[rand.uniform(size=nrows) < .1, 1] = np.nan
+        highs[rand.uniform(size=nrows) < .1, 1] = np.nan
+        lows[:, -2] = np.nan
+        highs[:, -2] = np.nan
+
+        by_column = {
+            CryptoPricing.low: lows,
+            CryptoPricing.high: highs,
+            CryptoPricing.close: closes,
+            CryptoPricing.volume: volumes,
+        }
+        arrays = [
+            by_column.get(input_, rand.normal(0, .01, closes.shape))
+            for input_ in factor.inputs
+        ]
+
+        dates = pd.date_range('2017-01-01', periods=self.ndates, tz='UTC')
+        assets = np.arange(self.nassets, dtype=np.int64)
+        mask = rand.uniform(size=(self.ndates, self.nassets)) < .9
+        mask[:, -2] = False
+        return arrays, dates, assets, mask
+
+    def assert_same_outputs(self, result, expected):
+        if expected.dtype.names is None:
+            np.testing.assert_allclose(result, expected, rtol=1e-9)
+        else:
+            for name in expected.dtype.names:
+                np.testing.assert_allclose(
+                    result[name], expected[name], rtol=1e-9, err_msg=name,
+                )
+
+    @parameterized.expand([
+        ('returns', Returns(window_length=5)),
+        ('rsi', RSI()),
+        ('sma', SimpleMovingAverage(inputs=[CryptoPricing.close],
+                                    window_length=10)),
+        ('vwap', VWAP(window_length=10)),
+        ('adv', AverageDollarVolume(window_length=10)),
+        ('ewma', EWMA.from_span(inputs=[CryptoPricing.close],
+                                window_length=20, span=10)),
+        ('ewmstd', EWMSTD.from_span(inputs=[CryptoPricing.low],
+                                    window_length=20, span=10)),
+        ('lwma', LinearWeightedMovingAverage(inputs=[CryptoPricing.close],
+                                             window_length=10)),
+        ('bbands', BollingerBands(window_length=10, k=2)),
+        ('aroon', Aroon(window_length=10)),
+        ('fso', FastStochasticOscillator()),
+        ('ichimoku', IchimokuKinkoHyo(window_length=20,
+                                      tenkan_sen_length=5,
+                                      kijun_sen_length=10,
+                                      chikou_span_length=4)),
+        ('roc', RateOfChangePercentage(inputs=[CryptoPricing.close],
+                                       window_length=5)),
+        ('true_range', TrueRange()),
+        ('volatility', AnnualizedVolatility(window_length=20)),
+    ])
+    def test_block_matches_per_row(self, name, factor):
+        self.assertTrue(factor._block_computable)
+
+        arrays, dates, assets, mask = self.make_inputs(factor)
+        expected = compute_per_row(factor, arrays, dates, assets, mask)
+        result = compute_block(factor, arrays, dates, assets, mask)
+
+        self.assertEqual(result.shape, expected.shape)
+        self.assert_same_outputs(result, expected)
+
+    def test_subclass_overriding_compute(self):
+
+        class Doubled(SimpleMovingAverage):
+            def compute(self, today, assets, out, data):
+                out[:] = 2 * np.nanmean(data, axis=0)
+
+        factor = Doubled(inputs=[CryptoPricing.close], window_length=5)
+        self.assertFalse(factor._block_computable)
+
+        class NoBlock(CustomFactor):
+            inputs = [CryptoPricing.close]
+            window_length = 5
+
+            def compute(self, today, assets, out, data):
+                out[:] = data[-1]
+
+        self.assertFalse(NoBlock()._block_computable)
+
+    def test_engine_passes_read_only_inputs(self):
+        factor = SimpleMovingAverage(
+            inputs=[CryptoPricing.close], window_length=5,
+        )
+        closes = np.ones((10, self.nassets))
+
+        class FakeGraph(object):
+            offset = {(factor, CryptoPricing.close): 1}
+
+        inputs = SimplePipelineEngine._inputs_for_term(
+            factor, {CryptoPricing.close: closes}, FakeGraph(),
+        )
+        self.assertEqual(len(inputs), 1)
+        self.assertEqual(inputs[0].shape, (9, self.nassets))
+        self.assertFalse(inputs[0].flags.writeable)
+        self.assertTrue(closes.flags.writeable)
+        with self.assertRaises(ValueError):
+            inputs[0][0, 0] = 2.0
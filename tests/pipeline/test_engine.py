@@ -235,6 +235,89 @@ class ConstantInputTestCase(WithConstantInputs, CatalystTestCase):
         with self.assertRaises(NoFurtherDataError):
             engine.run_pipeline(p, self.dates[8], self.dates[8])
 
+    def test_compute_terms_in_threads(self):
+        loader = self.loader
+        serial_engine = SimplePipelineEngine(
+            lambda column: loader, self.dates, self.asset_finder,
+        )
+        threaded_engine = SimplePipelineEngine(
+            lambda column: loader, self.dates, self.asset_finder,
+            max_workers=4,
+        )
+
+        pipe = Pipeline(
+            columns={
+                'sumdiff': RollingSumDifference(),
+                'multiple': MultipleOutputs().close,
+                'sum': OpenCloseSumAndDiff(window_length=5).sum_,
+                'ranked': RollingSumDifference().rank() + 1,
+            },
+        )
+        expected = serial_engine.run_pipeline(
+            pipe, self.dates[5], self.dates[-1],
+        )
+        result = threaded_engine.run_pipeline(
+            pipe, self.dates[5], self.dates[-1],
+        )
+        assert_frame_equal(result, expected)
+        self.assertEqual(threaded_engine.load_count, serial_engine.load_count)
+
+    def test_run_pipelines(self):
+        loader = RecordingPrecomputedLoader(
+            constants=self.constants,
+            dates=self.dates,
+            sids=self.asset_ids,
+        )
+        engine = SimplePipelineEngine(
+            lambda column: loader, self.dates, self.asset_finder,
+        )
+
+        sumdiff = RollingSumDifference()
+        pipelines = {
+            'universe': Pipeline(
+                columns={'close': USEquityPricing.close.latest},
+                screen=sumdiff < 0,
+            ),
+            'signal': Pipeline(
+                columns={
+                    'sumdiff': sumdiff,
+                    'sum': OpenCloseSumAndDiff(window_length=5).sum_,
+                },
+            ),
+        }
+        results = engine.run_pipelines(
+            pipelines, self.dates[5], self.dates[-1],
+        )
+        # The pricing columns of both pipelines are loaded together.
+        self.assertEqual(engine.load_count, 1)
+        self.assertEqual(len(loader.load_calls), 1)
+
+        for name, pipeline in iteritems(pipelines):
+            assert_frame_equal(
+                results[name],
+                engine.run_pipeline(pipeline, self.dates[5], self.dates[-1]),
+            )
+
+    def test_compute_terms_in_threads_raises(self):
+        loader = self.loader
+        engine = SimplePipelineEngine(
+            lambda column: loader, self.dates, self.asset_finder,
+            max_workers=2,
+        )
+
+        class BadFactor(CustomFactor):
+            inputs = [USEquityPricing.close]
+            window_length = 2
+
+            def compute(self, today, assets, out, closes):
+                raise ZeroDivisionError()
+
+        p = Pipeline(
+            columns={'bad': BadFactor(), 'ok': RollingSumDifference()},
+        )
+        with self.assertRaises(ZeroDivisionError):
+            engine.run_pipeline(p, self.dates[5], self.dates[-1])
+
     def _test_input_dates_provided_by_default(self):
         loader = self.loader
         engine = SimplePipelineEngine(
@@ -718,7 +801,7 @@ class ConstantInputTestCase(WithConstantInputs, CatalystTestCase):
                 )
                 assert_frame_equal(output_results, output_expected)
 
-    def _test_loader_given_multiple_columns(self):
+    def test_loader_given_multiple_columns(self):
 
         class Loader1DataSet1(DataSet):
             col1 = Column(float)
@@ -806,14 +889,17 @@ class ConstantInputTestCase(WithConstantInputs, CatalystTestCase):
 
         assert_frame_equal(result, expected)
 
-        self.assertEqual(set(loader1.load_calls),
-                         {ColumnArgs.sorted_by_ds(Loader1DataSet1.col1,
-                                                  Loader1DataSet2.col1),
-                          ColumnArgs.sorted_by_ds(Loader1DataSet1.col2,
-                                                  Loader1DataSet2.col2)})
-        self.assertEqual(set(loader2.load_calls),
-                         {ColumnArgs.sorted_by_ds(Loader2DataSet.col1,
-                                                  Loader2DataSet.col2)})
+        # The groups of a loader with different extra rows are loaded in a
+        # single call.
+        self.assertEqual(loader1.load_calls,
+                         [ColumnArgs.sorted_by_ds(Loader1DataSet1.col1,
+                                                  Loader1DataSet2.col1,
+                                                  Loader1DataSet1.col2,
+                                                  Loader1DataSet2.col2)])
+        self.assertEqual(loader2.load_calls,
+                         [ColumnArgs.sorted_by_ds(Loader2DataSet.col1,
+                                                  Loader2DataSet.col2)])
+        self.assertEqual(engine.load_count, 2)
 
 
 class FrameInputTestCase(WithTradingEnvironment, CatalystTestCase):
@@ -919,6 +1005,68 @@ class FrameInputTestCase(WithTradingEnvironment, CatalystTestCase):
                 high_results = results.unstack()['high']
                 assert_frame_equal(high_results, high_base.iloc[iloc_bounds])
 
+    def test_adjusted_group_loaded_on_its_own(self):
+        dates, asset_ids = self.dates, self.asset_ids
+        low, high = USEquityPricing.low, USEquityPricing.high
+
+        adjustments = DataFrame.from_records([
+            dict(
+                kind=MULTIPLY,
+                sid=asset_ids[1],
+                value=2.0,
+                start_date=None,
+                end_date=dates[9],
+                apply_date=dates[10],
+            ),
+        ])
+        high_base = DataFrame(self.make_frame(30.0))
+        high_base.iloc[:10, 1] /= 2.0
+
+        # The low and high columns share a loader, only high is adjusted
+        loader = RecordingPrecomputedLoader(
+            constants={low: 30.0, high: 30.0},
+            dates=dates,
+            sids=asset_ids,
+        )
+        loader._loaders[high] = DataFrameLoader(high, high_base, adjustments)
+        engine = SimplePipelineEngine(
+            lambda column: loader, dates, self.asset_finder,
+        )
+        expected_engine = SimplePipelineEngine(
+            {
+                low: DataFrameLoader(low, self.make_frame(30.0)),
+                high: DataFrameLoader(high, high_base, adjustments),
+            }.__getitem__,
+            dates,
+            self.asset_finder,
+        )
+
+        pipeline = Pipeline(columns={
+            'low': SimpleMovingAverage(inputs=[low], window_length=5),
+            'high': SimpleMovingAverage(inputs=[high], window_length=2),
+        })
+        expected = expected_engine.run_pipeline(pipeline, dates[5], dates[-1])
+
+        # The adjusted group, first loaded with the wider one, is loaded
+        # again on its own.
+        result = engine.run_pipeline(pipeline, dates[5], dates[-1])
+        assert_frame_equal(result, expected)
+        self.assertEqual(
+            loader.load_calls,
+            [ColumnArgs(low, high), ColumnArgs(high)],
+        )
+        self.assertEqual(engine.load_count, 2)
+
+        # Then it is no longer loaded with the wider group.
+        del loader.load_calls[:]
+        result = engine.run_pipeline(pipeline, dates[5], dates[-1])
+        assert_frame_equal(result, expected)
+        self.assertEqual(
+            set(loader.load_calls),
+            {ColumnArgs(low), ColumnArgs(high)},
+        )
+        self.assertEqual(engine.load_count, 2)
+
 
 class SyntheticBcolzTestCase(WithAdjustmentReader,
                              CatalystTestCase):
@@ -1532,3 +1680,39 @@ class ChunkedPipelineTestCase(WithEquityPricingPipelineEngine,
             chunksize=22
         )
         self.assertTrue(chunked_result.equals(pipeline_result))
+
+    def test_run_chunked_pipeline_in_processes(self):
+        """
+        Test that computing the chunks in processes produces the same result
+        as computing them one after the other
+        """
+        pipe = Pipeline(
+            columns={
+                'close': USEquityPricing.close.latest,
+                'returns': Returns(window_length=2),
+                'categorical': USEquityPricing.close.latest.quantiles(5)
+            },
+        )
+        chunked_result = self.pipeline_engine.run_chunked_pipeline(
+            pipeline=pipe,
+            start_date=self.PIPELINE_START_DATE,
+            end_date=self.END_DATE,
+            chunksize=22
+        )
+        load_count = self.pipeline_engine.load_count
+
+        engine = SimplePipelineEngine(
+            get_loader=self.pipeline_engine.get_loader,
+            calendar=self.nyse_sessions,
+            asset_finder=self.asset_finder,
+            max_workers=2,
+            chunk_processes=3,
+        )
+        result = engine.run_chunked_pipeline(
+            pipeline=pipe,
+            start_date=self.PIPELINE_START_DATE,
+            end_date=self.END_DATE,
+            chunksize=22
+        )
+        self.assertTrue(result.equals(chunked_result))
+        self.assertEqual(engine.load_count, load_count)
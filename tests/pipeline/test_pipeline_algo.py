@@ -21,6 +21,7 @@ from pandas import (
     Series,
     Timestamp,
 )
+from pandas.util.testing import assert_series_equal
 
 from catalyst.algorithm import TradingAlgorithm
 from catalyst.api import (
@@ -323,6 +324,40 @@ class ClosesOnly(WithDataPortal, CatalystTestCase):
         # Run for a week in the middle of our data.
         algo.run(self.data_portal)
 
+    def test_multiple_pipelines(self):
+        """
+        Assert that several pipelines can be attached, and that each one
+        gets its own results.
+        """
+        def initialize(context):
+            universe = attach_pipeline(Pipeline(), 'universe')
+            universe.add(USEquityPricing.close.latest, 'close')
+            signal = attach_pipeline(Pipeline(), 'signal', chunks=3)
+            signal.add(USEquityPricing.close.latest, 'close')
+            signal.add(USEquityPricing.close.latest * 2, 'double')
+
+        def handle_data(context, data):
+            universe = pipeline_output('universe')
+            signal = pipeline_output('signal')
+            self.assertEqual(list(universe.columns), ['close'])
+            self.assertEqual(sorted(signal.columns), ['close', 'double'])
+            assert_series_equal(universe.close, signal.close)
+            assert_series_equal(
+                signal.double, signal.close * 2, check_names=False,
+            )
+
+        algo = TradingAlgorithm(
+            initialize=initialize,
+            handle_data=handle_data,
+            data_frequency='daily',
+            trading_calendar=self.trading_calendar,
+            get_pipeline_loader=lambda column: self.pipeline_loader,
+            start=self.first_asset_start,
+            end=self.last_asset_end,
+            env=self.env,
+        )
+        algo.run(self.data_portal)
+
 
 class MockDailyBarSpotReader(object):
     """
@@ -144,3 +144,39 @@ class TestRisk(WithTradingEnvironment, CatalystTestCase):
     def test_representation(self):
         assert all([metric in self.cumulative_metrics.__repr__() for metric in
                    self.cumulative_metrics.METRIC_NAMES])
+
+    def test_streaming_matches_exact(self):
+        random_returns = np.random.RandomState(0).normal(
+            0.001, 0.02, size=(len(self.algo_returns), 2)
+        )
+        random_returns[10, 1] = np.nan
+
+        for create_first_day_stats in (False, True):
+            exact, streaming = [
+                risk.RiskMetricsCumulative(
+                    self.sim_params,
+                    treasury_curves=self.env.treasury_curves,
+                    trading_calendar=self.trading_calendar,
+                    create_first_day_stats=create_first_day_stats,
+                    streaming=mode,
+                ) for mode in (False, True)
+            ]
+            for i, dt in enumerate(self.algo_returns.index):
+                algo, benchmark = random_returns[i]
+                # Updating the same session many times like the
+                # minute emission does.
+                for scale in (0.5, 1.0):
+                    for metrics in (exact, streaming):
+                        metrics.update(dt, algo * scale, benchmark, 0.0)
+
+                for name in risk.RiskMetricsCumulative.METRIC_NAMES + (
+                        'algorithm_cumulative_returns',
+                        'benchmark_cumulative_returns',
+                        'max_drawdowns'):
+                    np.testing.assert_allclose(
+                        getattr(streaming, name)[:i + 1],
+                        getattr(exact, name)[:i + 1],
+                        rtol=1e-7,
+                        atol=1e-10,
+                        err_msg=name,
+                    )
@@ -3906,6 +3906,20 @@ class TestTradingAlgorithm(WithTradingEnvironment, CatalystTestCase):
 
         self.assertIs(results, self.perf_ref)
 
+    def test_streaming_risk(self):
+        for streaming_risk in (False, True):
+            algo = TradingAlgorithm(
+                streaming_risk=streaming_risk,
+                env=self.env,
+            )
+            algo.run(FakeDataPortal(self.env))
+
+            self.assertEqual(
+                algo.perf_tracker.cumulative_risk_metrics.streaming,
+                streaming_risk,
+            )
+            self.assertNotIn('streaming_risk', algo.initialize_kwargs)
+
 
 class TestOrderCancelation(WithDataPortal,
                            WithSimParams,
@@ -2168,3 +2168,72 @@ class TestPositionTracker(WithTradingEnvironment,
         # Test gross and net exposures.
         self.assertEqual(100, pos_stats.gross_exposure)
         self.assertEqual(100, pos_stats.net_exposure)
+
+    def test_position_arrays(self):
+        pt = perf.PositionTracker(None)
+        dt = pd.Timestamp('2017/01/04 3:00PM')
+
+        assets = [self.EQUITY1, self.EQUITY2, self.FUTURE3, self.FUTURE5]
+        for i, asset in enumerate(assets):
+            pt.update_position(
+                asset, amount=np.float64(10.0 * (i + 1)),
+                last_sale_date=dt, last_sale_price=10 + i, cost_basis=5,
+            )
+
+        # Closing a position moves the last row in its place
+        pt.execute_transaction(create_txn(self.EQUITY2, dt, 11, -20))
+        self.assertNotIn(self.EQUITY2, pt.positions)
+
+        positions = pt.positions
+        self.assertEqual(
+            [position.asset for position in positions.row_positions],
+            [self.EQUITY1, self.FUTURE5, self.FUTURE3],
+        )
+        np.testing.assert_array_equal(
+            positions.column('sid'), [1, 1032201401, 3],
+        )
+        np.testing.assert_array_equal(
+            positions.column('amount'), [10, 40, 30],
+        )
+        np.testing.assert_array_equal(
+            positions.column('multiplier'), [1, 50, 1000],
+        )
+
+        # The positions read and write their row
+        pt.positions[self.FUTURE3].last_sale_price = 20
+        self.assertEqual(positions.column('last_sale_price')[2], 20)
+
+        restored = copy.deepcopy(pt)
+        self.assertEqual(
+            restored.positions[self.FUTURE5].amount, 40,
+        )
+        restored.positions[self.FUTURE5].amount = 0
+        self.assertEqual(pt.positions[self.FUTURE5].amount, 40)
+        self.assertEqual(restored.stats().longs_count, 2)
+
+    def test_sync_last_sale_prices(self):
+        pt = perf.PositionTracker('minute')
+        dt = pd.Timestamp('2017/01/04 3:00PM', tz='UTC')
+
+        assets = [self.EQUITY1, self.EQUITY2, self.FUTURE3]
+        for asset in assets:
+            pt.update_position(
+                asset, amount=np.float64(10.0), last_sale_price=10,
+            )
+
+        class FakeDataPortal(object):
+            calls = 0
+
+            def get_spot_values(self, assets, fields, dt, data_frequency):
+                self.calls += 1
+                prices = {1: 11.0, 2: np.nan, 3: 13.0}
+                return np.array([[prices[asset.sid]] for asset in assets])
+
+        data_portal = FakeDataPortal()
+        pt.sync_last_sale_prices(dt, False, data_portal)
+
+        self.assertEqual(data_portal.calls, 1)
+        self.assertEqual(
+            [pt.positions[asset].last_sale_price for asset in assets],
+            [11.0, 10.0, 13.0],
+        )
@@ -0,0 +1,27 @@
+from time import time
+from unittest import TestCase
+
+from catalyst.utils.rate_limit import TokenBucket, get_token_bucket
+
+
+class TokenBucketTestCase(TestCase):
+
+    def test_burst_then_wait(self):
+        bucket = TokenBucket(rate=20, capacity=3)
+
+        for _ in range(3):
+            self.assertTrue(bucket.try_acquire())
+        self.assertFalse(bucket.try_acquire())
+
+        start = time()
+        bucket.acquire()
+        self.assertGreaterEqual(time() - start, 0.03)
+
+    def test_invalid_rate(self):
+        with self.assertRaises(ValueError):
+            TokenBucket(rate=0)
+
+    def test_shared_bucket(self):
+        bucket = get_token_bucket('test_shared_bucket', rate=1)
+        self.assertIs(get_token_bucket('test_shared_bucket', rate=5), bucket)
+        self.assertEqual(bucket.rate, 1)